@@ -1,5 +1,8 @@
+import argparse
 from deity_game import Deity
 from deity_board import Board
+from deity_setting import SIMULATION_MAX_TURN
+from deity_simulate import AGENTS, simulate, print_report
 
 
 def main_game():
@@ -29,6 +32,7 @@ def preset_game():
 
     d.board = b
     d.choose_character()
+    d.phase = 'spawn'  # Bases and roads are already on the board
     d.print()
     d.spawn_character(d.player1)
     d.spawn_character(d.player2)
@@ -47,32 +51,61 @@ def ragnarok():
 
     d.board = b
     d.choose_character()
-    b.board[3][3].character = d.player1.character[1]
-    b.board[4][3].character = d.player2.character[4]
-    b.board[1][3].character = d.player1.character[2]
-    b.board[1][1].character = d.player2.character[5]
-    b.board[5][5].character = d.player1.character[3]
-    b.board[2][2].character = d.player2.character[6]
+    b.place_character(d.player1.character[1], (3, 3))
+    b.place_character(d.player2.character[4], (3, 4))
+    b.place_character(d.player1.character[2], (3, 1))
+    b.place_character(d.player2.character[5], (1, 1))
+    b.place_character(d.player1.character[3], (5, 5))
+    b.place_character(d.player2.character[6], (2, 2))
     d.print()
     d.play(True)
 
 
+def positive_int(value: str) -> int:
+    """
+    Argument type of counts that must be at least 1
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {value}')
+    return number
+
+
+def simulation(args: argparse.Namespace):
+    result = simulate(args.simulate, args.workers, args.agent1, args.agent2,
+                      args.max_turn, args.seed)
+    print_report(result, args.agent1, args.agent2)
 
 
 if __name__ == '__main__':
-    scenario = {1: main_game, 2: preset_game, 3: ragnarok}
-    print('Available game scenarios:')
-    for id_, game_mode in scenario.items():
-        print(f'{id_} - {game_mode.__name__}')
+    parser = argparse.ArgumentParser(description='Play Deity')
+    parser.add_argument('--simulate', type=positive_int, metavar='N',
+                        help='play N games between agents instead')
+    parser.add_argument('--workers', type=positive_int, default=1,
+                        metavar='K',
+                        help='number of processes playing the games')
+    parser.add_argument('--agent1', choices=AGENTS, default='random')
+    parser.add_argument('--agent2', choices=AGENTS, default='random')
+    parser.add_argument('--max-turn', type=int, default=SIMULATION_MAX_TURN,
+                        help='turns after which a game counts as a draw')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    if args.simulate is not None:
+        simulation(args)
+    else:
+        scenario = {1: main_game, 2: preset_game, 3: ragnarok}
+        print('Available game scenarios:')
+        for id_, game_mode in scenario.items():
+            print(f'{id_} - {game_mode.__name__}')
 
-    while True:
-        scenario_id = input('Chose game scenarios (type id): ')
-        try:
-            print('')
-            game = scenario[int(scenario_id)]
-            break
-        except (KeyError, ValueError):
-            print('Not valid scenario, try again')
-            continue
+        while True:
+            scenario_id = input('Chose game scenarios (type id): ')
+            try:
+                print('')
+                game = scenario[int(scenario_id)]
+                break
+            except (KeyError, ValueError):
+                print('Not valid scenario, try again')
+                continue
 
-    game()
+        game()
@@ -0,0 +1,70 @@
+from typing import NamedTuple, Tuple, Union
+
+# Actions a player can take, applied to a game by deity_engine.apply.
+# Characters are referred to by id so actions are plain data that can be
+# compared, hashed and sent between processes.
+
+
+class ChooseCharacter(NamedTuple):
+    """Add the deity class called name to the current player's team"""
+    name: str
+
+
+class PlaceBase(NamedTuple):
+    """Place the current player's 2x2 base with coord as its corner tile"""
+    coord: Tuple[int, int]
+
+
+class PlaceRoad(NamedTuple):
+    """Place the current player's big road from one or two base-adjacent
+    tiles"""
+    coord1: Tuple[int, int]
+    coord2: Union[Tuple[int, int], None] = None
+
+
+class Spawn(NamedTuple):
+    """Spawn deity char_id on a base tile"""
+    char_id: int
+    coord: Tuple[int, int]
+
+
+class Step(NamedTuple):
+    """Move deity char_id one tile (the first step starts its move)"""
+    char_id: int
+    coord: Tuple[int, int]
+
+
+class StopMove(NamedTuple):
+    """Stop moving deity char_id before its movement runs out"""
+    char_id: int
+
+
+class Attack(NamedTuple):
+    """Attack deity target_id with deity char_id"""
+    char_id: int
+    target_id: int
+
+
+class Faith(NamedTuple):
+    """
+    Use faith ability number ability of deity char_id. Only the parameters
+    the ability needs are set: target (deity id), coord (tile) and
+    direction ('up', 'down', 'left' or 'right')
+    """
+    char_id: int
+    ability: int = 1
+    target: Union[int, None] = None
+    coord: Union[Tuple[int, int], None] = None
+    direction: Union[str, None] = None
+
+
+class PlaceTile(NamedTuple):
+    """Place drawn tile number index as terrain (the tile or 'empty') on
+    coord"""
+    index: int
+    terrain: str
+    coord: Tuple[int, int]
+
+
+class Skip(NamedTuple):
+    """Give up the remaining actions this turn"""
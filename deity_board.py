@@ -1,21 +1,122 @@
-from typing import Tuple, List, Union
+from __future__ import annotations
+from typing import Dict, Tuple, List, NamedTuple, Union
+from heapq import heappush, heappop
 from deity_character import Character
 from deity_error import *
+from deity_zobrist import zobrist_key, board_hash, board_tile_hash
+
+try:
+    import numpy
+except ImportError:  # NumPy storage mode is optional
+    numpy = None
 
 TERRAIN_TYPES = ['fort', 'forest', 'water',
                  'cloud', 'empty', 'base', 'faith']
+STORAGE_TYPES = ['list', 'numpy']
+
+# Terrain is stored as a small integer, 0 is a tile with no terrain yet
+TERRAIN_CODE = {terrain: i + 1 for i, terrain in enumerate(TERRAIN_TYPES)}
+TERRAIN_NAME = [None] + TERRAIN_TYPES
+BASE_CODE = TERRAIN_CODE['base']
+
+# Neighbour tables shared by every board of the same size, built on first
+# use. (width, height) -> tiles adjacent to each tile index,
+# (width, height, k) -> tiles within distance k of each tile index, and
+# (width, height, k) -> bitboard of the diamond of tiles within distance k
+# of each tile index (the tile itself included)
+_ADJACENT_TABLES = {}
+_WITHIN_TABLES = {}
+_DIAMOND_TABLES = {}
+
+
+class MovementProfile(NamedTuple):
+    """
+    How a deity moves over the board, see Board.distance_field
+    """
+    attribute: str  # 'standard', 'flight' or 'aquatic'
+    movement: int  # Tiles per move action, status effects included
+    mobile: bool  # Can walk on any terrain
+    cloud_bonus: bool  # +1 tile for a move started on a cloud tile
+
+
+class DistanceField(NamedTuple):
+    """
+    Move actions needed to reach each tile index of a board from one tile
+    """
+    moves: Tuple[Union[int, None], ...]  # None if the tile can't be reached
+    area: int  # Bitboard of the tiles whose terrain the field depends on
 
 
 class Tile:
-    def __init__(self):
-        self.character = None
-        self.terrain = None
+    """
+    View over one tile of a Board. Reading an attribute reads the board
+    storage for that tile and assigning one goes through the board so its
+    indexes stay in sync.
+
+    === Public Attribute ===
+    character: Character standing on the tile (None if empty)
+    terrain: One of TERRAIN_TYPES (None if no tile placed yet)
+    player_base: Player owning the tile (None unless terrain == 'base')
+    dead_base: True if base has been destroyed (None unless terrain == 'base')
+    faith: True if the tile was placed as a faith tile
+    """
+
+    __slots__ = ('_board', '_coord', '_index')
+
+    def __init__(self, board: Board, x: int, y: int):
+        self._board = board
+        self._coord = (x, y)
+        self._index = y * board.width + x
+
+    @property
+    def character(self) -> Union[Character, None]:
+        return self._board._characters.get(
+            self._board._occupant[self._index])
+
+    @character.setter
+    def character(self, char: Union[Character, None]) -> None:
+        current = self.character
+        if char is None:
+            if current is not None:
+                self._board.remove_character(current)
+        else:
+            self._board.place_character(char, self._coord)
+
+    @property
+    def terrain(self) -> Union[str, None]:
+        return TERRAIN_NAME[self._board._terrain[self._index]]
+
+    @terrain.setter
+    def terrain(self, terrain: str) -> None:
+        self._board._set_terrain(self._coord, terrain)
+
+    @property
+    def player_base(self) -> Union[int, None]:
+        return int(self._board._player_base[self._index]) or None
+
+    @player_base.setter
+    def player_base(self, player: int) -> None:
+        self._board._set_player_base(self._coord, player)
 
-        # Always none unless self.terrain == 'base'
-        self.player_base = None
-        self.dead_base = None
+    @property
+    def dead_base(self) -> Union[bool, None]:
+        if not self._board._player_base[self._index]:
+            return None
+        return bool(self._board._dead_base[self._index])
 
-        self.faith = False
+    @dead_base.setter
+    def dead_base(self, dead: bool) -> None:
+        self._board.set_dead_base(self._coord, dead)
+
+    @property
+    def faith(self) -> bool:
+        return bool(self._board._faith[self._index])
+
+    @faith.setter
+    def faith(self, faith: bool) -> None:
+        if self._board.watcher is not None:
+            self._board._watch_tile(self._coord)
+        self._board._faith[self._index] = int(faith)
 
     def __str__(self):
         if self.terrain is None:
@@ -32,13 +133,30 @@ class Board:
     """
     Board which stores terrains and characters locations
 
+    Tiles are stored as parallel flat arrays (terrain code, player base,
+    dead base, faith and occupant id) indexed by y * width + x, either as
+    Python lists or, with storage='numpy', as NumPy arrays so whole-board
+    questions become vectorized expressions. self.board is a grid of Tile
+    views over those arrays.
+
+    Alongside the arrays the board keeps bitboards (one bit per tile,
+    bit y * width + x) for each terrain, placed tiles, each player's base,
+    dead bases and occupied tiles so whole-board and neighbourhood questions
+    are shift-and-mask operations.
+
     === Public Attribute ===
     width: Width of the board
     height: Height of the board
+    storage: Storage used for the tile arrays ('list' or 'numpy')
+    zobrist: Zobrist hash of terrains, bases, dead bases and deity
+             positions, kept up to date by every change
+    watcher: Game told about every change so it can be undone (or None)
+    empty_count: Number of tiles with no terrain placed yet
 
     """
 
-    def __init__(self, width: int = 8, height: int = 8) -> None:
+    def __init__(self, width: int = 8, height: int = 8,
+                 storage: str = 'list') -> None:
         """
         Creates new board object
 
@@ -48,17 +166,75 @@ class Board:
         >>> b.height
         8
         """
+        if storage not in STORAGE_TYPES:
+            raise NotValidStorage
+        if storage == 'numpy' and numpy is None:
+            raise NotValidStorage
+
         # Metadata about board
         self.width = width
         self.height = height
+        self.storage = storage
 
         # Creates board with empty tiles
-        self.board = []
-        for i in range(self.height):
-            row = []
-            for j in range(self.width):
-                row.append(Tile())
-            self.board.append(row)
+        size = width * height
+        self._terrain = self._new_array([0] * size)
+        self._player_base = self._new_array([0] * size)
+        self._dead_base = self._new_array([0] * size)
+        self._faith = self._new_array([0] * size)
+        self._occupant = self._new_array([0] * size)
+        self._build_tiles()
+
+        # Character id -> Character and (X, Y) of every character standing
+        # on the board
+        self._characters = {}
+        self._char_location = {}
+        self.watcher = None
+
+        # Terrain set -> bitboard of tiles on or adjacent to that terrain,
+        # for every set asked for so far (see nearby_bits)
+        self._nearby_bits = {}
+        # (coord, MovementProfile) -> DistanceField (see distance_field)
+        self._distance_fields = {}
+        self._rebuild_bitboards()
+
+    def clone(self, characters: Dict[int, Character] = None) -> Board:
+        """
+        Return an independent copy of the board, copying only the tile
+        arrays and indexes. Deities standing on the copy are looked up in
+        characters (id -> Character) when given, otherwise they are shared.
+
+        >>> b = Board()
+        >>> b.add_terrain((3, 4), 'fort')
+        >>> c = b.clone()
+        >>> c.add_terrain((0, 0), 'water')
+        >>> b.get_terrain((0, 0)) is None, c.get_terrain((3, 4))
+        (True, 'fort')
+        """
+        new = object.__new__(Board)
+        new.__dict__.update(self.__dict__)
+        new._terrain = self._copy_array(self._terrain)
+        new._player_base = self._copy_array(self._player_base)
+        new._dead_base = self._copy_array(self._dead_base)
+        new._faith = self._copy_array(self._faith)
+        new._occupant = self._copy_array(self._occupant)
+        new._build_tiles()
+
+        if characters is None:
+            new._characters = dict(self._characters)
+        else:
+            new._characters = {char_id: characters[char_id]
+                               for char_id in self._characters}
+        new._char_location = dict(self._char_location)
+        new._terrain_bits = dict(self._terrain_bits)
+        new._base_bits = dict(self._base_bits)
+        new._dead_bases = dict(self._dead_bases)
+        new._base_tiles = dict(self._base_tiles)
+        new._adjacent_base_tiles = dict(self._adjacent_base_tiles)
+        new._nearby_bits = dict(self._nearby_bits)
+        new._distance_fields = dict(self._distance_fields)
+        new.watcher = None
+        return new
 
     def print(self) -> None:
         """
@@ -123,13 +299,14 @@ class Board:
             # Check if terrain is possible terrain type
             raise NotValidTerrain
 
-        if self.board[coord[1]][coord[0]].terrain is not None:
+        i = coord[1] * self.width + coord[0]
+        if self._terrain[i]:
             # Check if something is already on that terrain
             raise TilePlacementInvalid
-        self.board[coord[1]][coord[0]].terrain = terrain
+        self._set_terrain(coord, terrain)  # Watcher sees the old faith flag
 
         if terrain == 'faith':
-            self.board[coord[1]][coord[0]].faith = True
+            self._faith[i] = 1
 
     def get_terrain(self, coord: Tuple[int, int]) -> str:
         """
@@ -143,7 +320,7 @@ class Board:
         >>> b.get_terrain((3, 4))
         'fort'
         """
-        t = self.board[coord[1]][coord[0]].terrain
+        t = TERRAIN_NAME[self._terrain[coord[1] * self.width + coord[0]]]
         return t
 
     def get_char_location(self, char: Character) -> Tuple:
@@ -151,29 +328,152 @@ class Board:
         Return coordinates of a character
 
         :param char: Character  that you are trying to find
-        :return: Coordinates of character you are trying to find
+        :return: Coordinates of character you are trying to find (None if
+                 the character is not on the board)
         """
-        for i in range(self.height):
-            for j in range(self.width):
-                curr_char = self.board[i][j].character
-                if curr_char is not None and curr_char == char:
-                    return j, i
-        # TODO No character found
+        return self._char_location.get(char.id)
 
-    def adjacent_tiles(self, coord: Tuple[int, int]) -> List[Tuple]:
+    def adjacent_bits(self, coord: Tuple[int, int]) -> int:
+        """
+        Return bitboard of the tiles adjacent to coord
+
+        >>> b = Board()
+        >>> b.bits_to_coords(b.adjacent_bits((0, 0)))
+        [(1, 0), (0, 1)]
+        """
+        return self._neighbour_bits(self._bit(coord))
+
+    def terrain_bits(self, terrains: List[str]) -> int:
+        """
+        Return bitboard of every tile whose terrain is one of terrains
+        """
+        bits = 0
+        for terrain in terrains:
+            bits |= self._terrain_bits[terrain]
+        return bits
+
+    def nearby_bits(self, terrains: Tuple[str, ...]) -> int:
+        """
+        Return bitboard of every tile that has one of terrains or is
+        adjacent to one. The mask is computed the first time terrains is
+        asked for and kept up to date as tiles change from then on.
+
+        >>> b = Board()
+        >>> b.add_terrain((1, 1), 'water')
+        >>> b.bits_to_coords(b.nearby_bits(('water', 'cloud')))
+        [(1, 0), (0, 1), (1, 1), (2, 1), (1, 2)]
+        >>> b.add_terrain((2, 1), 'cloud')
+        >>> (3, 1) in b.bits_to_coords(b.nearby_bits(('water', 'cloud')))
+        True
+        """
+        key = tuple(terrains)
+        bits = self._nearby_bits.get(key)
+        if bits is None:
+            bits = self._find_nearby_bits(key)
+            self._nearby_bits[key] = bits
+        return bits
+
+    def terrain_nearby(self, coord: Tuple[int, int],
+                       terrains: Tuple[str, ...]) -> bool:
+        """
+        Return True if the tile at coord or a tile adjacent to it has one of
+        terrains
+
+        >>> b = Board()
+        >>> b.add_terrain((3, 4), 'water')
+        >>> b.terrain_nearby((3, 3), ['water', 'cloud'])
+        True
+        >>> b.terrain_nearby((2, 3), ['water', 'cloud'])
+        False
+        """
+        return self._bit(coord) & self.nearby_bits(terrains) != 0
+
+    def coord_in(self, coord: Tuple[int, int], bits: int) -> bool:
+        """
+        Return True if the tile at coord is set in bitboard bits
+        """
+        return self._bit(coord) & bits != 0
+
+    def coord_bit(self, coord: Tuple[int, int]) -> int:
+        """
+        Return the bit of the tile at coord in the board's bitboards
+        """
+        return self._bit(coord)
+
+    def adjacent_tiles(self, coord: Tuple[int, int]) -> Tuple[Tuple, ...]:
+        """
+        Return tiles orthogonally adjacent to coord (left, right, up, down),
+        looked up in a table shared by boards of the same size
+
+        >>> b = Board()
+        >>> b.adjacent_tiles((0, 3))
+        ((1, 3), (0, 2), (0, 4))
+        """
         x = coord[0]
         y = coord[1]
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._adjacent[y * self.width + x]
+        return tuple(_adjacent_coords(x, y, self.width, self.height))
 
-        adjacent = []
-        if 0 <= x - 1 <= self.width - 1:
-            adjacent.append((x - 1, y))
-        if 0 <= x + 1 <= self.width - 1:
-            adjacent.append((x + 1, y))
-        if 0 <= y - 1 <= self.height - 1:
-            adjacent.append((x, y - 1))
-        if 0 <= y + 1 <= self.height - 1:
-            adjacent.append((x, y + 1))
-        return adjacent
+    def tiles_within(self, coord: Tuple[int, int],
+                     k: int) -> Tuple[Tuple, ...]:
+        """
+        Return tiles at Manhattan distance 1 to k of coord, nearest first,
+        looked up in a table shared by boards of the same size
+
+        >>> b = Board()
+        >>> b.tiles_within((0, 0), 2)
+        ((1, 0), (0, 1), (2, 0), (1, 1), (0, 2))
+        """
+        key = (self.width, self.height, k)
+        table = _WITHIN_TABLES.get(key)
+        if table is None:
+            table = _build_within_table(*key)
+            _WITHIN_TABLES[key] = table
+        return table[coord[1] * self.width + coord[0]]
+
+    def diamond_bits(self, coord: Tuple[int, int], k: int) -> int:
+        """
+        Return bitboard of the tiles at Manhattan distance at most k of
+        coord (coord included), looked up in a table shared by boards of
+        the same size
+
+        >>> b = Board()
+        >>> b.bits_to_coords(b.diamond_bits((0, 0), 1))
+        [(0, 0), (1, 0), (0, 1)]
+        """
+        key = (self.width, self.height, k)
+        table = _DIAMOND_TABLES.get(key)
+        if table is None:
+            table = _build_diamond_table(*key)
+            _DIAMOND_TABLES[key] = table
+        return table[coord[1] * self.width + coord[0]]
+
+    def distance_field(self, coord: Tuple[int, int],
+                       profile: MovementProfile) -> DistanceField:
+        """
+        Return the fewest move actions a deity moving like profile needs
+        to get from coord to each tile. Terrain rules are the ones of a
+        move: tiles the deity can't enter are never reached, entering a
+        forest ends the move and a flying deity starting a move on a cloud
+        gets one more tile. Deities standing in the way are ignored.
+
+        Fields are cached and a field is only computed again once a tile
+        it depends on changes terrain or the board shrinks.
+
+        >>> b = Board(4, 1)
+        >>> for x, terrain in enumerate(['fort', 'forest', 'fort', 'water']):
+        ...     b.add_terrain((x, 0), terrain)
+        >>> walker = MovementProfile('standard', 2, False, False)
+        >>> b.distance_field((0, 0), walker).moves
+        (0, 1, 2, None)
+        """
+        key = (coord, profile)
+        field = self._distance_fields.get(key)
+        if field is None:
+            field = self._find_distance_field(coord, profile)
+            self._distance_fields[key] = field
+        return field
 
     def possible_tile(self,
                       coord: Union[Tuple[int, int], List[Tuple]]) -> bool:
@@ -203,30 +503,72 @@ class Board:
         old_coord = self.get_char_location(char)
 
         # Check if new_coord already has a character
-        if self.board[new_coord[1]][new_coord[0]].character is not None:
+        if self._occupied_bits & self._bit(new_coord):
             raise CharacterBlocking
 
-        if self.board[new_coord[1]][new_coord[0]].terrain is None:
+        new_i = new_coord[1] * self.width + new_coord[0]
+        if not self._terrain[new_i]:
             raise NotValidMove
 
-        self.board[old_coord[1]][old_coord[0]].character = None
-        self.board[new_coord[1]][new_coord[0]].character = char
+        if self.watcher is not None:
+            self.watcher.on_location(self, char, old_coord)
+        self._occupant[old_coord[1] * self.width + old_coord[0]] = 0
+        self._occupant[new_i] = char.id
+        self._char_location[char.id] = new_coord
+        self._occupied_bits ^= self._bit(old_coord) | self._bit(new_coord)
+        self.zobrist ^= zobrist_key('char', char.id, *old_coord) ^ \
+            zobrist_key('char', char.id, *new_coord)
 
     def spawn_character(self, char: Character, coord: Tuple[int, int],
                         player: int) -> None:
         tile = self.board[coord[1]][coord[0]]
         if tile.terrain == 'base' and tile.player_base == player \
                 and tile.character is None:
-            tile.character = char
+            self.place_character(char, coord)
         else:
             if tile.terrain != 'base' or tile.player_base != player:
                 raise NotValidSpawn
             elif tile.character is not None:
                 raise TileAlreadyHaveCharacter
 
+    def place_character(self, char: Character,
+                        coord: Tuple[int, int]) -> None:
+        """
+        Put char on the tile at coord regardless of base or terrain rules
+        (used by scenarios and abilities that summon a deity directly)
+
+        :param char: Character to place
+        :param coord: Coordinates as (X, Y)
+        :return: None (mutates board)
+
+        >>> from deity_character import Zeus_Philanderer
+        >>> b = Board()
+        >>> b.place_character(Zeus_Philanderer(1), (2, 3))
+        >>> b.get_char_location(Zeus_Philanderer(1))
+        (2, 3)
+        """
+        tile = self.board[coord[1]][coord[0]]
+        if tile.character is not None and tile.character != char:
+            raise TileAlreadyHaveCharacter
+
+        if char.id in self._char_location:
+            self.remove_character(char)
+        if self.watcher is not None:
+            self.watcher.on_location(self, char, None)
+        self._occupant[coord[1] * self.width + coord[0]] = char.id
+        self._characters[char.id] = char
+        self._char_location[char.id] = coord
+        self._occupied_bits |= self._bit(coord)
+        self.zobrist ^= zobrist_key('char', char.id, *coord)
+
     def remove_character(self, char: Character) -> None:
-        coord = self.get_char_location(char)
-        self.board[coord[1]][coord[0]].character = None
+        coord = self._char_location.pop(char.id)
+        if self.watcher is not None:
+            self.watcher.on_location(self, char, coord)
+        del self._characters[char.id]
+        self._occupant[coord[1] * self.width + coord[0]] = 0
+        self._occupied_bits &= ~self._bit(coord)
+        self.zobrist ^= zobrist_key('char', char.id, *coord)
 
     def create_base_p1(self, coord: Tuple[int, int]) -> None:
         """
@@ -284,20 +626,68 @@ class Board:
         self._create_base_tile(x + 1, y + 1, 2)
 
     def _create_base_tile(self, x, y, player):
-        self.board[y][x].player_base = player
-        self.board[y][x].dead_base = False
-        self.board[y][x].terrain = 'base'
+        self._set_terrain((x, y), 'base')
+        self._set_player_base((x, y), player)
 
     def get_base_tile(self, player: int) -> List[Tuple]:
-        base_tiles = []
-        for i in range(self.height):
-            for j in range(self.width):
-                tile = self.board[i][j]
-                if tile.terrain == 'base' and tile.player_base == player:
-                    base_tiles.append((j, i))
-        return base_tiles
+        """
+        Return base tiles of player row by row, remembered until the base
+        bitboard of player changes
+
+        >>> b = Board()
+        >>> b.create_base_p2((3, 0))
+        >>> b.get_base_tile(2)
+        [(3, 0), (4, 0), (3, 1), (4, 1)]
+        """
+        bits = self._base_bits.get(player, 0)
+        cached = self._base_tiles.get(player)
+        if cached is None or cached[0] != bits:
+            cached = (bits, tuple(self.bits_to_coords(bits)))
+            self._base_tiles[player] = cached
+        return list(cached[1])
+
+    def set_dead_base(self, coord: Tuple[int, int],
+                      dead: bool = True) -> None:
+        """
+        Mark the base tile at coord as destroyed, or as not destroyed if
+        dead is False
+
+        :param coord: Coordinates as (X, Y) of a base tile
+        :param dead: Whether the base tile is destroyed
+        :return: None (mutates board)
+
+        >>> b = Board()
+        >>> b.create_base_p1((1, 7))
+        >>> b.set_dead_base((1, 7))
+        >>> b.check_dead_base(1)
+        1
+        >>> b.get_tile((1, 7)).dead_base = False
+        >>> b.check_dead_base(1), b.get_tile((1, 7)).dead_base
+        (0, False)
+        """
+        i = coord[1] * self.width + coord[0]
+        if bool(self._dead_base[i]) == bool(dead):
+            return
+        if self.watcher is not None:
+            self._watch_tile(coord)
+        self.zobrist ^= zobrist_key('dead', *coord)
+        self._count_dead_base(i, -1)
+        self._dead_base[i] = int(bool(dead))
+        self._count_dead_base(i, 1)
+        if dead:
+            self._dead_base_bits |= self._bit(coord)
+        else:
+            self._dead_base_bits &= ~self._bit(coord)
 
     def _get_adjacent_base_tiles(self, player: int) -> List[Tuple]:
+        bits = self._base_bits.get(player, 0)
+        cached = self._adjacent_base_tiles.get(player)
+        if cached is None or cached[0] != bits:
+            cached = (bits, tuple(self._find_adjacent_base_tiles(player)))
+            self._adjacent_base_tiles[player] = cached
+        return list(cached[1])
+
+    def _find_adjacent_base_tiles(self, player: int) -> List[Tuple]:
         base_tiles = self.get_base_tile(player)
         all_adjacent_tiles = set()
         for tile in base_tiles:
@@ -313,6 +703,33 @@ class Board:
 
     def create_big_road(self, player: int, coord1: Tuple[int, int],
                         coord2: Tuple[int, int] = None) -> None:
+        """
+        Add the big road of player starting from coord1 (and coord2)
+
+        :param player: Player number owning the road
+        :param coord1: Tile adjacent to player's base
+        :param coord2: Optional second tile adjacent to player's base and
+                       to coord1
+        :return: None (mutates board)
+        """
+        tiles = self.get_big_road_tiles(player, coord1, coord2)
+        for tile in tiles:
+            if self.get_terrain(tile) is not None:
+                raise NotPossibleRoad
+        for tile in tiles:
+            self.add_terrain(tile, 'empty')
+
+    def get_big_road_tiles(self, player: int, coord1: Tuple[int, int],
+                           coord2: Tuple[int, int] = None) -> List[Tuple]:
+        """
+        Return the four tiles the big road of player starting from coord1
+        (and coord2) would cover. Raise NotPossibleRoad if no such road.
+
+        >>> b = Board()
+        >>> b.create_base_p1((1, 7))
+        >>> b.get_big_road_tiles(1, (1, 5), (2, 5))
+        [(1, 5), (2, 5), (1, 4), (2, 4)]
+        """
         adjacent_tiles = self._get_adjacent_base_tiles(player)
         base_tiles = self.get_base_tile(player)
 
@@ -329,37 +746,50 @@ class Board:
             y2 = coord2[1]
             if y1 == y2 and abs(x1 - x2) == 1:
                 # Two coordinates are horizontal (add road above or below)
-                self.add_terrain(coord1, 'empty')
-                self.add_terrain(coord2, 'empty')
                 if player == 1:
-                    self.add_terrain((x1, y1 - 1), 'empty')
-                    self.add_terrain((x2, y2 - 1), 'empty')
+                    tiles = [coord1, coord2, (x1, y1 - 1), (x2, y2 - 1)]
                 else:
-                    self.add_terrain((x1, y1 + 1), 'empty')
-                    self.add_terrain((x2, y2 + 1), 'empty')
+                    tiles = [coord1, coord2, (x1, y1 + 1), (x2, y2 + 1)]
+                if not self.possible_tile(tiles):
+                    raise NotPossibleRoad
+                return tiles
             elif x1 == x2 and abs(y1 - y2) == 1:
                 left = [(x1 - 1, y1), (x2 - 1, y2)]
                 right = [(x1 + 1, y1), (x2 + 1, y2)]
                 if self.possible_tile(left) and \
                         not (any(item in left for item in base_tiles)):
-                    self.add_terrain(coord1, 'empty')
-                    self.add_terrain(coord2, 'empty')
-                    self.add_terrain(left[0], 'empty')
-                    self.add_terrain(left[1], 'empty')
+                    return [coord1, coord2] + left
                 elif self.possible_tile(right) and \
                         not (any(item in right for item in base_tiles)):
-                    self.add_terrain(coord1, 'empty')
-                    self.add_terrain(coord2, 'empty')
-                    self.add_terrain(right[0], 'empty')
-                    self.add_terrain(right[1], 'empty')
-                else:
-                    raise NotPossibleRoad
+                    return [coord1, coord2] + right
+            raise NotPossibleRoad
         else:
             square = self._get_valid_square(x1, y1, player)
             if square is None:
                 raise NotPossibleRoad
-            for tile in square:
-                self.add_terrain(tile, 'empty')
+            return square
+
+    def possible_roads(self, player: int) -> List[Tuple]:
+        """
+        Return every (coord1, coord2) that create_big_road accepts for
+        player, coord2 is None for roads picked from a single tile
+        """
+        adjacent_tiles = sorted(self._get_adjacent_base_tiles(player))
+        roads = []
+        for i, coord1 in enumerate(adjacent_tiles):
+            choices = [None]
+            for coord2 in adjacent_tiles[i + 1:]:
+                if abs(coord1[0] - coord2[0]) + \
+                        abs(coord1[1] - coord2[1]) == 1:
+                    choices.append(coord2)
+            for coord2 in choices:
+                try:
+                    tiles = self.get_big_road_tiles(player, coord1, coord2)
+                except NotPossibleRoad:
+                    continue
+                if all(self.get_terrain(tile) is None for tile in tiles):
+                    roads.append((coord1, coord2))
+        return roads
 
     def _get_valid_square(self, x: int, y: int, player: int):
         s1 = [(x, y), (x + 1, y), (x, y + 1), (x + 1, y + 1)]
@@ -388,72 +818,478 @@ class Board:
         return adjacent_check and base_check and possible_check
 
     def check_dead_base(self, player: int) -> int:
-        base = self.get_base_tile(player)
-        counter = 0
-        for t in base:
-            if self.board[t[1]][t[0]].dead_base:
-                counter += 1
-        return counter
+        """
+        Return how many base tiles of player are destroyed, counted as
+        bases die instead of scanned
+
+        >>> b = Board()
+        >>> b.create_base_p1((1, 7))
+        >>> b.set_dead_base((1, 7))
+        >>> b.set_dead_base((1, 7))
+        >>> b.check_dead_base(1), b.check_dead_base(2)
+        (1, 0)
+        """
+        return self._dead_bases.get(player, 0)
 
     def change_to_road(self, coord: Tuple[int, int]) -> None:
-        x = coord[0]
-        y = coord[1]
-        self.board[y][x].terrain = 'empty'
+        self._set_terrain(coord, 'empty')
 
     def valid_tile_placement(self, coord: Tuple[int, int]) -> bool:
-        adjacent = self.adjacent_tiles(coord)
-        for c in adjacent:
-            if self.board[c[1]][c[0]].terrain is not None:
-                return True
-        return False
+        return self.adjacent_bits(coord) & self._placed_bits != 0
+
+    def legal_tile_placements(self) -> List[Tuple]:
+        """
+        Return every empty tile a drawn tile can be placed on (adjacent to
+        a placed tile), row by row. The frontier is kept up to date as
+        tiles are placed so nothing is scanned.
+
+        >>> b = Board(3, 2)
+        >>> b.add_terrain((1, 0), 'fort')
+        >>> b.legal_tile_placements()
+        [(0, 0), (2, 0), (1, 1)]
+        >>> b.add_terrain((2, 0), 'water')
+        >>> b.legal_tile_placements()
+        [(0, 0), (1, 1), (2, 1)]
+        """
+        return self.bits_to_coords(self._frontier_bits)
 
     def get_tile(self, coord: Tuple[int, int]) -> Tile:
         return self.board[coord[1]][coord[0]]
 
     def get_character_on_board(self) -> List[Character]:
-        char = []
+        if self.storage == 'numpy':
+            occupant = self._occupant[self._occupant != 0]
+            return [self._characters[int(char_id)] for char_id in occupant]
+        return list(self._characters.values())
+
+    @property
+    def occupied_bits(self) -> int:
+        """
+        Bitboard of the tiles a deity is standing on
+        """
+        return self._occupied_bits
+
+    @property
+    def is_full(self) -> bool:
+        """
+        True once every tile has terrain, kept as a count of empty tiles so
+        no scan is needed
+
+        >>> b = Board(2, 1)
+        >>> b.add_terrain((0, 0), 'fort')
+        >>> b.empty_count, b.is_full
+        (1, False)
+        >>> b.add_terrain((1, 0), 'water')
+        >>> b.empty_count, b.is_full
+        (0, True)
+        """
+        return self.empty_count == 0
+
+    def check_full_board(self) -> bool:
+        return self.empty_count == 0
+
+    def border_closing(self) -> None:
+        width = self.width
+        height = self.height
+        if self.watcher is not None:
+            before = self._snapshot()
+
+        # Characters on the border are killed and leave the board
+        for char_id, (x, y) in list(self._char_location.items()):
+            if x in (0, width - 1) or y in (0, height - 1):
+                char = self._characters[char_id]
+                char.health = 0
+                self.remove_character(char)
+
+        keep = [i * width + j for i in range(1, height - 1)
+                for j in range(1, width - 1)]
+        self._terrain = self._new_array([self._terrain[i] for i in keep])
+        self._player_base = self._new_array(
+            [self._player_base[i] for i in keep])
+        self._dead_base = self._new_array([self._dead_base[i] for i in keep])
+        self._faith = self._new_array([self._faith[i] for i in keep])
+        self._occupant = self._new_array([self._occupant[i] for i in keep])
+
+        self.height = height - 2
+        self.width = width - 2
+        self._build_tiles()
+
+        # Everyone left shifts one tile up and to the left
+        location = {}
+        for char_id, (x, y) in self._char_location.items():
+            location[char_id] = (x - 1, y - 1)
+        self._char_location = location
+        self._rebuild_bitboards()
+        if self.watcher is not None:
+            # Told last so it is undone first, putting the border back
+            # before the deities killed on it
+            self.watcher.on_board_shrunk(self, before)
+
+    def testing_fill_board(self, missing: Tuple[int, int] = (-1, -1)):
         for i in range(self.height):
             for j in range(self.width):
-                if self.board[i][j].character is not None:
-                    char.append(self.board[i][j].character)
-        return char
+                if (j, i) == missing:
+                    continue
+                self._terrain[i * self.width + j] = TERRAIN_CODE['empty']
+        self._rebuild_bitboards()
 
-    def check_full_board(self) -> bool:
+    def bits_to_coords(self, bits: int) -> List[Tuple]:
+        """
+        Return coordinates of every tile set in bits, row by row
+
+        >>> b = Board()
+        >>> b.bits_to_coords(0b1000000011)
+        [(0, 0), (1, 0), (1, 1)]
+        """
+        coords = []
+        while bits:
+            low = bits & -bits
+            i = low.bit_length() - 1
+            coords.append((i % self.width, i // self.width))
+            bits ^= low
+        return coords
+
+    # STORAGE HELPERS
+    def _new_array(self, values: List[int]):
+        if self.storage == 'numpy':
+            return numpy.array(values, dtype=numpy.int16)
+        return values
+
+    def _build_tiles(self) -> None:
+        self.board = []
         for i in range(self.height):
+            row = []
             for j in range(self.width):
-                tile = self.board[i][j]
-                if tile.terrain is None:
-                    return False
-        return True
+                row.append(Tile(self, j, i))
+            self.board.append(row)
 
-    def border_closing(self) -> None:
-        top_row = self.board[0]
-        bottom_row = self.board[-1]
+    def _set_terrain(self, coord: Tuple[int, int], terrain: str) -> None:
+        if terrain not in TERRAIN_TYPES:
+            raise NotValidTerrain
+        i = coord[1] * self.width + coord[0]
+        if self.watcher is not None:
+            self._watch_tile(coord)
+        old_code = int(self._terrain[i])
+        if old_code:
+            self.zobrist ^= zobrist_key('terrain', *coord, old_code)
+        else:
+            self.empty_count -= 1
+        self.zobrist ^= zobrist_key('terrain', *coord, TERRAIN_CODE[terrain])
+        self._count_dead_base(i, -1)
+        self._terrain[i] = TERRAIN_CODE[terrain]
+        self._count_dead_base(i, 1)
+        self._set_terrain_bit(coord, TERRAIN_NAME[old_code], terrain)
+        self._update_nearby_bits(TERRAIN_NAME[old_code], terrain)
+        self._drop_distance_fields(coord)
+        if not old_code:
+            # Tile leaves the frontier, its empty neighbours join it
+            self._frontier_bits = (self._frontier_bits
+                                   | self.adjacent_bits(coord)) \
+                & ~self._placed_bits
+
+    def _set_player_base(self, coord: Tuple[int, int], player: int) -> None:
+        i = coord[1] * self.width + coord[0]
+        if self.watcher is not None:
+            self._watch_tile(coord)
+        bit = self._bit(coord)
+        if self._player_base[i]:
+            self._base_bits[int(self._player_base[i])] &= ~bit
+            self.zobrist ^= zobrist_key('base', *coord,
+                                        int(self._player_base[i]))
+        if self._dead_base[i]:
+            self.zobrist ^= zobrist_key('dead', *coord)
+        if player:
+            self.zobrist ^= zobrist_key('base', *coord, player)
+        self._count_dead_base(i, -1)
+        self._player_base[i] = player or 0
+        self._dead_base[i] = 0
+        self._dead_base_bits &= ~bit
+        if player and TERRAIN_NAME[self._terrain[i]] == 'base':
+            self._base_bits[player] |= bit
+
+    # UNDO HELPERS
+    def _watch_tile(self, coord: Tuple[int, int]) -> None:
+        """
+        Tell the watcher what tile coord holds before it changes
+        """
+        i = coord[1] * self.width + coord[0]
+        self.watcher.on_tile(self, coord, int(self._terrain[i]),
+                             int(self._player_base[i]),
+                             int(self._dead_base[i]), int(self._faith[i]))
 
-        for tile in top_row + bottom_row:
-            if tile.character is not None:
-                tile.character.health = 0
+    def restore_tile(self, coord: Tuple[int, int], terrain: int, base: int,
+                     dead: int, faith: int) -> None:
+        """
+        Put back terrain code, base owner, dead and faith flags of the tile
+        at coord (0 for none), keeping bitboards and hash in sync
+        """
+        i = coord[1] * self.width + coord[0]
+        old_terrain = TERRAIN_NAME[self._terrain[i]]
+        self.zobrist ^= board_tile_hash(self, *coord)
+        self.empty_count += (not terrain) - (not self._terrain[i])
+        self._count_dead_base(i, -1)
+        self._terrain[i] = terrain
+        self._player_base[i] = base
+        self._dead_base[i] = dead
+        self._faith[i] = faith
+        self._count_dead_base(i, 1)
+        self.zobrist ^= board_tile_hash(self, *coord)
+
+        bit = self._bit(coord)
+        for name in self._terrain_bits:
+            self._terrain_bits[name] &= ~bit
+        for player in self._base_bits:
+            self._base_bits[player] &= ~bit
+        self._placed_bits &= ~bit
+        self._dead_base_bits &= ~bit
+        if terrain:
+            self._terrain_bits[TERRAIN_NAME[terrain]] |= bit
+            self._placed_bits |= bit
+        if base and TERRAIN_NAME[terrain] == 'base':
+            self._base_bits[base] |= bit
+        if dead:
+            self._dead_base_bits |= bit
+        self._frontier_bits = self._neighbour_bits(self._placed_bits) & \
+            ~self._placed_bits
+        self._update_nearby_bits(old_terrain, TERRAIN_NAME[terrain])
+        self._drop_distance_fields(coord)
+
+    def restore_location(self, char: Character,
+                         coord: Union[Tuple[int, int], None]) -> None:
+        """
+        Put char back on coord, or off the board if coord is None
+        """
+        if char.id in self._char_location:
+            self.remove_character(char)
+        if coord is not None:
+            self.place_character(char, coord)
 
-        self.board.pop(0)
-        self.board.pop(-1)
+    def _snapshot(self) -> Tuple:
+        """
+        Return a copy of everything border_closing changes
+        """
+        return (self.width, self.height, self._copy_array(self._terrain),
+                self._copy_array(self._player_base),
+                self._copy_array(self._dead_base),
+                self._copy_array(self._faith),
+                self._copy_array(self._occupant), dict(self._characters),
+                dict(self._char_location))
+
+    def restore_snapshot(self, snapshot: Tuple) -> None:
+        """
+        Put the board back as it was when snapshot was taken
+        """
+        (self.width, self.height, self._terrain, self._player_base,
+         self._dead_base, self._faith, self._occupant, self._characters,
+         self._char_location) = snapshot
+        self._build_tiles()
+        self._rebuild_bitboards()
 
-        for row in self.board:
-            if row[0].character is not None:
-                row[0].character.health = 0
-            if row[-1].character is not None:
-                row[-1].character.health = 0
-            row.pop(0)
-            row.pop(-1)
+    def _count_dead_base(self, i: int, sign: int) -> None:
+        """
+        Add sign to the dead base count of the owner of tile index i if it
+        is a destroyed base tile (-1 before changing the tile, 1 after)
+        """
+        if self._dead_base[i] and self._player_base[i] and \
+                self._terrain[i] == BASE_CODE:
+            self._dead_bases[int(self._player_base[i])] += sign
 
-        self.height = len(self.board)
-        self.width = len(self.board[0])
+    def _copy_array(self, array):
+        if self.storage == 'numpy':
+            return array.copy()
+        return list(array)
 
-    def testing_fill_board(self, missing: Tuple[int, int] = (-1, -1)):
-        for i in range(self.height):
-            for j in range(self.width):
-                if (j, i) == missing:
+    # BITBOARD HELPERS
+    def _bit(self, coord: Tuple[int, int]) -> int:
+        return 1 << (coord[1] * self.width + coord[0])
+
+    def _neighbour_bits(self, bits: int) -> int:
+        """
+        Return bitboard of tiles orthogonally adjacent to any tile in bits
+        """
+        width = self.width
+        return (((bits << 1) & self._not_left_column)
+                | ((bits >> 1) & self._not_right_column)
+                | ((bits << width) & self._full_mask)
+                | (bits >> width))
+
+    def _set_terrain_bit(self, coord: Tuple[int, int], old_terrain: str,
+                         terrain: str) -> None:
+        bit = self._bit(coord)
+        if old_terrain is not None:
+            self._terrain_bits[old_terrain] &= ~bit
+        self._terrain_bits[terrain] |= bit
+        self._placed_bits |= bit
+        if old_terrain == 'base' and terrain != 'base':
+            for player in self._base_bits:
+                self._base_bits[player] &= ~bit
+
+    def _find_nearby_bits(self, terrains: Tuple[str, ...]) -> int:
+        bits = self.terrain_bits(terrains)
+        return bits | self._neighbour_bits(bits)
+
+    def _update_nearby_bits(self, old_terrain: str, terrain: str) -> None:
+        """
+        Recompute the nearby masks of the terrain sets that a tile changing
+        from old_terrain to terrain enters or leaves
+        """
+        for key in self._nearby_bits:
+            if old_terrain in key or terrain in key:
+                self._nearby_bits[key] = self._find_nearby_bits(key)
+
+    # DISTANCE FIELD HELPERS
+    def _find_distance_field(self, coord: Tuple[int, int],
+                             profile: MovementProfile) -> DistanceField:
+        """
+        Search tiles in order of (moves, -steps left in the current move),
+        a tile reached with fewer moves, or as many moves and more steps
+        left, can always go on at least as far
+        """
+        width = self.width
+        passable = self._placed_bits
+        if not profile.mobile:
+            if profile.attribute not in ('flight', 'aquatic'):
+                passable &= ~self._terrain_bits['water']
+            if profile.attribute != 'flight':
+                passable &= ~self._terrain_bits['cloud']
+        forest = self._terrain_bits['forest']
+        cloud = self._terrain_bits['cloud'] if profile.cloud_bonus else 0
+
+        moves = [None] * (width * self.height)
+        start = coord[1] * width + coord[0]
+        area = 1 << start
+        best = {start: (0, 0)}
+        queue = [(0, 0, start)]
+        while queue:
+            num_move, left, i = heappop(queue)
+            if moves[i] is not None:
+                continue
+            moves[i] = num_move
+            left = -left
+            if left == 0:
+                # Out of steps, the next step starts a new move
+                left = profile.movement + (cloud >> i & 1)
+                num_move += 1
+            if left <= 0:
+                continue
+            for x, y in self._adjacent[i]:
+                j = y * width + x
+                area |= 1 << j
+                if moves[j] is not None or not passable >> j & 1:
                     continue
-                self.board[i][j].terrain = 'empty'
+                label = (num_move, 0 if forest >> j & 1 else left - 1)
+                if j not in best or (label[0], -label[1]) < \
+                        (best[j][0], -best[j][1]):
+                    best[j] = label
+                    heappush(queue, (label[0], -label[1], j))
+        return DistanceField(tuple(moves), area)
+
+    def _drop_distance_fields(self, coord: Tuple[int, int]) -> None:
+        """
+        Forget the distance fields that depend on the tile at coord
+        """
+        bit = self._bit(coord)
+        for key in [key for key, field in self._distance_fields.items()
+                    if field.area & bit]:
+            del self._distance_fields[key]
+
+    def _rebuild_bitboards(self) -> None:
+        """
+        Recompute every bitboard, the empty tile count, the neighbour table
+        and the zobrist hash from the tile arrays (used when the board
+        dimensions change)
+        """
+        width = self.width
+        self._full_mask = (1 << (width * self.height)) - 1
+        left_column = 0
+        for i in range(self.height):
+            left_column |= 1 << (i * width)
+        right_column = left_column << (width - 1)
+        self._not_left_column = self._full_mask & ~left_column
+        self._not_right_column = self._full_mask & ~right_column
+
+        self._terrain_bits = {terrain: 0 for terrain in TERRAIN_TYPES}
+        self._placed_bits = 0
+        self._base_bits = {1: 0, 2: 0}
+        self._dead_base_bits = 0
+        self._occupied_bits = 0
+        self._dead_bases = {1: 0, 2: 0}
+        self._base_tiles = {}  # Player -> (base bits, base tiles)
+        self._adjacent_base_tiles = {}  # Player -> (base bits, tiles)
+        self.empty_count = 0
+        self._adjacent = _ADJACENT_TABLES.get((width, self.height))
+        if self._adjacent is None:
+            self._adjacent = _build_adjacent_table(width, self.height)
+            _ADJACENT_TABLES[(width, self.height)] = self._adjacent
+        for i in range(width * self.height):
+            bit = 1 << i
+            terrain = TERRAIN_NAME[self._terrain[i]]
+            if terrain is not None:
+                self._terrain_bits[terrain] |= bit
+                self._placed_bits |= bit
+            else:
+                self.empty_count += 1
+            if terrain == 'base' and self._player_base[i]:
+                self._base_bits[int(self._player_base[i])] |= bit
+            if self._dead_base[i]:
+                self._dead_base_bits |= bit
+            self._count_dead_base(i, 1)
+            if self._occupant[i]:
+                self._occupied_bits |= bit
+        # Empty tiles next to a placed tile, where drawn tiles can go
+        self._frontier_bits = self._neighbour_bits(self._placed_bits) & \
+            ~self._placed_bits
+        self._nearby_bits = {key: self._find_nearby_bits(key)
+                             for key in self._nearby_bits}
+        self._distance_fields = {}  # Coordinates have all moved
+        self.zobrist = board_hash(self)
+
+
+def _adjacent_coords(x: int, y: int, width: int,
+                     height: int) -> List[Tuple]:
+    adjacent = []
+    if 0 <= x - 1 <= width - 1:
+        adjacent.append((x - 1, y))
+    if 0 <= x + 1 <= width - 1:
+        adjacent.append((x + 1, y))
+    if 0 <= y - 1 <= height - 1:
+        adjacent.append((x, y - 1))
+    if 0 <= y + 1 <= height - 1:
+        adjacent.append((x, y + 1))
+    return adjacent
+
+
+def _build_adjacent_table(width: int, height: int) -> List[Tuple]:
+    return [tuple(_adjacent_coords(i % width, i // width, width, height))
+            for i in range(width * height)]
+
+
+def _build_within_table(width: int, height: int, k: int) -> List[Tuple]:
+    table = []
+    for i in range(width * height):
+        x = i % width
+        y = i // width
+        within = []
+        for dist in range(1, k + 1):
+            for dy in range(-dist, dist + 1):
+                dx = dist - abs(dy)
+                # dict.fromkeys drops the repeat when dx == 0
+                ends = dict.fromkeys([(x - dx, y + dy), (x + dx, y + dy)])
+                for tile in ends:
+                    if 0 <= tile[0] < width and 0 <= tile[1] < height:
+                        within.append(tile)
+        table.append(tuple(within))
+    return table
+
+
+def _build_diamond_table(width: int, height: int, k: int) -> List[int]:
+    table = []
+    for i, within in enumerate(_build_within_table(width, height, k)):
+        bits = 1 << i
+        for x, y in within:
+            bits |= 1 << (y * width + x)
+        table.append(bits)
+    return table
 
 
 if __name__ == '__main__':
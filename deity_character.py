@@ -1,29 +1,170 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, \
+    Tuple, Union
 from abc import ABC
 from deity_error import *
-from deity_helper_function import turn_into_coordinate, distance
-from random import randint
+from deity_helper_function import distance
+from deity_action import Faith
+from deity_event import *
 
 if TYPE_CHECKING:
     from deity_game import Deity, Player
     from deity_board import Tile
 
 
+# Status effects a deity can have, in the order they are stored
+STATUS_EFFECTS = ['disarmed', 'blinded', 'mummified', 'slowed', 'stun',
+                  'grounded', 'mobile', 'divine', 'vigor']
+STATUS_INDEX = {effect: i for i, effect in enumerate(STATUS_EFFECTS)}
+STATUS_BIT = {effect: 1 << i for i, effect in enumerate(STATUS_EFFECTS)}
+# Active effect names for every bitmask of active effects
+_ACTIVE_NAMES = [tuple(effect for effect in STATUS_EFFECTS
+                       if mask & STATUS_BIT[effect])
+                 for mask in range(1 << len(STATUS_EFFECTS))]
+# Effects that stop a deity from taking any action
+NO_ACTION_MASK = STATUS_BIT['stun'] | STATUS_BIT['mummified']
+
+# Times a passive ability can trigger, and the Character subclasses whose
+# passive_ability does something at each of them (see
+# Character.passive_triggers)
+PASSIVE_TRIGGERS = ['start_turn', 'collect_faith', 'after_movement',
+                    'take_damage_attack', 'take_damage_spell', 'end_turn']
+PASSIVE_REGISTRY = {trigger: set() for trigger in PASSIVE_TRIGGERS}
+
+
+class Damage(NamedTuple):
+    """One hit of a batch passed to deal_damage"""
+    target: Character
+    amount: int
+    source: Character
+    kind: str  # 'attack' or 'spell'
+
+
+class StatusEffect:
+    """
+    Status effect counters of a deity (effect -> turns left), read and
+    written like a dict with the keys of STATUS_EFFECTS. Counters are kept
+    in one fixed-layout list with a bitmask of the active ones (counter
+    above 0) so checks are mask tests. A counter of inf never runs out and
+    -inf makes the deity immune. Changes are reported to the deity's
+    watcher.
+
+    >>> s = StatusEffect(None)
+    >>> s['stun'] = 2
+    >>> s['vigor'] = 1
+    >>> s.active_effects()
+    ('stun', 'vigor')
+    >>> s.active & NO_ACTION_MASK != 0
+    True
+    """
+    __slots__ = ('char', 'turns', 'active')
+
+    def __init__(self, char: Character, effects: dict = None):
+        self.char = char
+        self.turns = [0] * len(STATUS_EFFECTS)
+        self.active = 0
+        if effects:
+            for effect, turns in effects.items():
+                self._store(STATUS_INDEX[effect], turns)
+
+    def __getitem__(self, effect: str):
+        return self.turns[STATUS_INDEX[effect]]
+
+    def __setitem__(self, effect: str, turns) -> None:
+        i = STATUS_INDEX[effect]
+        old = self.turns[i]
+        self._store(i, turns)
+        if self.char is not None and self.char.watcher is not None:
+            self.char.watcher.on_status(self.char, effect, old, turns)
+
+    def __contains__(self, effect: str) -> bool:
+        return effect in STATUS_INDEX
+
+    def __iter__(self):
+        return iter(STATUS_EFFECTS)
+
+    def __len__(self) -> int:
+        return len(STATUS_EFFECTS)
+
+    def get(self, effect: str, default=None):
+        if effect in STATUS_INDEX:
+            return self.turns[STATUS_INDEX[effect]]
+        return default
+
+    def keys(self) -> List[str]:
+        return list(STATUS_EFFECTS)
+
+    def items(self) -> List[Tuple[str, int]]:
+        return list(zip(STATUS_EFFECTS, self.turns))
+
+    def decay(self) -> List[str]:
+        """
+        Take a turn off every active effect, return the effects that ran
+        out. Inactive counters (including immunities) are not touched.
+        """
+        expired = []
+        for effect in _ACTIVE_NAMES[self.active]:
+            self[effect] -= 1
+            if self[effect] == 0:
+                expired.append(effect)
+        return expired
+
+    def active_effects(self) -> Tuple[str, ...]:
+        """
+        Return the effects with turns left, in STATUS_EFFECTS order
+        """
+        return _ACTIVE_NAMES[self.active]
+
+    def _store(self, i: int, turns) -> None:
+        self.turns[i] = turns
+        if turns > 0:
+            self.active |= 1 << i
+        else:
+            self.active &= ~(1 << i)
+
+
+def _all_slots(cls: type) -> Tuple[str, ...]:
+    """
+    Return the names of the slots of cls and of every class it inherits
+    """
+    names = []
+    for class_ in reversed(cls.__mro__):
+        slots = class_.__dict__.get('__slots__', ())
+        names += [slots] if isinstance(slots, str) else list(slots)
+    return tuple(names)
+
+
 class Character:
+    # Deities are slotted (one small fixed record each, see _all_slots)
+    # and their descriptions are class constants shared by every game.
+    # watcher is the game told about every change of health and status
+    # effects (Deity) or None.
+    __slots__ = ('id', 'max_health', '_health', 'range', 'movement',
+                 'class_', '_has_moved', '_has_attack', '_has_spell',
+                 'status_effect', 'attribute', 'watcher')
+    # Triggers passive_ability handles, subclasses are added to
+    # PASSIVE_REGISTRY for each of them so passives are only called where
+    # they do something
+    passive_triggers = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for trigger in cls.passive_triggers:
+            PASSIVE_REGISTRY[trigger].add(cls)
+        cls._all_slots = _all_slots(cls)
+
     def __init__(self, id_, health, range_, movement, class_, attribute=None):
+        object.__setattr__(self, 'watcher', None)
         self.id = id_
         self.max_health = health
-        self.health = health
+        self._health = health
         self.range = range_
         self.movement = movement
         self.class_ = class_
         self.has_moved = False
         self.has_attack = False
         self.has_spell = False
-        self.status_effect = {'disarmed': 0, 'blinded': 0, 'mummified': 0,
-                              'slowed': 0, 'stun': 0, 'grounded': 0,
-                              'mobile': 0, 'divine': 0, 'vigor': 0}
+        self.status_effect = StatusEffect(self)
         if attribute:
             self.attribute = attribute  # flight, aquatic or standard
         else:
@@ -32,49 +173,99 @@ class Character:
     def __eq__(self, other):
         return self.id == other.id
 
+    def clone(self) -> Character:
+        """
+        Return a copy of self with its own stats and status effects, sharing
+        the descriptions and other immutable data. Deities referred to by
+        the copy are the originals until relink is called.
+        """
+        new = object.__new__(type(self))
+        for name in self._all_slots:
+            value = getattr(self, name)
+            if type(value) is list:
+                value = list(value)
+            object.__setattr__(new, name, value)
+        object.__setattr__(new, 'watcher', None)
+        status = StatusEffect(new)
+        status.turns = list(self.status_effect.turns)
+        status.active = self.status_effect.active
+        object.__setattr__(new, 'status_effect', status)
+        return new
+
+    def relink(self, characters: Dict[int, Character]) -> None:
+        """
+        Swap the deities self refers to for the ones with the same id in
+        characters (used after cloning a game)
+        """
+        pass
+
+    def __setattr__(self, name, value):
+        # Changes are recorded while the game explores actions (deity_undo),
+        # private attributes change through a public property
+        watcher = self.watcher
+        if watcher is not None and watcher.undo_stack and name[0] != '_':
+            watcher.on_attribute(self, name)
+        object.__setattr__(self, name, value)
+
+    def __setstate__(self, state) -> None:
+        # copy and pickle put the slots back without telling the watcher
+        for name, value in state[1].items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def health(self) -> int:
+        return self._health
+
+    @health.setter
+    def health(self, health: int) -> None:
+        old = self._health
+        self._health = health
+        if self.watcher is not None:
+            self.watcher.on_health(self, old, health)
+
+    # Flags of what the deity did this turn, changes are reported to the
+    # watcher so the player's ready sets stay up to date
+    @property
+    def has_moved(self) -> bool:
+        return self._has_moved
+
+    @has_moved.setter
+    def has_moved(self, moved: bool) -> None:
+        self._has_moved = moved
+        if self.watcher is not None:
+            self.watcher.on_turn_flag(self)
+
+    @property
+    def has_attack(self) -> bool:
+        return self._has_attack
+
+    @has_attack.setter
+    def has_attack(self, attack: bool) -> None:
+        self._has_attack = attack
+        if self.watcher is not None:
+            self.watcher.on_turn_flag(self)
+
+    @property
+    def has_spell(self) -> bool:
+        return self._has_spell
+
+    @has_spell.setter
+    def has_spell(self, spell: bool) -> None:
+        self._has_spell = spell
+        if self.watcher is not None:
+            self.watcher.on_turn_flag(self)
+
     def take_damage(self, attacker: Character, game: Deity,
                     attacking_player: Player, damage: int = 1):
-        mother_love = self._check_mothers_love(attacker, game,
-                                               attacking_player, damage)
-        if not mother_love:
-            my_player = game.opponent(attacking_player)
-            self.passive_ability('take_damage_attack', my_player, game)
-
-            self.health -= damage
-            print(f'\n{attacker} attacked {self}')
-            if self.health > 0:
-                print(f'{self} has {self.health} health left\n')
-            else:
-                print(f'{self} is killed!!!\n')
-
-    def _check_mothers_love(self, attacker: Character, game,
-                            attacking_player, damage: int = 1) -> bool:
-        player = game.opponent(attacking_player)
-        for char in player.live_character():
-            if isinstance(char, (Isis_The_Mother, WIP_Isis_Guardian)):
-                coord = game.board.get_char_location(self)
-                adjacent = game.board.adjacent_tiles(coord)
-                isis_coord = game.board.get_char_location(char)
-                if isis_coord in adjacent:
-                    print(f'Isis Guardian is adjacent to {self}')
-                    while True:
-                        confirm = input(f'Do you want to use Isis passive, '
-                                        f'Mother’s Love, to take damage damage '
-                                        f'in place of {self} (y/n)? ')
-                        try:
-                            confirm = confirm.lower()
-                            assert confirm in ['y', 'n']
-                            break
-                        except (ValueError, AssertionError):
-                            print('Type y or n')
-                            continue
-                    if confirm == 'y':
-                        char.take_damage(attacker, game, attacking_player,
-                                         damage)
-                        return True
-                    elif confirm == 'n':
-                        return False
-        return False
+        deal_damage(game, attacking_player,
+                    [Damage(self, damage, attacker, 'attack')])
+
+    def retaliation(self, dis: int) -> Union[str, None]:
+        """
+        Return the name of the passive that hits back an attacker dis tiles
+        away for 1 damage, None if the attack is not retaliated
+        """
+        return None
 
     def __str__(self) -> str:
         return self.__class__.__name__.replace("_", " ")
@@ -97,29 +288,86 @@ class Character:
         info += f"      Range: {self.range}\n"
         info += f"      Class: {self.class_}\n"
         info += f"      Attribute: {self.attribute}\n"
-        effect = ''
-        for status in self.status_effect:
-            if self.status_effect[status] > 0:
-                effect += f'{status}, '
+        effect = ', '.join(self.status_effect.active_effects())
         if effect == '':
             info += f"      Status Effect: None\n"
         else:
-            info += f"      Status Effect: {effect[:-2]}\n"
+            info += f"      Status Effect: {effect}\n"
         return info
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        """
+        Return every faith ability action this character can use right now
+
+        :param p: Player owning this character
+        :param game: Game being played
+        :param discount: Faith discount for this use of the ability
+        :return: List of Faith actions
+        """
+        return []
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        """
+        Use the faith ability described by action (one of faith_options)
+
+        :param p: Player owning this character
+        :param game: Game being played
+        :param action: Faith action with the ability parameters
+        :param discount: Faith discount for this use of the ability
+        """
         raise NotImplementedError
 
+    def _enemy_targets(self, p: Player, game: Deity) -> List[Character]:
+        """
+        Return live enemy characters that faith abilities can target
+        """
+        targets = []
+        for char in game.opponent(p).live_character():
+            if not char.has_status('divine'):
+                targets.append(char)
+        return targets
+
+    def _free_tiles(self, char: Character, game: Deity,
+                    coords: List[Tuple]) -> List[Tuple]:
+        """
+        Return coordinates in coords char could be placed on (tile placed,
+        no character and terrain allowed for char)
+        """
+        free = []
+        for coord in coords:
+            tile = game.board.get_tile(coord)
+            if tile.character is None and check_tile_char_valid(char, tile):
+                free.append(coord)
+        return free
+
     def get_status_effects(self) -> List[str]:
-        total_effects = []
-        for effect in self.status_effect:
-            if self.status_effect[effect] > 0:
-                total_effects.append(effect)
-        return total_effects
+        return list(self.status_effect.active_effects())
+
+    def has_status(self, effect: str) -> bool:
+        """
+        Return True if effect has turns left on self
+        """
+        return self.status_effect.active & STATUS_BIT[effect] != 0
+
+    def has_any_status(self, mask: int) -> bool:
+        """
+        Return True if any effect in mask (STATUS_BIT values or'd together,
+        e.g. NO_ACTION_MASK) has turns left on self
+        """
+        return self.status_effect.active & mask != 0
 
     def passive_ability(self, time: str, p: Player, game: Deity) -> None:
         pass
 
+    def trigger_passive(self, time: str, p: Player, game: Deity) -> None:
+        """
+        Call passive_ability if self has a passive for time
+        """
+        if type(self) in PASSIVE_REGISTRY[time]:
+            self.passive_ability(time, p, game)
+
     def heal(self, amount: int) -> None:
         self.health += amount
         if self.health > self.max_health:
@@ -134,137 +382,116 @@ class Character:
 
 # === DEITY CLASSES ===
 class Melee(Character, ABC):
+    __slots__ = ()
+
     def __init__(self, id_, attribute=None):
         super().__init__(id_, 4, 1, 3, 'melee', attribute)
 
 
 class Ranged(Character, ABC):
+    __slots__ = ()
+
     def __init__(self, id_, attribute=None):
         super().__init__(id_, 3, 2, 2, 'range', attribute)
 
 
 class Support(Character, ABC):
+    __slots__ = ()
+    faith_description_1 = ''
+    faith_description_2 = ''
+
     def __init__(self, id_, attribute=None):
         super().__init__(id_, 3, 1, 2, 'support', attribute)
-        self.faith_description_1 = ''
-        self.faith_description_2 = ''
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        print(self.faith_description_1)
-        print(self.faith_description_2)
-
-        while True:
-            faith_id = input('Select faith ability to use '
-                             '(type 1, 2 or cancel): ')
-            if faith_id.lower() == 'cancel':
-                raise ReturnError
-
-            try:
-                faith_id = int(faith_id)
-                assert (faith_id == 1 or faith_id == 2)
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        return self.faith_options_1(p, game, discount) + \
+               self.faith_options_2(p, game, discount)
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        if action.ability == 1:
+            self.faith_ability_1(p, game, action, discount)
+        elif action.ability == 2:
+            self.faith_ability_2(p, game, action, discount)
+        else:
+            raise FaithAbilityError
 
-            except (ValueError, AssertionError):
-                print('Not valid faith ability')
-                continue
+    def faith_options_1(self, p: Player, game: Deity,
+                        discount: int = 0) -> List[Faith]:
+        return []
 
-            try:
-                if faith_id == 1:
-                    self.faith_ability_1(p, game, discount)
-                elif faith_id == 2:
-                    self.faith_ability_2(p, game, discount)
-                break
-            except (ReturnError, NotEnoughFaith):
-                continue
+    def faith_options_2(self, p: Player, game: Deity,
+                        discount: int = 0) -> List[Faith]:
+        return []
 
-    def faith_ability_1(self, p: Player, game: Deity, discount: int = 0):
+    def faith_ability_1(self, p: Player, game: Deity, action: Faith,
+                        discount: int = 0):
         raise NotImplementedError
 
-    def faith_ability_2(self, p: Player, game: Deity, discount: int = 0):
+    def faith_ability_2(self, p: Player, game: Deity, action: Faith,
+                        discount: int = 0):
         raise NotImplementedError
 
 
 # === DEITY CHARACTERS ===
 class Zeus_Philanderer(Melee, ABC):
-    def __init__(self, id_):
-        super().__init__(id_)
-        self.faith_description = '\nKidnapping (2 Faith)\n' \
-                                 'Zeus can kidnap any opposing unit at any ' \
-                                 'point on the map and move them to any ' \
-                                 'square adjacent to Zeus. Units that have ' \
-                                 'been kidnapped cannot attack on the ' \
-                                 'following turn. Zeus can only use Kidnap on ' \
-                                 'isolated targets: a target is isolated when ' \
-                                 'they are not standing directly adjacent to ' \
-                                 'any allied units.\n '
-        self.passive_description = '\nThe Chase:\nEnemy units starting a turn ' \
-                                   'next to Zeus only have one move ' \
-                                   'regardless of class or movement buffs.\n'
-
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        game.print()
-        print(self.faith_description)
+    __slots__ = ()
+    passive_triggers = frozenset({'start_turn'})
+    faith_description = '\nKidnapping (2 Faith)\n' \
+                        'Zeus can kidnap any opposing unit at any ' \
+                        'point on the map and move them to any ' \
+                        'square adjacent to Zeus. Units that have ' \
+                        'been kidnapped cannot attack on the ' \
+                        'following turn. Zeus can only use Kidnap on ' \
+                        'isolated targets: a target is isolated when ' \
+                        'they are not standing directly adjacent to ' \
+                        'any allied units.\n '
+    passive_description = '\nThe Chase:\nEnemy units starting a turn ' \
+                          'next to Zeus only have one move ' \
+                          'regardless of class or movement buffs.\n'
+
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
         faith_cost = 2 - discount
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
-            raise NotEnoughFaith
+            return []
 
         opponent = game.opponent(p)
-        targets = opponent.live_character()
-        while True:
-            for char in targets:
-                print(f'{char.id} - {char}')
-            deity_id = input('Pick enemy deity to target (type id or cancel): ')
-
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-            try:
-                char = opponent.character[int(deity_id)]
-                assert char in targets
-            except (ValueError, KeyError, AssertionError):
-                print('Not valid deity (please type id)')
-                continue
-
-            if 'divine' in char.get_status_effects():
-                print(f'{char} is divine and is immune to faith ability')
-                continue
-
-            coord = game.board.get_char_location(char)
-            adjacent = game.board.adjacent_tiles(coord)
-
-            for adj_coord in adjacent:
-                tile = game.board.get_tile(adj_coord)
-                if tile.character is not None:
-                    if tile.character.id in opponent.character.keys():
-                        print(f'{char} is not isolated')
-                        continue
-            break
-
         coord = game.board.get_char_location(self)
         adjacent = game.board.adjacent_tiles(coord)
-        game.print()
-        while True:
-            print(f'Adjacent tiles: {adjacent}')
-            new_coord = input(f'Pick an adjacent tile to place {char} '
-                              f'(type coordinate or cancel): ')
-            if new_coord.lower() == 'cancel':
-                raise ReturnError
-            try:
-                new_coord = turn_into_coordinate(new_coord)
-                tile = game.board.get_tile(new_coord)
-                assert new_coord in adjacent
-                if not check_tile_char_valid(char, tile):
-                    print(f'{char} cannot be placed on {tile.terrain} tile')
-                    raise NotValidMove
-                game.board.move_character(char, new_coord)
-                char.add_status_effect('disarmed', 1)
-                print(f'{char} is disarmed for 1 turn (cannot attack)')
-                p.faith -= faith_cost
-                print(f'{p.name} has {p.faith} faith left')
-                break
-            except (NotValidMove, AssertionError,
-                    ValueError, CharacterBlocking):
-                print('Not valid tile coordinate')
+        options = []
+        for char in self._enemy_targets(p, game):
+            if not self._is_isolated(char, opponent, game):
                 continue
+            for new_coord in self._free_tiles(char, game, adjacent):
+                options.append(Faith(self.id, 1, char.id, new_coord))
+        return options
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        faith_cost = 2 - discount
+        if p.faith < faith_cost:
+            raise NotEnoughFaith
+
+        char = game.opponent(p).character[action.target]
+        game.board.move_character(char, action.coord)
+        char.add_status_effect('disarmed', 1)
+        game.events.emit(StatusApplied, char, 'disarmed', 1)
+        p.change_faith(-faith_cost)
+
+    def _is_isolated(self, char: Character, opponent: Player,
+                     game: Deity) -> bool:
+        """
+        Return True if char is not standing adjacent to any of its allies
+        """
+        coord = game.board.get_char_location(char)
+        for adj_coord in game.board.adjacent_tiles(coord):
+            tile = game.board.get_tile(adj_coord)
+            if tile.character is not None and \
+                    tile.character.id in opponent.character.keys():
+                return False
+        return True
 
     def get_info(self):
         info = super().get_info()
@@ -278,113 +505,82 @@ class Zeus_Philanderer(Melee, ABC):
         if time != 'start_turn':
             return
         opponent = game.opponent(p)
-        if self in opponent.live_character():  # Check that it is enemy turn
+        if opponent.has_live_character(self):  # Check that it is enemy turn
             self_coord = game.board.get_char_location(self)
             adjacent = game.board.adjacent_tiles(self_coord)
             for char in p.live_character():
                 coord = game.board.get_char_location(char)
                 if coord in adjacent:
                     char.add_status_effect('grounded', 1)
-                    print(f'Zeus grounded {char} this turn')
+                    game.events.emit(StatusApplied, char, 'grounded', 1)
 
 
 class Isis_The_Mother(Support, ABC):
-    def __init__(self, id_):
-        super().__init__(id_)
-        self.faith_description_1 = '\n1. Call of the Wounded (0 Faith)\nWhen ' \
-                                   'an allied unit has 1 Health, Isis can ' \
-                                   'move directly adjacent to them regardless ' \
-                                   'of distance. '
-        self.faith_description_2 = '2. Divine Blessing (1 Faith)\nIsis ' \
-                                   'heals 1 Health to all adjacent ' \
-                                   'characters.\n '
-        self.passive_description = '\nMother’s Love:\nIsis can choose to take ' \
-                                   'the damage of any standard melee or ' \
-                                   'ranged attacks in place of any allied ' \
-                                   'units standing adjacent to Isis.\n '
-
-    def faith_ability_1(self, p: Player, game: Deity, discount: int = 0):
+    __slots__ = ()
+    faith_description_1 = '\n1. Call of the Wounded (0 Faith)\nWhen ' \
+                          'an allied unit has 1 Health, Isis can ' \
+                          'move directly adjacent to them regardless ' \
+                          'of distance. '
+    faith_description_2 = '2. Divine Blessing (1 Faith)\nIsis ' \
+                          'heals 1 Health to all adjacent ' \
+                          'characters.\n '
+    passive_description = '\nMother’s Love:\nIsis can choose to take ' \
+                          'the damage of any standard melee or ' \
+                          'ranged attacks in place of any allied ' \
+                          'units standing adjacent to Isis.\n '
+
+    def faith_options_1(self, p: Player, game: Deity,
+                        discount: int = 0) -> List[Faith]:
         faith_cost = 0 - discount
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
-            raise NotEnoughFaith
-        game.print()
+            return []
 
-        one_health = []
-        one_health_str = ''
+        options = []
         for char in p.live_character():
             if char.health == 1 and char != self:
-                one_health_str += f"{char.id} - {char}      "
-                one_health.append(char)
-        if len(one_health) == 0:
-            print('No allied deity with 1 health')
-            raise ReturnError
-        print('Allied deity with 1 health:')
-        print(one_health_str)
-        while True:
-            deity_id = input("Choose allied deity to move to (type id or "
-                             "cancel): ")
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-
-            try:
-                char = p.character[int(deity_id)]
-                assert char in one_health
-                break
-            except (ValueError, KeyError, AssertionError):
-                print('Not valid deity id')
-                continue
+                coord = game.board.get_char_location(char)
+                adjacent = game.board.adjacent_tiles(coord)
+                for new_coord in self._free_tiles(self, game, adjacent):
+                    options.append(Faith(self.id, 1, char.id, new_coord))
+        return options
 
-        coord = game.board.get_char_location(char)
-        adjacent = game.board.adjacent_tiles(coord)
-        game.print()
-        print(f'Adjacent coordinates to {char}: {adjacent}')
-        while True:
-            coord = input(f'Choose coordinate to move {self} (type coordinate '
-                          f'or cancel): ')
-            if coord.lower() == 'cancel':
-                raise ReturnError
-            try:
-                coord = turn_into_coordinate(coord)
-                tile = game.board.get_tile(coord)
-                assert check_tile_char_valid(self, tile)
-                assert coord in adjacent
-
-                game.board.move_character(self, coord)
-                game.print()
-                p.faith -= faith_cost
-                print(f'{p.name} has {p.faith} faith left')
-                break
-
-            except (
-                    ValueError, AssertionError, NotValidMove,
-                    CharacterBlocking):
-                game.print()
-                print('Not valid coordinate')
-                continue
+    def faith_options_2(self, p: Player, game: Deity,
+                        discount: int = 0) -> List[Faith]:
+        faith_cost = 1 - discount
+        if p.faith < faith_cost:
+            return []
+        return [Faith(self.id, 2)]
 
-    def faith_ability_2(self, p: Player, game: Deity, discount: int = 0):
+    def faith_ability_1(self, p: Player, game: Deity, action: Faith,
+                        discount: int = 0):
+        faith_cost = 0 - discount
+        if p.faith < faith_cost:
+            raise NotEnoughFaith
+
+        game.board.move_character(self, action.coord)
+        p.change_faith(-faith_cost)
+
+    def faith_ability_2(self, p: Player, game: Deity, action: Faith,
+                        discount: int = 0):
         faith_cost = 1 - discount
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        print('')
         curr_coord = game.board.get_char_location(self)
         adjacent_coord = game.board.adjacent_tiles(curr_coord)
         heal_char = []
         for coord in adjacent_coord:
             t = game.board.get_tile(coord)
-            if t.character is not None and t.character in p.live_character():
+            if t.character is not None and p.has_live_character(t.character):
                 char = t.character
                 if char.health < char.max_health:
                     char.health += 1
-                    print(f'{char} healed for 1 health')
+                    game.events.emit(Healed, char, char.health)
                     heal_char.append(char)
         if len(heal_char) == 0:
-            print(f"{self} used Divine Blessing but wasn't able to heal anyone")
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+            game.events.emit(Narration, "{} used Divine Blessing but wasn't "
+                                        "able to heal anyone", (self,))
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -397,179 +593,106 @@ class Isis_The_Mother(Support, ABC):
 
 
 class Asclepius_God_of_Medicine(Support, ABC):
-    def __init__(self, id_):
-        super().__init__(id_)
-
-        self.faith_description_1 = '\n1. Divine Blessing (1 faith)\nAsclepius ' \
-                                   'heals an allied unit for 1 health within ' \
-                                   '2 range.'
-        self.faith_description_2 = '2. Pharmacist (1 Faith)\nAsclepius ' \
-                                   'cleanses an allied unit afflicted by a ' \
-                                   'status effect.'
-        self.faith_description_3 = '3. Against the Order (3 Faith)\nAsclepius ' \
-                                   'resurrects a dead allied unit with 2 ' \
-                                   'Health. The resurrected unit will be ' \
-                                   'spawn on one of the base tiles. '
-
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        print("\n" + self.faith_description_1)
-        print(self.faith_description_2)
-        print(self.faith_description_3)
-
-        while True:
-            faith_id = input('Select faith ability to use '
-                             '(type 1, 2, 3 or cancel): ')
-            if faith_id.lower() == 'cancel':
-                raise ReturnError
-
-            try:
-                faith_id = int(faith_id)
-                assert faith_id in [1, 2, 3]
-
-            except (ValueError, AssertionError):
-                print('Not valid faith ability')
-                continue
-
-            try:
-                if faith_id == 1:
-                    self.faith_ability_1(p, game, discount)
-                elif faith_id == 2:
-                    self.faith_ability_2(p, game, discount)
-                elif faith_id == 3:
-                    self.faith_ability_3(p, game, discount)
-                break
-            except (ReturnError, NotEnoughFaith, FaithAbilityError):
-                continue
+    __slots__ = ()
+    faith_description_1 = '\n1. Divine Blessing (1 faith)\nAsclepius ' \
+                          'heals an allied unit for 1 health within ' \
+                          '2 range.'
+    faith_description_2 = '2. Pharmacist (1 Faith)\nAsclepius ' \
+                          'cleanses an allied unit afflicted by a ' \
+                          'status effect.'
+    faith_description_3 = '3. Against the Order (3 Faith)\nAsclepius ' \
+                          'resurrects a dead allied unit with 2 ' \
+                          'Health. The resurrected unit will be ' \
+                          'spawn on one of the base tiles. '
+
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        return super().faith_options(p, game, discount) + \
+               self.faith_options_3(p, game, discount)
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        if action.ability == 3:
+            self.faith_ability_3(p, game, action, discount)
+        else:
+            super().faith_ability(p, game, action, discount)
 
-    def faith_ability_1(self, p: Player, game: Deity, discount: int = 0):
+    def faith_options_1(self, p: Player, game: Deity,
+                        discount: int = 0) -> List[Faith]:
         faith_cost = 1 - discount
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
-            raise NotEnoughFaith
+            return []
 
-        nearby_char = p.live_character()
-        nearby_char.remove(self)
+        options = []
         curr_coord = game.board.get_char_location(self)
-        for char in nearby_char:
+        for char in p.live_character():
             coord = game.board.get_char_location(char)
-            if distance(coord, curr_coord) > 2:
-                nearby_char.remove(char)
+            if char != self and distance(coord, curr_coord) <= 2:
+                options.append(Faith(self.id, 1, char.id))
+        return options
 
-        if len(nearby_char) == 0:
-            print('No nearby allied deity')
-            raise FaithAbilityError
-        game.print()
-        print('Nearby allies that can be healed (2 tiles away)')
-        for char in nearby_char:
-            print(
-                f'{char.id} - {char}(Health: {char.health}/{char.max_health})      ')
-        while True:
-            deity_id = input('Choose deity to heal by 2 (type id or cancel): ')
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-            try:
-                char_heal = p.character[int(deity_id)]
-                assert char_heal in nearby_char
-                break
-            except (ValueError, AssertionError):
-                print('Not valid deity id')
-                continue
+    def faith_options_2(self, p: Player, game: Deity,
+                        discount: int = 0) -> List[Faith]:
+        faith_cost = 1 - discount
+        if p.faith < faith_cost:
+            return []
+
+        options = []
+        for char in p.live_character():
+            if char.get_status_effects():
+                options.append(Faith(self.id, 2, char.id))
+        return options
+
+    def faith_options_3(self, p: Player, game: Deity,
+                        discount: int = 0) -> List[Faith]:
+        faith_cost = 3 - discount
+        if p.faith < faith_cost:
+            return []
+
+        options = []
+        base = game.board.get_base_tile(p.number)
+        for char in p.dead_character():
+            for coord in base:
+                if game.board.get_tile(coord).character is None:
+                    options.append(Faith(self.id, 3, char.id, coord))
+        return options
+
+    def faith_ability_1(self, p: Player, game: Deity, action: Faith,
+                        discount: int = 0):
+        faith_cost = 1 - discount
+        if p.faith < faith_cost:
+            raise NotEnoughFaith
+
+        char_heal = p.character[action.target]
         char_heal.health += 2
         if char_heal.health > char_heal.max_health:
             char_heal.health = char_heal.max_health
-        print(f'{char_heal} is healed to {char_heal.health}')
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+        game.events.emit(Healed, char_heal, char_heal.health)
+        p.change_faith(-faith_cost)
 
-    def faith_ability_2(self, p: Player, game: Deity, discount: int = 0):
+    def faith_ability_2(self, p: Player, game: Deity, action: Faith,
+                        discount: int = 0):
         faith_cost = 1 - discount
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        status_str = ''
-        for char in p.live_character():
-            if char.get_status_effects():
-                status_str += f'{char.id} - {char} {char.get_status_effects()}'
-        if status_str == '':
-            print('No allied deity has status effect')
-            raise FaithAbilityError
-        game.print()
-        print('Allied deity with status effects')
-        print(status_str)
-
-        while True:
-            deity_id = input('Choose deity to cleanse status effect (type id '
-                             'or cancel): ')
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-            try:
-                char = p.character[int(deity_id)]
-                assert char.get_status_effects() != []
-                for effect in char.status_effect:
-                    char.status_effect[effect] = 0
-                assert char.get_status_effects() == []
-                print(f'{char} has been cleansed of its status effect(s)')
-                p.faith -= faith_cost
-                print(f'{p.name} has {p.faith} faith left')
-                break
-            except (ValueError, AssertionError, KeyError):
-                game.print()
-                print('Not valid deity id')
-                continue
+        char = p.character[action.target]
+        for effect in char.status_effect:
+            char.status_effect[effect] = 0
+        game.events.emit(StatusCleansed, char)
+        p.change_faith(-faith_cost)
 
-    def faith_ability_3(self, p: Player, game: Deity, discount: int = 0):
+    def faith_ability_3(self, p: Player, game: Deity, action: Faith,
+                        discount: int = 0):
         faith_cost = 3 - discount
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        dead_char = p.dead_character()
-        if len(dead_char) == 0:
-            print('No dead deity to revive')
-            raise FaithAbilityError
-
-        dead_str = ''
-        for char in dead_char:
-            dead_str += f'{char.id} - {char}    '
-
-        game.print()
-        print('\nDead allied deities:')
-        print(dead_str)
-
-        while True:
-            deity_id = input('Choose deity to revive (type id or cancel): ')
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-            try:
-                char = p.character[int(deity_id)]
-                assert char in dead_char
-                break
-            except (ValueError, AssertionError, KeyError):
-                game.print()
-                print('Not valid deity id')
-                continue
-
-        game.print()
-        base = game.board.get_base_tile(p.number)
-        print(f'Base tile: {base}')
-        while True:
-            coord = input('Choose base tile to spawn deity (type coordinates '
-                          'or cancel): ')
-            if coord.lower() == 'cancel':
-                raise ReturnError
-            try:
-                coord = turn_into_coordinate(coord)
-                game.board.spawn_character(char, coord, p.number)
-                char.health = 2
-                print(f'{char} has been revived!')
-                p.faith -= faith_cost
-                print(f'{p.name} has {p.faith} faith left')
-                break
-            except(ValueError, NotValidSpawn, TileAlreadyHaveCharacter):
-                game.print()
-                print('Not valid spawn point')
-                continue
+        char = p.character[action.target]
+        game.board.spawn_character(char, action.coord, p.number)
+        char.health = 2
+        game.events.emit(Revived, char)
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -581,61 +704,48 @@ class Asclepius_God_of_Medicine(Support, ABC):
 
 
 class Hermes_Patron_of_Thieves(Melee, ABC):
+    __slots__ = ()
+    faith_description = "\nSteal (0 Faith):\nIf Hermes is adjacent to " \
+                        "an opposing unit, he may steal one faith. " \
+                        "Only works if the opponent has at least one " \
+                        "faith. Hermes can not perform any actions " \
+                        "on the following turn. "
+    passive_description = '\nWinged Boots\nHermes is flying: Can ' \
+                          'walk on all forms of terrain. Cannot use ' \
+                          'forts.\n'
+
     def __init__(self, id_):
         super().__init__(id_, 'flight')
-        self.faith_description = "\nSteal (0 Faith):\nIf Hermes is adjacent to " \
-                                 "an opposing unit, he may steal one faith. " \
-                                 "Only works if the opponent has at least one " \
-                                 "faith. Hermes can not perform any actions " \
-                                 "on the following turn. "
-        self.passive_description = '\nWinged Boots\nHermes is flying: Can ' \
-                                   'walk on all forms of terrain. Cannot use ' \
-                                   'forts.\n'
-
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
+
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
         faith_cost = 0 - discount
-        game.print()
-        print(self.faith_description)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
-            raise NotEnoughFaith
+            return []
 
         opponent = game.opponent(p)
         if opponent.faith == 0:
-            print('Opponent has no faith to steal')
-            raise FaithAbilityError
+            return []
 
         curr_coord = game.board.get_char_location(self)
         adjacent = game.board.adjacent_tiles(curr_coord)
-        adjacent_char = False
         for coord in adjacent:
             t = game.board.get_tile(coord)
-            if t.character is not None and t.character in opponent.live_character():
-                adjacent_char = True
+            if t.character is not None and opponent.has_live_character(t.character):
+                return [Faith(self.id)]
+        return []
 
-        if not adjacent_char:
-            print('No adjacent opposing deity to steal from')
-            raise FaithAbilityError
-
-        while True:
-            confirm = input(f'\nSteal 1 faith from {opponent.name} (y/n)? ')
-            try:
-                confirm = confirm.lower()
-                assert confirm in ['y', 'n']
-                break
-            except AssertionError:
-                print('Not valid answer')
-                continue
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        faith_cost = 0 - discount
+        if p.faith < faith_cost:
+            raise NotEnoughFaith
 
-        if confirm == 'n':
-            raise ReturnError
-        opponent.faith -= 1
-        p.faith -= faith_cost
+        opponent = game.opponent(p)
+        opponent.change_faith(-1)
         self.add_status_effect('stun', 2)
-        print(f"{opponent.name}'s faith reduced to {opponent.faith}")
-        print(f"Hermes is stun and won't be able to perform any "
-              f"actions for the rest of this turn and the next")
-        print(f'{p.name} has {p.faith} faith left')
+        game.events.emit(StatusApplied, self, 'stun', 2)
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -647,53 +757,44 @@ class Hermes_Patron_of_Thieves(Melee, ABC):
 
 
 class Neith_The_Huntress(Ranged, ABC):
+    __slots__ = ('casted_faith_ability',)
+    faith_description_1 = "\nDeep Breathing (2 Faith):\nNeith gains " \
+                          "one attack range. [Neith can perform deep " \
+                          "breathing again to gain one more attack " \
+                          "range at the cost of 1 faith]"
+    faith_description_2 = "\nDeep Breathing (1 Faith):\nNeith can " \
+                          "perform deep breathing again to gain one " \
+                          "more attack range] "
+    passive_description = '\nHunter’s Volley:\nNeith can perform the ' \
+                          'attack action option twice in a single ' \
+                          'turn at the cost of the player’s team ' \
+                          'being unable to perform any other ' \
+                          'options\n '
+
     def __init__(self, id_):
         super().__init__(id_)
-        self.faith_description_1 = "\nDeep Breathing (2 Faith):\nNeith gains " \
-                                   "one attack range. [Neith can perform deep " \
-                                   "breathing again to gain one more attack " \
-                                   "range at the cost of 1 faith]"
-        self.faith_description_2 = "\nDeep Breathing (1 Faith):\nNeith can " \
-                                   "perform deep breathing again to gain one " \
-                                   "more attack range] "
         self.casted_faith_ability = False
-        self.passive_description = '\nHunter’s Volley:\nNeith can perform the ' \
-                                   'attack action option twice in a single ' \
-                                   'turn at the cost of the player’s team ' \
-                                   'being unable to perform any other ' \
-                                   'options\n '
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        if not self.casted_faith_ability:
-            faith_cost = 2 - discount
-            game.print()
-            print(self.faith_description_1)
-        else:
-            faith_cost = 1 - discount
-            game.print()
-            print(self.faith_description_2)
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < self._faith_cost(discount):
+            return []
+        return [Faith(self.id)]
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        faith_cost = self._faith_cost(discount)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        while True:
-            confirm = input(f'\nUse {faith_cost} faith to increase Neith '
-                            f'range by 1 (y/n)? ')
-            try:
-                confirm = confirm.lower()
-                assert confirm in ['y', 'n']
-                break
-            except AssertionError:
-                print('Not valid answer')
-                continue
-
-        if confirm == 'n':
-            raise ReturnError
-
-        p.faith -= faith_cost
         self.range += 1
         self.casted_faith_ability = True
-        print(f'{p.name} has {p.faith} faith left')
+        p.change_faith(-faith_cost)
+
+    def _faith_cost(self, discount: int = 0) -> int:
+        if not self.casted_faith_ability:
+            return 2 - discount
+        return 1 - discount
 
     def get_info(self):
         info = super().get_info()
@@ -711,66 +812,49 @@ class Neith_The_Huntress(Ranged, ABC):
 
 
 class Neptune_Earthshaker(Ranged, ABC):
+    __slots__ = ()
+    stun_terrain = ('cloud', 'water', 'fort')  # Earthquake stuns near these
+    faith_description = '\nEarthquake (3 faith):\nAll enemy units on ' \
+                        'the board take 1 damage, enemies standing ' \
+                        'on or adjacent to a water, fort or cloud ' \
+                        'tile are stunned for 1 turn. Stunned units ' \
+                        'are unable to move, attack or perform faith ' \
+                        'abilities. This ability does not affect ' \
+                        'flying units. This ability’s stun effect ' \
+                        'can be cleansed. '
+    passive_description = '\nMuddy Waters:\nNeptune is Aquatic: Can ' \
+                          'enter water tiles. Water tiles can be ' \
+                          'consumed and reduces the faith cost of ' \
+                          'active attacks by 1. Water tiles become ' \
+                          'blank tiles after they are consumed\n '
+
     def __init__(self, id_):
         super().__init__(id_, 'aquatic')
-        self.faith_description = '\nEarthquake (3 faith):\nAll enemy units on ' \
-                                 'the board take 1 damage, enemies standing ' \
-                                 'on or adjacent to a water, fort or cloud ' \
-                                 'tile are stunned for 1 turn. Stunned units ' \
-                                 'are unable to move, attack or perform faith ' \
-                                 'abilities. This ability does not affect ' \
-                                 'flying units. This ability’s stun effect ' \
-                                 'can be cleansed. '
-        self.passive_description = '\nMuddy Waters:\nNeptune is Aquatic: Can ' \
-                                   'enter water tiles. Water tiles can be ' \
-                                   'consumed and reduces the faith cost of ' \
-                                   'active attacks by 1. Water tiles become ' \
-                                   'blank tiles after they are consumed\n '
-
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
+
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < 3 - discount:
+            return []
+        return [Faith(self.id)]
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
         faith_cost = 3 - discount
-        game.print()
-        print(self.faith_description)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        while True:
-            confirm = input(f'\nUse Earthquake (y/n): ')
-            try:
-                confirm = confirm.lower()
-                assert confirm in ['y', 'n']
-                break
-            except AssertionError:
-                print('Not valid answer')
-                continue
-
-        if confirm == 'n':
-            raise ReturnError
-
-        opponent = game.opponent(p)
-        for char in opponent.live_character():
-            if char.attribute == 'flight':
-                continue
-            elif 'divine' in char.get_status_effects():
-                continue
-            char.passive_ability('take_damage_spell', p, game)
-            char.health -= 1
-            print(f'{char} takes 1 damage')
-
+        targets = [char for char in self._enemy_targets(p, game)
+                   if char.attribute != 'flight']
+        stun_area = game.board.nearby_bits(self.stun_terrain)
+        for char in targets:
             curr_coord = game.board.get_char_location(char)
-            adjacent = game.board.adjacent_tiles(curr_coord)
-            adjacent.append(curr_coord)
-            for coord in adjacent:
-                tile = game.board.get_tile(coord)
-                if tile.terrain in ['cloud', 'water', 'fort']:
-                    char.add_status_effect('stun', 1)
-                    print(f'{char} is stunned for 1 turn '
-                          f'(cannot make action)')
-                    break
-
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+            if game.board.coord_in(curr_coord, stun_area):
+                char.add_status_effect('stun', 1)
+                game.events.emit(StatusApplied, char, 'stun', 1)
+        deal_damage(game, p, [Damage(char, 1, self, 'spell')
+                              for char in targets])
+
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -782,58 +866,52 @@ class Neptune_Earthshaker(Ranged, ABC):
 
 
 class Amaterasu_Warrior_of_Light(Melee, ABC):
+    __slots__ = ()
+    faith_description = '\nPiercing Light (2 Faith):\nAmaterasu fires ' \
+                        'a beam of light in one direction damaging ' \
+                        'all enemy units in a line between herself ' \
+                        'and the edge of the board by 1. This ' \
+                        'ability cannot be used diagonally. '
+    passive_description = '\nShining Blade:\nAmaterasu attacks have ' \
+                          '+1 range.\n '
+
     def __init__(self, id_):
         super().__init__(id_)
         self.range += 1  # Passive ability
 
-        self.faith_description = '\nPiercing Light (2 Faith):\nAmaterasu fires ' \
-                                 'a beam of light in one direction damaging ' \
-                                 'all enemy units in a line between herself ' \
-                                 'and the edge of the board by 1. This ' \
-                                 'ability cannot be used diagonally. '
-        self.passive_description = '\nShining Blade:\nAmaterasu attacks have ' \
-                                   '+1 range.\n '
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < 2 - discount:
+            return []
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
+        options = []
+        coord = game.board.get_char_location(self)
+        for direction in ['left', 'right', 'up', 'down']:
+            if game.board.possible_tile(get_next_coord(coord, direction)):
+                options.append(Faith(self.id, direction=direction))
+        return options
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
         faith_cost = 2 - discount
-        game.print()
-        print(self.faith_description)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        while True:
-            direction = input(f'\nWhich direction to fire Piercing Light ('
-                              f'left, right, up, down or cancel)? ')
-            try:
-                direction = direction.lower()
-                assert direction in ['left', 'right', 'up', 'down', 'cancel']
-                break
-            except AssertionError:
-                print('Not valid answer')
-                continue
-
-        if direction == 'cancel':
-            raise ReturnError
-
+        direction = action.direction
         opponent = game.opponent(p)
         coord = game.board.get_char_location(self)
 
+        damages = []
         curr_coord = get_next_coord(coord, direction)
         while game.board.possible_tile(curr_coord):
             t = game.board.get_tile(curr_coord)
             if t.character is not None and \
-                    t.character in opponent.live_character():
-                if 'divine' in t.character.get_status_effects():
-                    curr_coord = get_next_coord(curr_coord, direction)
-                    continue
-                t.character.health -= 1
-                t.character.passive_ability('take_damage_spell', p, game)
-                print(f'{t.character} took 1 damage')
+                    opponent.has_live_character(t.character):
+                damages.append(Damage(t.character, 1, self, 'spell'))
             curr_coord = get_next_coord(curr_coord, direction)
+        deal_damage(game, p, damages)
 
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -845,58 +923,49 @@ class Amaterasu_Warrior_of_Light(Melee, ABC):
 
 
 class Isis_Goddess_of_Magic(Ranged, ABC):
+    __slots__ = ('casted_faith_ability',)
+    faith_description_1 = "\nMetamorphmagus (2 Faith):\nIsis unlocks " \
+                          "her ability to transform and shapeshift " \
+                          "for the remainder of the game. Isis " \
+                          "permanently gains +1 movement and becomes " \
+                          "mobile: mobile units can walk on any " \
+                          "terrain tiles. [Anytime Isis uses " \
+                          "metamorphmagus after the first time, " \
+                          "Isis gains one movement at cost one 1 " \
+                          "faith.]\n"
+    faith_description_2 = "\nMetamorphmagus (1 Faith):\nIsis unlocks " \
+                          "her ability to transform and shapeshift " \
+                          "for the remainder of the game. Isis " \
+                          "permanently gains +1 movement\n"
+    passive_description = '\nRoyal Authority:\nIsis has +1 attack ' \
+                          'range.\n '
+
     def __init__(self, id_):
         super().__init__(id_)
         self.range += 1
-        self.faith_description_1 = "\nMetamorphmagus (2 Faith):\nIsis unlocks " \
-                                   "her ability to transform and shapeshift " \
-                                   "for the remainder of the game. Isis " \
-                                   "permanently gains +1 movement and becomes " \
-                                   "mobile: mobile units can walk on any " \
-                                   "terrain tiles. [Anytime Isis uses " \
-                                   "metamorphmagus after the first time, " \
-                                   "Isis gains one movement at cost one 1 " \
-                                   "faith.]\n"
-        self.faith_description_2 = "\nMetamorphmagus (1 Faith):\nIsis unlocks " \
-                                   "her ability to transform and shapeshift " \
-                                   "for the remainder of the game. Isis " \
-                                   "permanently gains +1 movement\n"
         self.casted_faith_ability = False
-        self.passive_description = '\nRoyal Authority:\nIsis has +1 attack ' \
-                                   'range.\n '
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        if not self.casted_faith_ability:
-            faith_cost = 2 - discount
-            game.print()
-            print(self.faith_description_1)
-        else:
-            faith_cost = 1 - discount
-            game.print()
-            print(self.faith_description_2)
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < self._faith_cost(discount):
+            return []
+        return [Faith(self.id)]
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        faith_cost = self._faith_cost(discount)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        while True:
-            confirm = input(f'\nUse {faith_cost} faith to increase Isis '
-                            f'movement by 1 and become mobile (y/n)? ')
-            try:
-                confirm = confirm.lower()
-                assert confirm in ['y', 'n']
-                break
-            except AssertionError:
-                print('Not valid answer')
-                continue
-
-        if confirm == 'n':
-            raise ReturnError
-
         self.add_status_effect('mobile', float('inf'))
-        p.faith -= faith_cost
         self.movement += 1
         self.casted_faith_ability = True
-        print(f'{p.name} has {p.faith} faith left')
+        p.change_faith(-faith_cost)
+
+    def _faith_cost(self, discount: int = 0) -> int:
+        if not self.casted_faith_ability:
+            return 2 - discount
+        return 1 - discount
 
     def get_info(self):
         info = super().get_info()
@@ -908,41 +977,49 @@ class Isis_Goddess_of_Magic(Ranged, ABC):
 
 
 class Odin_The_Wise(Support, ABC):
-    def __init__(self, id_):
-        super().__init__(id_)
-        self.faith_description_1 = "\n1. Well of Urðr (1 Health):\nGain one " \
-                                   "faith. "
-        self.faith_description_2 = "2. An Eye for an Eye (1 Health):\nYour " \
-                                   "opponent loses one faith. "
-        self.passive_description = '\nRavenclaw:\nEnemy units that attack ' \
-                                   'Odin within one range will lose 1 hp from ' \
-                                   'retaliatory damage. This ability does not ' \
-                                   'work for faith attacks. Faith ability ' \
-                                   'uses health instead.\n'  # TODO update passive description
-
-    def faith_ability_1(self, p: Player, game: Deity, discount: int = 0):
+    __slots__ = ()
+    faith_description_1 = "\n1. Well of Urðr (1 Health):\nGain one " \
+                          "faith. "
+    faith_description_2 = "2. An Eye for an Eye (1 Health):\nYour " \
+                          "opponent loses one faith. "
+    passive_description = '\nRavenclaw:\nEnemy units that attack ' \
+                          'Odin within one range will lose 1 hp from ' \
+                          'retaliatory damage. This ability does not ' \
+                          'work for faith attacks. Faith ability ' \
+                          'uses health instead.\n'  # TODO update passive description
+
+    def faith_options_1(self, p: Player, game: Deity,
+                        discount: int = 0) -> List[Faith]:
+        if self.health < 1 - discount:
+            return []
+        return [Faith(self.id, 1)]
+
+    def faith_options_2(self, p: Player, game: Deity,
+                        discount: int = 0) -> List[Faith]:
+        if self.health < 1 - discount:
+            return []
+        return [Faith(self.id, 2)]
+
+    def faith_ability_1(self, p: Player, game: Deity, action: Faith,
+                        discount: int = 0):
         faith_cost = 1 - discount
         if self.health < faith_cost:
-            print(f'Not enough health to use faith '
-                  f'ability (cost {faith_cost} health)')
             raise NotEnoughFaith
 
         self.health -= faith_cost
-        p.faith += 1
-        print(f'{self} took {faith_cost} damage and gained 1 faith')
+        game.events.emit(Damaged, self, faith_cost, self.health)
+        p.change_faith(1)
 
-    def faith_ability_2(self, p: Player, game: Deity, discount: int = 0):
+    def faith_ability_2(self, p: Player, game: Deity, action: Faith,
+                        discount: int = 0):
         faith_cost = 1 - discount
         if self.health < faith_cost:
-            print(f'Not enough health to use faith '
-                  f'ability (cost {faith_cost} health)')
             raise NotEnoughFaith
 
         opponent = game.opponent(p)
         self.health -= faith_cost
-        opponent.faith -= 1
-        print(f"{self} took {faith_cost} damage and "
-              f"stole 1 of {opponent.name}'s faith")
+        game.events.emit(Damaged, self, faith_cost, self.health)
+        opponent.change_faith(-1)
 
     def get_info(self):
         info = super().get_info()
@@ -953,85 +1030,45 @@ class Odin_The_Wise(Support, ABC):
         info += '\n' + self.faith_description_2
         return info
 
-    def take_damage(self, attacker: Character, game: Deity,
-                    attacking_player: Player, damage: int = 1):
-        mother_love = self._check_mothers_love(attacker, game,
-                                               attacking_player, damage)
-        if not mother_love:
-            self.health -= damage
-            print(f'\n{attacker} attacked {self}')
-
-            # Passive Ability (Ravenclaw)
-            attacker_coord = game.board.get_char_location(attacker)
-            self_coord = game.board.get_char_location(self)
-            dis = distance(attacker_coord, self_coord)
-            if dis <= 1:
-                attacker.health -= 1
-                attacker.passive_ability('take_damage_attack',
-                                         attacking_player, game)
-                print(f'Odin uses Ravenclaw and retaliated 1 '
-                      f'damage to {attacker}')
-                if attacker.health > 0:
-                    print(f'{attacker} has {attacker.health} health left')
-                else:
-                    print(f'{attacker} is killed!!!')
-
-            if self.health > 0:
-                print(f'{self} has {self.health} health left\n')
-            else:
-                print(f'{self} is killed!!!\n')
+    def retaliation(self, dis: int) -> Union[str, None]:
+        # Passive Ability (Ravenclaw)
+        return 'Ravenclaw' if dis <= 1 else None
 
 
 class Zeus_God_of_Thunder(Ranged, ABC):
+    __slots__ = ()
+    faith_description = '\nMaster Bolt (1 Faith):\nZeus calls upon ' \
+                        'his master bolt and can strike any opposing ' \
+                        'unit at any place on the map for 1 damage. ' \
+                        'Cannot be used on an opponent with 1 ' \
+                        'Health.\n '
+    passive_description = '\nOn the Clouds:\nZeus is flying: Can ' \
+                          'walk on all forms of terrain. Cannot use ' \
+                          'forts.\n '
+
     def __init__(self, id_):
         super().__init__(id_, 'flight')
-        self.faith_description = '\nMaster Bolt (1 Faith):\nZeus calls upon ' \
-                                 'his master bolt and can strike any opposing ' \
-                                 'unit at any place on the map for 1 damage. ' \
-                                 'Cannot be used on an opponent with 1 ' \
-                                 'Health.\n '
-        self.passive_description = '\nOn the Clouds:\nZeus is flying: Can ' \
-                                   'walk on all forms of terrain. Cannot use ' \
-                                   'forts.\n '
-
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        game.print()
-        print(self.faith_description)
-        faith_cost = 1 - discount
-        if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
-            raise NotEnoughFaith
 
-        opponent = game.opponent(p)
-        targets = opponent.live_character()
-        while True:
-            for char in targets:
-                print(f'{char.id} - {char}')
-            deity_id = input('Pick enemy deity to target (type id or cancel): ')
-
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-            try:
-                char = opponent.character[int(deity_id)]
-                assert char in targets
-            except (ValueError, KeyError, AssertionError):
-                print('Not valid deity (please type id)')
-                continue
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < 1 - discount:
+            return []
 
-            if 'divine' in char.get_status_effects():
-                print(f'{char} is divine and is immune to faith ability')
-                continue
+        options = []
+        for char in self._enemy_targets(p, game):
+            if char.health != 1:
+                options.append(Faith(self.id, target=char.id))
+        return options
 
-            if char.health == 1:
-                print('Cannot pick target with 1 health')
-                continue
-            break
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        faith_cost = 1 - discount
+        if p.faith < faith_cost:
+            raise NotEnoughFaith
 
-        char.health -= 1
-        char.passive_ability('take_damage_spell', p, game)
-        print(f'Zeus master bolt hit {char} for 1 damage')
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+        char = game.opponent(p).character[action.target]
+        deal_damage(game, p, [Damage(char, 1, self, 'spell')])
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -1043,65 +1080,56 @@ class Zeus_God_of_Thunder(Ranged, ABC):
 
 
 class Hermes_Messenger_of_the_Gods(Support, ABC):
+    __slots__ = ('casted_faith_ability',)
+    passive_triggers = frozenset({'start_turn'})
+    faith_description_1 = '\nTailwind (3 Faith)\nAll your units become ' \
+                          'mobile, mobile units can move onto any ' \
+                          'terrain types. [Anytime tailwind is used a ' \
+                          'second time, all allied units gain +1 ' \
+                          'movement at the cost of 2 faith.]\n '
+    faith_description_2 = "\nTailwind (2 Faith)\nAll allied units " \
+                          "gain +1 movement\n"
+    passive_description_1 = '\n1. Winged boots\nHermes is flying: Can ' \
+                            'walk on all forms of terrain. Cannot use ' \
+                            'forts.\n '
+    passive_description_2 = '2. Traveller\nAny allied gods have ' \
+                            'one extra movement of starting a turn ' \
+                            'next to Hermes.\n'
+
     def __init__(self, id_):
         super().__init__(id_, 'flight')
-        self.faith_description_1 = '\nTailwind (3 Faith)\nAll your units become ' \
-                                   'mobile, mobile units can move onto any ' \
-                                   'terrain types. [Anytime tailwind is used a ' \
-                                   'second time, all allied units gain +1 ' \
-                                   'movement at the cost of 2 faith.]\n '
-        self.faith_description_2 = "\nTailwind (2 Faith)\nAll allied units " \
-                                   "gain +1 movement\n"
-        self.passive_description_1 = '\n1. Winged boots\nHermes is flying: Can ' \
-                                     'walk on all forms of terrain. Cannot use ' \
-                                     'forts.\n '
-        self.passive_description_2 = '2. Traveller\nAny allied gods have ' \
-                                     'one extra movement of starting a turn ' \
-                                     'next to Hermes.\n'
         self.casted_faith_ability = False
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        game.print()
-        if not self.casted_faith_ability:
-            print(self.faith_description_1)
-            faith_cost = 3 - discount
-        else:
-            print(self.faith_description_2)
-            faith_cost = 2 - discount
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < self._faith_cost(discount):
+            return []
+        return [Faith(self.id)]
 
-        while True:
-            if not self.casted_faith_ability:
-                confirm = input(f'\nUse {faith_cost} faith to '
-                                f'gain mobile (y/n)? ')
-            else:
-                confirm = input(f'\nUse {faith_cost} faith to '
-                                f'give all allies (y/n)? ')
-            try:
-                confirm = confirm.lower()
-                assert confirm in ['y', 'n']
-                break
-            except AssertionError:
-                print('Not valid answer')
-                continue
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        faith_cost = self._faith_cost(discount)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
         if not self.casted_faith_ability:
             self.add_status_effect('mobile', float('inf'))
-            print('Hermes become mobile (can move on any terrain)')
+            game.events.emit(StatusApplied, self, 'mobile', float('inf'))
         else:
             for char in p.live_character():
                 char.add_status_effect('vigor', 1)
-
-        print('All allied deity gain +1 movement this round')
+                game.events.emit(StatusApplied, char, 'vigor', 1)
 
         self.casted_faith_ability = True
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+        p.change_faith(-faith_cost)
+
+    def _faith_cost(self, discount: int = 0) -> int:
+        if not self.casted_faith_ability:
+            return 3 - discount
+        return 2 - discount
 
     def passive_ability(self, time: str, p: Player, game: Deity) -> None:
-        if time != 'start_turn' or self not in p.live_character():
+        if time != 'start_turn' or not p.has_live_character(self):
             # Check that passive trigger during start of char turn
             return
 
@@ -1110,9 +1138,9 @@ class Hermes_Messenger_of_the_Gods(Support, ABC):
 
         for tile in adjacent:
             t = game.board.get_tile(tile)
-            if t.character and t.character in p.live_character():
+            if t.character and p.has_live_character(t.character):
                 t.character.add_status_effect('vigor', 1)
-                print(f'{t.character} gain +1 movement this turn from Hermes')
+                game.events.emit(StatusApplied, t.character, 'vigor', 1)
 
     def get_info(self):
         info = super().get_info()
@@ -1125,55 +1153,41 @@ class Hermes_Messenger_of_the_Gods(Support, ABC):
 
 
 class Odin_Allfather(Melee, ABC):
+    __slots__ = ()
+    faith_description = '\nGungnir (2 Faith)\nOdin gains strength ' \
+                        'through his fallen allies. Gungnir deals ' \
+                        '1 damage. For each fallen allied unit, ' \
+                        'Gungnir’s damage is increased by 1.\n '
+    passive_description = '\nSleipnir\nOdin has a horse. Movement ' \
+                          'is increased by 1.\n '
+
     def __init__(self, id_):
         super().__init__(id_)
         self.movement += 1
-        self.faith_description = '\nGungnir (2 Faith)\nOdin gains strength ' \
-                                 'through his fallen allies. Gungnir deals ' \
-                                 '1 damage. For each fallen allied unit, ' \
-                                 'Gungnir’s damage is increased by 1.\n '
 
-        self.passive_description = '\nSleipnir\nOdin has a horse. Movement ' \
-                                   'is increased by 1.\n '
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < 2 - discount:
+            return []
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        game.print()
-        print(self.faith_description)
+        options = []
+        for char in self._enemy_targets(p, game):
+            options.append(Faith(self.id, target=char.id))
+        return options
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
         faith_cost = 2 - discount
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
         num_dead = len(p.dead_character())
         damage = 1 + num_dead
 
-        opponent = game.opponent(p)
-        targets = opponent.live_character()
-        while True:
-            for char in targets:
-                print(f'{char.id} - {char}')
-            deity_id = input(f'Pick enemy deity to deal {damage} damage'
-                             f' (type id or cancel): ')
-
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-            try:
-                char = opponent.character[int(deity_id)]
-                assert char in targets
-            except (ValueError, KeyError, AssertionError):
-                print('Not valid deity (please type id)')
-                continue
-
-            if 'divine' in char.get_status_effects():
-                print(f'{char} is divine and is immune to faith ability')
-                continue
-            break
-        char.passive_ability('take_damage_spell', p, game)
-        char.health -= damage
-        print(f'{char} took {damage} damage')
+        char = game.opponent(p).character[action.target]
+        deal_damage(game, p, [Damage(char, damage, self, 'spell')])
 
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -1185,67 +1199,50 @@ class Odin_Allfather(Melee, ABC):
 
 
 class Fortuna_Personification_of_Luck(Melee, ABC):
-    def __init__(self, id_):
-        super().__init__(id_)
-        self.faith_description = '\nGamble (1 Faith)\nRoll a dice, if the ' \
-                                 'dice is 1-3, deal 1 damage. If the dice is ' \
-                                 '4-6, deal 2 damage.\n '
-        self.passive_description = '\nLuck of the draw\nWhenever Fortuna ' \
-                                   'lands on a faith tile, roll a dice. If ' \
-                                   'the dice is 4-6 gain one extra faith.\n '
-
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        game.print()
-        print(self.faith_description)
+    __slots__ = ()
+    passive_triggers = frozenset({'collect_faith'})
+    faith_description = '\nGamble (1 Faith)\nRoll a dice, if the ' \
+                        'dice is 1-3, deal 1 damage. If the dice is ' \
+                        '4-6, deal 2 damage.\n '
+    passive_description = '\nLuck of the draw\nWhenever Fortuna ' \
+                          'lands on a faith tile, roll a dice. If ' \
+                          'the dice is 4-6 gain one extra faith.\n '
+
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < 1 - discount:
+            return []
+
+        options = []
+        for char in self._enemy_targets(p, game):
+            options.append(Faith(self.id, target=char.id))
+        return options
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
         faith_cost = 1 - discount
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        opponent = game.opponent(p)
-        targets = opponent.live_character()
-        while True:
-            for char in targets:
-                print(f'{char.id} - {char}')
-            deity_id = input('Pick enemy deity to target (type id or cancel): ')
-
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-            try:
-                char = opponent.character[int(deity_id)]
-                assert char in targets
-            except (ValueError, KeyError, AssertionError):
-                print('Not valid deity (please type id)')
-                continue
-
-            if 'divine' in char.get_status_effects():
-                print(f'{char} is divine and is immune to faith ability')
-                continue
-            break
-
-        random = randint(1, 6)
-        if random <= 3:
-            char.health -= 1
-            print(f'Rolled a {random}, 1 damage dealt to {char}')
-        else:
-            char.health -= 2
-            print(f'Rolled a {random}, 2 damage dealt to {char}')
-        char.passive_ability('take_damage_spell', p, game)
+        char = game.opponent(p).character[action.target]
+        random = game.random.randint(1, 6)
+        game.events.emit(DiceRolled, self, random)
+        damage = 1 if random <= 3 else 2
+        deal_damage(game, p, [Damage(char, damage, self, 'spell')])
 
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+        p.change_faith(-faith_cost)
 
     def passive_ability(self, time: str, p: Player, game: Deity) -> None:
-        if time != 'collect_faith' or self not in p.live_character():
+        if time != 'collect_faith' or not p.has_live_character(self):
             return
-        random = randint(1, 6)
-        print(f'Fortuna passive: Luck of the draw')
-        print(f'Rolled a {random}')
+        random = game.random.randint(1, 6)
+        game.events.emit(Narration, 'Fortuna passive: Luck of the draw')
+        game.events.emit(DiceRolled, self, random)
         if random >= 4:
-            p.faith += 1
-            print(f'{p.name} gained 1 additional faiths!!!')
+            p.change_faith(1)
         else:
-            print(f'Roll failed, better luck next time :(')
+            game.events.emit(Narration, 'Roll failed, better luck next '
+                                        'time :(')
 
     def get_info(self):
         info = super().get_info()
@@ -1257,68 +1254,55 @@ class Fortuna_Personification_of_Luck(Melee, ABC):
 
 
 class Khione_Daughter_of_the_North(Support, ABC):
+    __slots__ = ()
+    passive_triggers = frozenset({'start_turn'})
+    freeze_terrain = ('water',)  # Flash Freeze hits enemies near these
+    faith_description = '\nFlash Freeze (2 Faith)\nAll enemy units ' \
+                        'standing adjacent to Khione or a water tile ' \
+                        'are subject to Flash Freeze. Any enemy ' \
+                        'units affected by flash freeze take 1 ' \
+                        'damage and are stunned for 1 turn.\n '
+    passive_description_1 = '\n1. Frozen Lake\nKhione is Aquatic: Can ' \
+                            'enter water tiles. Water tiles may be ' \
+                            'consumer to reduce the cost of Khione’s ' \
+                            'active ability by 1 faith\n '
+    passive_description_2 = '2. Snow Cloak\nAllies standing next to ' \
+                            'Khione are immune to enemy faith ' \
+                            'attacks. Khione does not benefit from ' \
+                            'Snow Cloak’s effect.\n '
+
     def __init__(self, id_):
         super().__init__(id_, 'aquatic')
-        self.faith_description = '\nFlash Freeze (2 Faith)\nAll enemy units ' \
-                                 'standing adjacent to Khione or a water tile ' \
-                                 'are subject to Flash Freeze. Any enemy ' \
-                                 'units affected by flash freeze take 1 ' \
-                                 'damage and are stunned for 1 turn.\n '
-        self.passive_description_1 = '\n1. Frozen Lake\nKhione is Aquatic: Can ' \
-                                     'enter water tiles. Water tiles may be ' \
-                                     'consumer to reduce the cost of Khione’s ' \
-                                     'active ability by 1 faith\n '
-        self.passive_description_2 = '2. Snow Cloak\nAllies standing next to ' \
-                                     'Khione are immune to enemy faith ' \
-                                     'attacks. Khione does not benefit from ' \
-                                     'Snow Cloak’s effect.\n '
-
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
+
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < 2 - discount:
+            return []
+        return [Faith(self.id)]
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
         faith_cost = 2 - discount
-        game.print()
-        print(self.faith_description)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        while True:
-            confirm = input(f'\nUse Flash Freeze for 2 faith (y/n): ')
-            try:
-                confirm = confirm.lower()
-                assert confirm in ['y', 'n']
-                break
-            except AssertionError:
-                print('Not valid answer')
-                continue
-
-        if confirm == 'n':
-            raise ReturnError
-
-        opponent = game.opponent(p)
-        for char in opponent.live_character():
-            if 'divine' in char.get_status_effects():
-                continue
-
+        self_coord = game.board.get_char_location(self)
+        freeze_area = game.board.nearby_bits(self.freeze_terrain) | \
+            game.board.adjacent_bits(self_coord)
+        damages = []
+        for char in self._enemy_targets(p, game):
+            # TODO ASK IF ENEMY ON WATER TILE IS AFFECTED
             curr_coord = game.board.get_char_location(char)
-            adjacent = game.board.adjacent_tiles(curr_coord)
-            adjacent.append(
-                curr_coord)  # TODO ASK IF ENEMY ON WATER TILE IS AFFECTED
-            for coord in adjacent:
-                tile = game.board.get_tile(coord)
-                if tile.terrain == 'water' or \
-                        (tile.character and tile.character == self):
-                    char.add_status_effect('stun', 1)
-                    char.health -= 1
-                    char.passive_ability('take_damage_spell', p, game)
-                    print(f'{char} is stunned for 1 turn '
-                          f'(cannot make action) and took 1 damage')
-                    break
-
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+            if game.board.coord_in(curr_coord, freeze_area):
+                char.add_status_effect('stun', 1)
+                game.events.emit(StatusApplied, char, 'stun', 1)
+                damages.append(Damage(char, 1, self, 'spell'))
+        deal_damage(game, p, damages)
+
+        p.change_faith(-faith_cost)
 
     def passive_ability(self, time: str, p: Player, game: Deity) -> None:
-        if time != 'start_turn' or self in p.live_character():
+        if time != 'start_turn' or p.has_live_character(self):
             # Triggers at start of opponents turn
             return
         coord = game.board.get_char_location(self)
@@ -1327,9 +1311,9 @@ class Khione_Daughter_of_the_North(Support, ABC):
         opponent = game.opponent(p)
         for tile in adjacent:
             t = game.board.get_tile(tile)
-            if t.character and t.character in opponent.live_character():
+            if t.character and opponent.has_live_character(t.character):
                 t.character.add_status_effect('divine', 1)
-                print(f'{t.character} is immune to faith attacks')
+                game.events.emit(StatusApplied, t.character, 'divine', 1)
 
     def get_info(self):
         info = super().get_info()
@@ -1342,83 +1326,53 @@ class Khione_Daughter_of_the_North(Support, ABC):
 
 
 class Athena_Grandmaster(Melee, ABC):
+    __slots__ = ('promotion',)
+    passive_triggers = frozenset({'after_movement'})
+    faith_description_1 = '\nDecisive Maneuver (3 Faith): \nAthena can ' \
+                          'immediately teleport to an enemy’s ' \
+                          'adjacent tile and attack them for 1 ' \
+                          'damage.\n '
+    faith_description_2 = '\nDecisive Maneuver (1 Faith): \nAthena can ' \
+                          'immediately teleport to an enemy’s ' \
+                          'adjacent tile and attack them for 1 ' \
+                          'damage.\n '
+    passive_description = '\nPromotion: \nIf Athena reaches the ' \
+                          'opponent’s baseline (the row of tiles ' \
+                          'closest to your opponents), change the ' \
+                          'cost of Decisive Maneuver to 1 Faith.\n '
+
     def __init__(self, id_):
         super().__init__(id_)
-        self.faith_description_1 = '\nDecisive Maneuver (3 Faith): \nAthena can ' \
-                                   'immediately teleport to an enemy’s ' \
-                                   'adjacent tile and attack them for 1 ' \
-                                   'damage.\n '
-        self.faith_description_2 = '\nDecisive Maneuver (1 Faith): \nAthena can ' \
-                                   'immediately teleport to an enemy’s ' \
-                                   'adjacent tile and attack them for 1 ' \
-                                   'damage.\n '
-
-        self.passive_description = '\nPromotion: \nIf Athena reaches the ' \
-                                   'opponent’s baseline (the row of tiles ' \
-                                   'closest to your opponents), change the ' \
-                                   'cost of Decisive Maneuver to 1 Faith.\n '
         self.promotion = False
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        game.print()
-        if self.promotion:
-            print(self.faith_description_2)
-            faith_cost = 1 - discount
-        else:
-            print(self.faith_description_1)
-            faith_cost = 3 - discount
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < self._faith_cost(discount):
+            return []
+
+        options = []
+        for char in self._enemy_targets(p, game):
+            coord = game.board.get_char_location(char)
+            adjacent = game.board.adjacent_tiles(coord)
+            for new_coord in self._free_tiles(self, game, adjacent):
+                options.append(Faith(self.id, 1, char.id, new_coord))
+        return options
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        faith_cost = self._faith_cost(discount)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        opponent = game.opponent(p)
-        targets = opponent.live_character()
-        while True:
-            for char in targets:
-                print(f'{char.id} - {char}')
-            deity_id = input('Pick enemy deity to target (type id or cancel): ')
-
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-            try:
-                char = opponent.character[int(deity_id)]
-                assert char in targets
-            except (ValueError, KeyError, AssertionError):
-                print('Not valid deity (please type id)')
-                continue
-
-            if 'divine' in char.get_status_effects():
-                print(f'{char} is divine and is immune to faith ability')
-                continue
-            break
+        char = game.opponent(p).character[action.target]
+        game.board.move_character(self, action.coord)
+        deal_damage(game, p, [Damage(char, 1, self, 'spell')])
+        p.change_faith(-faith_cost)
 
-        coord = game.board.get_char_location(char)
-        adjacent = game.board.adjacent_tiles(coord)
-        game.print()
-        print(f'Adjacent coordinates to {char}: {adjacent}')
-        while True:
-            coord = input(f'Choose coordinate to move {self} (type coordinate '
-                          f'or cancel): ')
-            if coord.lower() == 'cancel':
-                raise ReturnError
-            try:
-                coord = turn_into_coordinate(coord)
-                tile = game.board.get_tile(coord)
-                assert check_tile_char_valid(self, tile)
-                assert coord in adjacent
-
-                game.board.move_character(self, coord)
-                char.health -= 1
-                char.passive_ability('take_damage_spell', p, game)
-                game.print()
-                print(f'{self} dealt 1 damage to {char}')
-                p.faith -= faith_cost
-                print(f'{p.name} has {p.faith} faith left')
-                break
-            except (NotValidMove, AssertionError,
-                    ValueError, CharacterBlocking):
-                print('Not valid tile coordinate')
-                continue
+    def _faith_cost(self, discount: int = 0) -> int:
+        if self.promotion:
+            return 1 - discount
+        return 3 - discount
 
     def get_info(self):
         info = super().get_info()
@@ -1429,7 +1383,7 @@ class Athena_Grandmaster(Melee, ABC):
         return info
 
     def passive_ability(self, time: str, p: Player, game: Deity):
-        if time != 'after_movement' or self not in p.live_character() \
+        if time != 'after_movement' or not p.has_live_character(self) \
                 or self.promotion:
             return
 
@@ -1437,70 +1391,63 @@ class Athena_Grandmaster(Melee, ABC):
 
         coord = game.board.get_char_location(self)
         if coord[1] == y_val:
-            print(f'{self} got promoted! Decisive Maneuver now cost 1 faith')
+            game.events.emit(Narration, '{} got promoted! Decisive '
+                                        'Maneuver now cost 1 faith', (self,))
             self.promotion = True
 
 
 class WIP_Amaterasu_Goddess_of_the_Sun(Support, ABC):
+    __slots__ = ('cave', 'not_move')
+    passive_triggers = frozenset({'start_turn', 'after_movement', 'end_turn',
+                                  'take_damage_attack', 'take_damage_spell'})
+    faith_description = '\nRadiance (2 Faith):\nAmaterasu unleashes ' \
+                        'the power of the sun and blinds her enemy ' \
+                        'for 2 turns, if Hideaway Cave is active, ' \
+                        'enemies will be blinded for 3 turns. Using ' \
+                        'this ability deactivates Hideaway Cave if ' \
+                        'it was previously active.\n'
+    passive_description_1 = '\n1. Hideaway Cave:\nAfter Amaterasu is ' \
+                            'inflicted with any type of damage, ' \
+                            'she retreats into the cave, while in ' \
+                            'the cave dark spirits torment the field ' \
+                            'and all enemy units have -1 movement. ' \
+                            'The cave will remain active until she ' \
+                            'is moved or until she takes damage ' \
+                            'again\n'
+    passive_description_2 = '2. Divine Blessing:\nEvery 3 turns ' \
+                            'where Amaterasu is not moved by the ' \
+                            'player or attacked by the enemy, ' \
+                            'she gains one faith, if Hideaway Cave ' \
+                            'is active Amaterasu gains faith every 2 ' \
+                            'turns.\n'
+
     def __init__(self, id_):
         super().__init__(id_)
-        self.faith_description = '\nRadiance (2 Faith):\nAmaterasu unleashes ' \
-                                 'the power of the sun and blinds her enemy ' \
-                                 'for 2 turns, if Hideaway Cave is active, ' \
-                                 'enemies will be blinded for 3 turns. Using ' \
-                                 'this ability deactivates Hideaway Cave if ' \
-                                 'it was previously active.\n'
-        self.passive_description_1 = '\n1. Hideaway Cave:\nAfter Amaterasu is ' \
-                                     'inflicted with any type of damage, ' \
-                                     'she retreats into the cave, while in ' \
-                                     'the cave dark spirits torment the field ' \
-                                     'and all enemy units have -1 movement. ' \
-                                     'The cave will remain active until she ' \
-                                     'is moved or until she takes damage ' \
-                                     'again\n'
-        self.passive_description_2 = '2. Divine Blessing:\nEvery 3 turns ' \
-                                     'where Amaterasu is not moved by the ' \
-                                     'player or attacked by the enemy, ' \
-                                     'she gains one faith, if Hideaway Cave ' \
-                                     'is active Amaterasu gains faith every 2 ' \
-                                     'turns.\n'
         self.cave = False
         self.not_move = 0
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
-        game.print()
-        print(self.faith_description)
-        faith_cost = 1 - discount
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < 1 - discount:
+            return []
+        return [Faith(self.id)]
 
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
+        faith_cost = 1 - discount
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        while True:
-            confirm = input(f'\nUse Radiance ability for 2 faith (y/n)? ')
-            try:
-                confirm = confirm.lower()
-                assert confirm in ['y', 'n']
-                break
-            except AssertionError:
-                print('Not valid answer')
-                continue
-
-        if confirm == 'n':
-            raise ReturnError
-
         opponent = game.opponent(p)
         blind_turn = 3 if self.cave else 2
 
         for char in opponent.live_character():
             char.add_status_effect('blinded', blind_turn)  # TODO add blind
+            game.events.emit(StatusApplied, char, 'blinded', blind_turn)
         if self.cave:
-            print('Hideaway Cave is inactivated')
+            game.events.emit(Narration, 'Hideaway Cave is inactivated')
             self.cave = False
-        print(f"All of {opponent.name}'s deity are "
-              f"blinded for {blind_turn} round")
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -1515,61 +1462,63 @@ class WIP_Amaterasu_Goddess_of_the_Sun(Support, ABC):
         if time == 'take_damage_attack' or time == 'take_damage_spell':
             self.cave = not self.cave
             if self.cave:
-                print('Hideaway Cave is activated')
+                game.events.emit(Narration, 'Hideaway Cave is activated')
             else:
-                print('Hideaway Cave is inactivated')
+                game.events.emit(Narration, 'Hideaway Cave is inactivated')
         elif time == 'after_movement':
             self.not_move = 0
             if self.cave:
-                print('Hideaway Cave is inactivated')
+                game.events.emit(Narration, 'Hideaway Cave is inactivated')
                 self.cave = False
 
-        elif time == 'start_turn' and self not in p.live_character():
+        elif time == 'start_turn' and not p.has_live_character(self):
             # enemy turn
             if self.cave:
                 for char in p.live_character():
                     # TODO implement slowed (-1 movement)
                     char.add_status_effect('slowed', 1)
-            print(f'Hideaway Cave is active, all {p.name} character has -1 '
-                  f'movement')
+                    game.events.emit(StatusApplied, char, 'slowed', 1)
 
-        elif time == 'end_turn' and self in p.live_character():
+        elif time == 'end_turn' and p.has_live_character(self):
             # my turn
             if not self.has_moved:
                 self.not_move += 1
 
             if (self.cave and self.not_move >= 2) or \
                     (not self.cave and self.not_move >= 3):
-                print('Amaterasu: Divine Blessing')
-                print(f"{self} hasn't moved for {self.not_move} turns, "
-                      f"{p.name} gain 1 faith")
-                p.faith += 1
+                game.events.emit(Narration, "Amaterasu: Divine Blessing, {} "
+                                            "hasn't moved for {} turns",
+                                 (self, self.not_move))
+                p.change_faith(1)
                 self.not_move = 0
 
 
 class WIP_Isis_Guardian(Support, ABC):
+    __slots__ = ('consecutive_char',)
+    passive_triggers = frozenset({'start_turn'})
+    faith_description = '\nBreath of Life (2 Faith)\nIsis can ' \
+                        'resurrect any fallen allied unit in ' \
+                        'mummified form with 2 Health. Mummies ' \
+                        'cannot move or attack for 3 turns and can ' \
+                        'be slain during this duration. After 3 ' \
+                        'turns, mummies will be able resume action. ' \
+                        'Mummies can be summoned onto any tile ' \
+                        'adjacent to Isis.\n '
+    passive_description_1 = '\n1. Mother’s Love:\nIsis can choose to ' \
+                            'take the damage of any standard melee or ' \
+                            'ranged attacks in place of any allied ' \
+                            'units standing adjacent to Isis.\n '
+    passive_description_2 = '2. Healer\nAny unit that stands adjacent ' \
+                            'to Isis for 2 consecutive turns gains 1 ' \
+                            'health, units cannot exceed the health ' \
+                            'point cap through this ability.\n '
+
     def __init__(self, id_):
         super().__init__(id_)
-        self.faith_description = '\nBreath of Life (2 Faith)\nIsis can ' \
-                                 'resurrect any fallen allied unit in ' \
-                                 'mummified form with 2 Health. Mummies ' \
-                                 'cannot move or attack for 3 turns and can ' \
-                                 'be slain during this duration. After 3 ' \
-                                 'turns, mummies will be able resume action. ' \
-                                 'Mummies can be summoned onto any tile ' \
-                                 'adjacent to Isis.\n '
-        self.passive_description_1 = '\n1. Mother’s Love:\nIsis can choose to ' \
-                                     'take the damage of any standard melee or ' \
-                                     'ranged attacks in place of any allied ' \
-                                     'units standing adjacent to Isis.\n '
-        self.passive_description_2 = '2. Healer\nAny unit that stands adjacent ' \
-                                     'to Isis for 2 consecutive turns gains 1 ' \
-                                     'health, units cannot exceed the health ' \
-                                     'point cap through this ability.\n '
         self.consecutive_char = []
 
     def passive_ability(self, time: str, p: Player, game: Deity) -> None:
-        if time != 'start_turn' or self not in p.live_character():
+        if time != 'start_turn' or not p.has_live_character(self):
             return
 
         curr_coord = game.board.get_char_location(self)
@@ -1577,78 +1526,50 @@ class WIP_Isis_Guardian(Support, ABC):
         chars = []
         for coord in adjacent:
             t = game.board.get_tile(coord)
-            if t.character and t.character in p.live_character():
+            if t.character and p.has_live_character(t.character):
                 chars.append(t.character)
                 if t.character in self.consecutive_char:
                     t.character.heal(1)
-                    print(f'{self} healed {t.character} for 1 health')
+                    game.events.emit(Healed, t.character,
+                                     t.character.health)
         self.consecutive_char = chars
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
+    def relink(self, characters: Dict[int, Character]) -> None:
+        self.consecutive_char = [characters[char.id]
+                                 for char in self.consecutive_char]
+
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < 2 - discount:
+            return []
+
+        curr_coord = game.board.get_char_location(self)
+        spawn = []
+        for coord in game.board.adjacent_tiles(curr_coord):
+            tile = game.board.get_tile(coord)
+            if tile.character is None and tile.terrain is not None \
+                    and tile.terrain not in ['water', 'cloud']:
+                spawn.append(coord)
+
+        options = []
+        for char in p.dead_character():
+            for coord in spawn:
+                options.append(Faith(self.id, 1, char.id, coord))
+        return options
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
         faith_cost = 2 - discount
-        game.print()
-        print(self.faith_description)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        dead_char = p.dead_character()
-        if len(dead_char) == 0:
-            print('No dead deity to revive')
-            raise FaithAbilityError
-
-        dead_str = ''
-        for char in dead_char:
-            dead_str += f'{char.id} - {char}    '
-
-        game.print()
-        print('\nDead allied deities:')
-        print(dead_str)
-
-        while True:
-            deity_id = input('Choose deity to revive (type id or cancel): ')
-            if deity_id.lower() == 'cancel':
-                raise ReturnError
-            try:
-                char = p.character[int(deity_id)]
-                assert char in dead_char
-                break
-            except (ValueError, AssertionError, KeyError):
-                game.print()
-                print('Not valid deity id')
-                continue
-
-        game.print()
-        curr_coord = game.board.get_char_location(self)
-        adjacent = game.board.adjacent_tiles(curr_coord)
-        while True:
-            coord = input('Choose adjacent tile to spawn deity (type '
-                          'coordinates or cancel): ')
-            if coord.lower() == 'cancel':
-                raise ReturnError
-            try:
-                coord = turn_into_coordinate(coord)
-                assert coord in adjacent
-                tile = game.board.get_tile(coord)
-                if tile.character is not None:
-                    print('Tile already has a character')
-                    raise TileAlreadyHaveCharacter
-                if tile.terrain is None or tile.terrain in ['water', 'cloud']:
-                    print("Can't spawn character in water or cloud")
-                    raise NotValidSpawn
-                tile.character = char
-                char.health = 2
-                # TODO Check with Sam and Vincent, Change name to mummified
-                char.add_status_effect('mummified', 3)
-                print(f'{char} has been revived as a mummy!')
-                p.faith -= faith_cost
-                print(f'{p.name} has {p.faith} faith left')
-                break
-            except(ValueError, AssertionError,
-                   NotValidSpawn, TileAlreadyHaveCharacter):
-                game.print()
-                print('Not valid spawn point')
-                continue
+        char = p.character[action.target]
+        game.board.place_character(char, action.coord)
+        char.health = 2
+        # TODO Check with Sam and Vincent, Change name to mummified
+        char.add_status_effect('mummified', 3)
+        game.events.emit(Revived, char, True)
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -1661,21 +1582,24 @@ class WIP_Isis_Guardian(Support, ABC):
 
 
 class Athena_Goddess_of_Wisdom(Support, ABC):
+    __slots__ = ('consecutive_char',)
+    passive_triggers = frozenset({'start_turn'})
+    faith_description = '\nForesight (2 Faith)\nFor the next 2 ' \
+                        'turns, you gain one extra action.\n'
+    passive_description_1 = '\n1. Aegis:\nRanged attacks performed at ' \
+                            'greater than one range will be ' \
+                            'countered and both units take 1 ' \
+                            'damage.\n'
+    passive_description_2 = '2. Odyssey: \nAll adjacent units ' \
+                            'starting a turn next to Athena will ' \
+                            'have +1 movement\n '
+
     def __init__(self, id_):
         super().__init__(id_)
-        self.faith_description = '\nForesight (2 Faith)\nFor the next 2 ' \
-                                 'turns, you gain one extra action.\n'
-        self.passive_description_1 = '\n1. Aegis:\nRanged attacks performed at ' \
-                                     'greater than one range will be ' \
-                                     'countered and both units take 1 ' \
-                                     'damage.\n'
-        self.passive_description_2 = '2. Odyssey: \nAll adjacent units ' \
-                                     'starting a turn next to Athena will ' \
-                                     'have +1 movement\n '
         self.consecutive_char = []
 
     def passive_ability(self, time: str, p: Player, game: Deity) -> None:
-        if time != 'start_turn' or self not in p.live_character():
+        if time != 'start_turn' or not p.has_live_character(self):
             # Check that passive trigger during start of char turn
             return
 
@@ -1684,35 +1608,26 @@ class Athena_Goddess_of_Wisdom(Support, ABC):
 
         for tile in adjacent:
             t = game.board.get_tile(tile)
-            if t.character and t.character in p.live_character():
+            if t.character and p.has_live_character(t.character):
                 t.character.add_status_effect('vigor', 1)
-                print(f'{t.character} gain +1 movement this turn from Athena')
+                game.events.emit(StatusApplied, t.character, 'vigor', 1)
 
-    def faith_ability(self, p: Player, game: Deity, discount: int = 0):
+    def faith_options(self, p: Player, game: Deity,
+                      discount: int = 0) -> List[Faith]:
+        if p.faith < 2 - discount:
+            return []
+        return [Faith(self.id)]
+
+    def faith_ability(self, p: Player, game: Deity, action: Faith,
+                      discount: int = 0):
         faith_cost = 2 - discount
-        game.print()
-        print(self.faith_description)
         if p.faith < faith_cost:
-            print(f'Not enough faith (you need {faith_cost} faith)')
             raise NotEnoughFaith
 
-        while True:
-            confirm = input(f'\nUse Foresight and for 2 faith (y/n)? ')
-            try:
-                confirm = confirm.lower()
-                assert confirm in ['y', 'n']
-                break
-            except AssertionError:
-                print('Not valid answer')
-                continue
-
-        if confirm == 'n':
-            raise ReturnError
-
         p.additional_action['add'] += 2
-        print(f'{p.name} has 1 additional actions next 2 turns')
-        p.faith -= faith_cost
-        print(f'{p.name} has {p.faith} faith left')
+        game.events.emit(Narration, '{} has 1 additional actions next 2 '
+                                    'turns', (p.name,))
+        p.change_faith(-faith_cost)
 
     def get_info(self):
         info = super().get_info()
@@ -1723,34 +1638,98 @@ class Athena_Goddess_of_Wisdom(Support, ABC):
         info += self.faith_description
         return info
 
-    def take_damage(self, attacker: Character, game: Deity,
-                    attacking_player: Player, damage: int = 1):
-        mother_love = self._check_mothers_love(attacker, game,
-                                               attacking_player, damage)
-        if not mother_love:
-            self.health -= damage
-            print(f'\n{attacker} attacked {self}')
-
-            attacker_coord = game.board.get_char_location(attacker)
-            self_coord = game.board.get_char_location(self)
-            dis = distance(attacker_coord, self_coord)
-            if dis > 1:
-                attacker.health -= 1
-                attacker.passive_ability('take_damage_attack',
-                                         attacking_player, game)
-                print(f'Athena uses Aegis and retaliated 1 '
-                      f'damage to {attacker}')
-                if attacker.health > 0:
-                    print(f'{attacker} has {attacker.health} health left')
-                else:
-                    print(f'{attacker} is killed!!!')
-
-            if self.health > 0:
-                print(f'{self} has {self.health} health left\n')
-            else:
-                print(f'{self} is killed!!!\n')
+    def retaliation(self, dis: int) -> Union[str, None]:
+        # Passive Ability (Aegis)
+        return 'Aegis' if dis > 1 else None
 
 # === HELPER FUNCTION ===
+def deal_damage(game: Deity, p: Player, damages: Iterable[Damage]) -> None:
+    """
+    Resolve a batch of damage dealt by the deities of player p in one pass.
+    Spells do nothing to divine deities, an attack can be taken by an Isis
+    adjacent to the target (Mother's Love) and retaliated for 1 damage
+    (Ravenclaw, Aegis). Every deity hit triggers its take_damage passive
+    and deities killed by the batch are removed from the board at the end.
+
+    Locations are looked up at most once per deity for the whole batch.
+
+    :param game: Game the damage is dealt in
+    :param p: Player whose deities deal the damage
+    :param damages: Hits in the order they land
+    :return: None (mutates the deities hit and the board)
+    """
+    opponent = game.opponent(p)
+    coords = {}
+
+    def locate(char: Character) -> Tuple:
+        if char.id not in coords:
+            coords[char.id] = game.board.get_char_location(char)
+        return coords[char.id]
+
+    hit = []
+    for target, amount, source, kind in damages:
+        if kind == 'spell':
+            if target.has_status('divine'):
+                continue
+            _hit(target, amount, opponent, 'take_damage_spell', game)
+            hit.append(target)
+            continue
+
+        target = _mothers_love(target, opponent, game, locate)
+        game.events.emit(Attacked, source, target)
+        _hit(target, amount, opponent, 'take_damage_attack', game)
+        hit.append(target)
+
+        ability = target.retaliation(distance(locate(source),
+                                              locate(target)))
+        if ability is not None:
+            game.events.emit(Retaliated, target, source, ability)
+            _hit(source, 1, p, 'take_damage_attack', game)
+            hit.append(source)
+
+    game.remove_dead(hit)
+
+
+def _hit(char: Character, amount: int, owner: Player, trigger: str,
+         game: Deity) -> None:
+    """
+    Take amount health from char (owned by owner) and trigger its passive
+    """
+    char.health -= amount
+    game.events.emit(Damaged, char, amount, char.health)
+    char.trigger_passive(trigger, owner, game)
+
+
+def _mothers_love(target: Character, owner: Player, game: Deity,
+                  locate) -> Character:
+    """
+    Return the deity of owner that takes an attack aimed at target, an
+    adjacent Isis if Mother's Love is used, otherwise target
+    """
+    if isinstance(target, (Isis_The_Mother, WIP_Isis_Guardian)):
+        # Damage taken in place of another deity isn't passed on again
+        return target
+    for char in owner.live_character():
+        if isinstance(char, (Isis_The_Mother, WIP_Isis_Guardian)):
+            adjacent = game.board.adjacent_tiles(locate(target))
+            if locate(char) in adjacent:
+                if game.choose_mothers_love(char, target):
+                    return char
+                return target
+    return target
+
+
+def playable_characters() -> List[type]:
+    """
+    Return every deity class players can choose, grouped by class (melee,
+    range, support) in the order they are defined
+    """
+    characters = []
+    for class_ in Character.__subclasses__():
+        characters += class_.__subclasses__()
+    return characters
+
+
 def check_tile_char_valid(char: Character, tile: Tile) -> bool:
     """
     Check if char can be placed on tile based on character attribute and tile
@@ -1760,11 +1739,14 @@ def check_tile_char_valid(char: Character, tile: Tile) -> bool:
     :param tile: Tile
     :return: Return true if char can be placed on tile
     """
+    if tile.terrain is None:
+        return False
+    mobile = char.has_status('mobile')
     if tile.terrain == 'water':
-        if char.attribute not in ['flying', 'aquatic']:
+        if char.attribute not in ['flight', 'aquatic'] and not mobile:
             return False
     elif tile.terrain == 'cloud':
-        if char.attribute != 'flying':
+        if char.attribute != 'flight' and not mobile:
             return False
     return True
 
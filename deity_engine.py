@@ -0,0 +1,554 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Union
+from deity_action import *
+from deity_event import BoardFull
+from deity_board import MovementProfile
+from deity_character import Character, playable_characters, \
+    check_tile_char_valid, NO_ACTION_MASK
+from deity_setting import *
+
+if TYPE_CHECKING:
+    from deity_game import Deity, Player
+
+# Headless rules engine. A game (Deity) is driven by asking for
+# legal_actions(game) and calling apply(game, action) with one of them,
+# with no input() anywhere. Automatic parts of a turn (start of turn
+# passives, drawing tiles, collecting faith, ragnarok) run inside apply.
+
+# Phases of a game. Set up phases happen once in this order, then each
+# turn is an 'action' phase followed by a 'place_tile' phase until the
+# game is 'over'
+SET_UP_PHASES = ['choose_character', 'base', 'road', 'spawn']
+TURN_PHASES = ['action', 'place_tile']
+
+Action = Union[ChooseCharacter, PlaceBase, PlaceRoad, Spawn, Step, StopMove,
+               Attack, Faith, PlaceTile, Skip]
+
+
+def new_game(p1_name: str = 'Player 1', p2_name: str = 'Player 2',
+             seed: int = None) -> Deity:
+    """
+    Return a new game that is not played through the terminal, the same
+    seed always gives the same tile draws and dice rolls
+    """
+    from deity_game import Deity
+    return Deity(p1_name, p2_name, interactive=False, seed=seed)
+
+
+def current_player(game: Deity) -> Player:
+    """
+    Return the player who has to make the next decision
+    """
+    if game.phase in SET_UP_PHASES:
+        if game.phase == 'spawn':
+            return _next_spawn(game)[0]
+        return game.player1 if game.setup_player == 1 else game.player2
+    return game.player_turn()
+
+
+def legal_actions(game: Deity) -> List[Action]:
+    """
+    Return every action the current player can take
+
+    :param game: Game being played
+    :return: List of actions, empty once the game is over
+    """
+    phase = game.phase
+    if phase == 'action':
+        return _action_options(game)
+    elif phase == 'place_tile':
+        return _place_tile_options(game)
+    elif phase == 'choose_character':
+        return _choose_options(game)
+    elif phase == 'base':
+        return _base_options(game)
+    elif phase == 'road':
+        return _road_options(game)
+    elif phase == 'spawn':
+        return _spawn_options(game)
+    return []
+
+
+def apply(game: Deity, action: Action) -> None:
+    """
+    Apply action (one of legal_actions(game)) and advance the game to the
+    next decision
+
+    :param game: Game being played
+    :param action: Action taken by the current player
+    :return: None (mutates game)
+    """
+    _APPLY[type(action)](game, action)
+
+
+def start_game(game: Deity) -> None:
+    """
+    Start the first turn of a game whose board and characters are already
+    set up
+    """
+    _start_turn(game)
+
+
+def movement_allowance(game: Deity, char: Character) -> int:
+    """
+    Return how many tiles char can move when it starts moving now
+    """
+    profile = movement_profile(char)
+    movement = profile.movement
+    if profile.cloud_bonus and game.board.get_terrain(
+            game.board.get_char_location(char)) == 'cloud':
+        movement += 1
+    return movement
+
+
+def movement_profile(char: Character) -> MovementProfile:
+    """
+    Return how char moves with the status effects it has now, the key of
+    its distance fields (see Board.distance_field)
+    """
+    movement = char.movement
+    cloud_bonus = char.attribute == 'flight'
+    if char.status_effect.active:
+        if char.has_status('vigor'):
+            movement += 1
+        if char.has_status('slowed'):
+            movement -= 1
+        if char.has_status('grounded'):
+            movement = 1
+            cloud_bonus = False
+    return MovementProfile(char.attribute, movement,
+                           char.has_status('mobile'), cloud_bonus)
+
+
+def move_distance(game: Deity, char: Character,
+                  coords: List[Tuple[int, int]]) -> Union[int, None]:
+    """
+    Return the fewest move actions char needs to reach any tile of coords
+    from where it stands (None if it can't reach any), ignoring deities
+    standing in the way, e.g. to tell how far it is from the enemy base
+    or a faith tile
+    """
+    board = game.board
+    field = board.distance_field(board.get_char_location(char),
+                                 movement_profile(char))
+    moves = [field.moves[y * board.width + x] for x, y in coords]
+    moves = [num_move for num_move in moves if num_move is not None]
+    return min(moves) if moves else None
+
+
+def reachable_tiles(game: Deity, char: Character,
+                    movement: int = None) -> \
+        Iterator[Tuple[Tuple[int, int], Tuple[Tuple[int, int], ...]]]:
+    """
+    Generate every tile (other than its own) char can end on with this move
+    action, each with a shortest path to it. Follows the same rules as
+    stepping one tile at a time: terrain char cannot enter, tiles with a
+    deity on them, and forests ending the move. A deity in the middle of
+    moving continues with the movement it has left.
+
+    Every tile of a path is a point where char's after_movement passive
+    triggers when the path is played as Step actions. Those passives never
+    change where char can go next, so the paths stay valid.
+
+    :param game: Game being played
+    :param char: Deity moving
+    :param movement: Tiles char can move (default: what it has this move)
+    :return: (coord, path) pairs nearest first, path is the tiles stepped
+             on in order and ends with coord
+    """
+    board = game.board
+    start = board.get_char_location(char)
+    if movement is None and game.moving == char.id:
+        movement = game.movement_left
+    elif movement is None:
+        movement = movement_allowance(game, char)
+
+    # Breadth first so the first path found to a tile is a shortest one,
+    # a longer path can never reach further
+    paths = {start: ()}
+    frontier = [start]
+    for _ in range(movement):
+        next_frontier = []
+        for coord in frontier:
+            path = paths[coord]
+            for step in board.adjacent_tiles(coord):
+                if step in paths:
+                    continue
+                tile = board.get_tile(step)
+                if tile.character is not None or \
+                        not check_tile_char_valid(char, tile):
+                    continue
+                paths[step] = path + (step,)
+                yield step, paths[step]
+                if tile.terrain != 'forest':  # Entering forest ends the move
+                    next_frontier.append(step)
+        frontier = next_frontier
+
+
+def can_act(char: Character) -> bool:
+    """
+    Return True if char is not prevented from taking any action
+    """
+    return not char.has_any_status(NO_ACTION_MASK)
+
+
+def attack_range(game: Deity, char: Character,
+                 coord: Tuple[int, int] = None) -> int:
+    """
+    Return attack range of char from the tile at coord (default: the tile
+    it is standing on)
+    """
+    range_ = char.range
+    if coord is None:
+        coord = game.board.get_char_location(char)
+    terrain = game.board.get_terrain(coord)
+    if (terrain == 'fort' or terrain == 'base') and \
+            char.attribute != 'flight':
+        range_ += 1
+    return range_
+
+
+def attack_targets(game: Deity, char: Character) -> List[Character]:
+    """
+    Return the live enemies char is in range of from where it stands, with
+    the fort/base bonus and any range char gained (Shining Blade, Deep
+    Range) included. Whether char can still attack this turn is not
+    checked.
+    """
+    board = game.board
+    reach = board.diamond_bits(board.get_char_location(char),
+                               attack_range(game, char))
+    opponent = game.opponent(_owner(game, char.id))
+    return [target for target in opponent.live_character()
+            if board.coord_in(board.get_char_location(target), reach)]
+
+
+def attackers_of(game: Deity, coord: Tuple[int, int],
+                 p: Player) -> List[Character]:
+    """
+    Return the live deities of p that have the tile at coord in range from
+    where they stand, whether or not they can still attack this turn
+    """
+    board = game.board
+    attackers = []
+    for char in p.live_character():
+        char_coord = board.get_char_location(char)
+        if char_coord is not None and board.coord_in(
+                coord, board.diamond_bits(char_coord,
+                                          attack_range(game, char))):
+            attackers.append(char)
+    return attackers
+
+
+def faith_discount(game: Deity, char: Character) -> int:
+    """
+    Return faith discount of char (aquatic deity standing on water)
+    """
+    coord = game.board.get_char_location(char)
+    if char.attribute == 'aquatic' and \
+            game.board.get_terrain(coord) == 'water':
+        return 1
+    return 0
+
+
+# === SET UP ===
+def _choose_options(game: Deity) -> List[Action]:
+    p = current_player(game)
+    chosen = [type(char).__name__ for char in p.character.values()]
+    options = []
+    for class_ in playable_characters():
+        if class_.__name__ not in chosen:
+            options.append(ChooseCharacter(class_.__name__))
+    return options
+
+
+def _apply_choose(game: Deity, action: ChooseCharacter) -> None:
+    p = current_player(game)
+    for class_ in playable_characters():
+        if class_.__name__ == action.name:
+            offset = 0 if p.number == 1 else MAX_CHARACTER
+            p.add_character(class_(len(p.character) + 1 + offset))
+
+    if len(game.player2.character) == MAX_CHARACTER:
+        game.phase = 'base'
+        game.setup_player = 1
+    else:
+        game.setup_player = 2 if p.number == 1 else 1
+
+
+def _base_options(game: Deity) -> List[Action]:
+    board = game.board
+    if game.setup_player == 1:
+        y, dy = board.height - 1, -1
+    else:
+        y, dy = 0, 1
+
+    options = []
+    for x in range(board.width - 1):
+        tiles = [(x, y), (x + 1, y), (x, y + dy), (x + 1, y + dy)]
+        if board.possible_tile(tiles) and \
+                all(board.get_terrain(t) is None for t in tiles):
+            options.append(PlaceBase((x, y)))
+    return options
+
+
+def _apply_base(game: Deity, action: PlaceBase) -> None:
+    if game.setup_player == 1:
+        game.board.create_base_p1(action.coord)
+        game.setup_player = 2
+    else:
+        game.board.create_base_p2(action.coord)
+        game.phase = 'road'
+        game.setup_player = 1
+
+
+def _road_options(game: Deity) -> List[Action]:
+    options = []
+    for coord1, coord2 in game.board.possible_roads(game.setup_player):
+        options.append(PlaceRoad(coord1, coord2))
+    return options
+
+
+def _apply_road(game: Deity, action: PlaceRoad) -> None:
+    game.board.create_big_road(game.setup_player, action.coord1,
+                               action.coord2)
+    if game.setup_player == 1:
+        game.setup_player = 2
+    else:
+        game.phase = 'spawn'
+        game.setup_player = 1
+
+
+def _next_spawn(game: Deity) -> Union[Tuple[Player, Character], None]:
+    """
+    Return the next player and character waiting to be spawned
+    """
+    for p in [game.player1, game.player2]:
+        for char in p.character.values():
+            if game.board.get_char_location(char) is None:
+                return p, char
+    return None
+
+
+def _spawn_options(game: Deity) -> List[Action]:
+    p, char = _next_spawn(game)
+    options = []
+    for coord in game.board.get_base_tile(p.number):
+        if game.board.get_tile(coord).character is None:
+            options.append(Spawn(char.id, coord))
+    return options
+
+
+def _apply_spawn(game: Deity, action: Spawn) -> None:
+    p = _owner(game, action.char_id)
+    game.board.spawn_character(p.character[action.char_id], action.coord,
+                               p.number)
+    if _next_spawn(game) is None:
+        start_game(game)
+
+
+# === TURN ===
+def _start_turn(game: Deity) -> None:
+    p = game.player_turn()
+    p.reset_character()
+    game.action_left = MOVES_PER_TURN + p.get_additional_action()
+    game.destroy_base(p)
+    game.passive('start_turn')
+    game.remove_character()
+    if _check_over(game):
+        return
+
+    game.phase = 'action'
+    if game.action_left <= 0:
+        _end_actions(game)
+
+
+def _end_actions(game: Deity) -> None:
+    game.passive('end_turn')
+    game.drawn = game.draw_tiles(game.player_turn())
+    game.phase = 'place_tile'
+    _settle_tiles(game)
+
+
+def _settle_tiles(game: Deity) -> None:
+    """
+    Finish the turn once every drawn tile has been placed. Tiles that no
+    longer fit because the board is full are cashed in for their faith.
+    """
+    p = game.player_turn()
+    if game.drawn and game.board.is_full:
+        num_faith = game.drawn.count('faith')
+        game.events.emit(BoardFull, p, num_faith)
+        p.faith += num_faith
+        game.drawn = []
+
+    if not game.drawn:
+        _finish_turn(game)
+
+
+def _finish_turn(game: Deity) -> None:
+    p = game.player_turn()
+    game.add_faith(p)
+    p.reduce_status_effect()
+    game.shrink_board()  # Shrink board if ragnarok
+    game.remove_character()
+    game.start_ragnarok()  # Start ragnarok if board is full
+    game.turn += 1
+    _start_turn(game)
+
+
+def _after_action(game: Deity) -> None:
+    game.remove_character()  # Removes dead character
+    if _check_over(game):
+        return
+    if game.action_left <= 0:
+        _end_actions(game)
+
+
+def _action_options(game: Deity) -> List[Action]:
+    p = game.player_turn()
+    if game.moving is not None:
+        char = p.character[game.moving]
+        options = []
+        for coord in _step_options(game, char):
+            options.append(Step(char.id, coord))
+        options.append(StopMove(char.id))
+        return options
+
+    options = []
+    for char in p.can_move():
+        if can_act(char) and movement_allowance(game, char) > 0:
+            for coord in _step_options(game, char):
+                options.append(Step(char.id, coord))
+
+    for char in p.can_attack():
+        if not can_act(char) or char.has_status('disarmed'):
+            continue
+        for target in attack_targets(game, char):
+            options.append(Attack(char.id, target.id))
+
+    for char in p.can_spell():
+        if can_act(char):
+            options += char.faith_options(p, game, faith_discount(game, char))
+
+    options.append(Skip())
+    return options
+
+
+def _step_options(game: Deity, char: Character) -> List[Tuple]:
+    """
+    Return tiles char can step onto from where it stands
+    """
+    board = game.board
+    steps = []
+    for coord in board.adjacent_tiles(board.get_char_location(char)):
+        tile = board.get_tile(coord)
+        if tile.character is None and check_tile_char_valid(char, tile):
+            steps.append(coord)
+    return steps
+
+
+def _apply_step(game: Deity, action: Step) -> None:
+    p = game.player_turn()
+    char = p.character[action.char_id]
+    if game.moving is None:
+        game.moving = char.id
+        game.movement_left = movement_allowance(game, char)
+
+    terrain = game.board.get_terrain(action.coord)
+    game.board.move_character(char, action.coord)
+    if terrain == 'forest':
+        # Entering forest ends movement
+        game.movement_left = 0
+    else:
+        game.movement_left -= 1
+    char.trigger_passive('after_movement', p, game)
+    char.has_moved = True
+
+    if game.movement_left <= 0:
+        _finish_move(game)
+
+
+def _apply_stop_move(game: Deity, action: StopMove) -> None:
+    _finish_move(game)
+
+
+def _finish_move(game: Deity) -> None:
+    game.moving = None
+    game.movement_left = 0
+    game.action_left -= 1
+    _after_action(game)
+
+
+def _apply_attack(game: Deity, action: Attack) -> None:
+    p = game.player_turn()
+    opponent = game.opponent(p)
+    char = p.character[action.char_id]
+    char.attack(opponent.character[action.target_id], game, p)
+    game.action_left -= 1
+    _after_action(game)
+
+
+def _apply_faith(game: Deity, action: Faith) -> None:
+    p = game.player_turn()
+    char = p.character[action.char_id]
+    coord = game.board.get_char_location(char)
+    discount = faith_discount(game, char)
+
+    char.faith_ability(p, game, action, discount)
+    if discount:
+        game.board.change_to_road(coord)  # Water tile is consumed
+    char.has_spell = True
+    game.action_left -= 1
+    _after_action(game)
+
+
+def _apply_skip(game: Deity, action: Skip) -> None:
+    game.action_left = 0
+    _after_action(game)
+
+
+def _place_tile_options(game: Deity) -> List[Action]:
+    coords = game.board.legal_tile_placements()
+    options = []
+    seen = []
+    for index, tile in enumerate(game.drawn):
+        # Drawing the same tile twice gives the same choices
+        if tile in seen:
+            continue
+        seen.append(tile)
+        for terrain in dict.fromkeys([tile, 'empty']):
+            for coord in coords:
+                options.append(PlaceTile(index, terrain, coord))
+    return options
+
+
+def _apply_place_tile(game: Deity, action: PlaceTile) -> None:
+    game.board.add_terrain(action.coord, action.terrain)
+    game.drawn.pop(action.index)
+    _settle_tiles(game)
+
+
+def _check_over(game: Deity) -> bool:
+    """
+    End the game if a player has won, return True if the game is over
+    """
+    winner = game.check_win()
+    if winner is None:
+        return False
+    game.winner = winner
+    game.phase = 'over'
+    return True
+
+
+def _owner(game: Deity, char_id: int) -> Player:
+    if char_id in game.player1.character:
+        return game.player1
+    return game.player2
+
+
+_APPLY = {ChooseCharacter: _apply_choose, PlaceBase: _apply_base,
+          PlaceRoad: _apply_road, Spawn: _apply_spawn, Step: _apply_step,
+          StopMove: _apply_stop_move, Attack: _apply_attack,
+          Faith: _apply_faith, PlaceTile: _apply_place_tile,
+          Skip: _apply_skip}
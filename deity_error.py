@@ -92,3 +92,10 @@ class NotValidStatusEffect(Exception):
     def __str__(self):
         error = 'Not a valid status effect'
         return error
+
+
+class NotValidStorage(Exception):
+    def __str__(self):
+        error = "Board storage must be 'list' or 'numpy' " \
+                "(numpy storage needs NumPy installed)"
+        return error
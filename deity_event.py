@@ -0,0 +1,182 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Tuple, Union
+
+if TYPE_CHECKING:
+    from deity_character import Character
+    from deity_game import Player
+
+# Events describing what happened in a game. Rules emit events through the
+# game's EventBus instead of printing, the text of an event is only built
+# when a subscriber (e.g. the terminal) turns it into a string.
+
+# How status effects read in narration
+STATUS_TEXT = {'disarmed': 'is disarmed (cannot attack)',
+               'blinded': 'is blinded',
+               'mummified': 'is mummified (cannot make action)',
+               'slowed': 'has -1 movement',
+               'stun': 'is stunned (cannot make action)',
+               'grounded': 'is grounded (1 movement)',
+               'mobile': 'is mobile (can move on any terrain)',
+               'divine': 'is immune to faith attacks',
+               'vigor': 'has +1 movement'}
+
+
+class EventBus:
+    """
+    Passes events to subscribers. Without subscribers emit returns before
+    the event is even created.
+    """
+    subscribers: List[Callable]
+
+    def __init__(self):
+        self.subscribers = []
+
+    def subscribe(self, callback: Callable) -> None:
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable) -> None:
+        self.subscribers.remove(callback)
+
+    def emit(self, event_type: type, *args) -> None:
+        """
+        Create event_type(*args) and pass it to every subscriber
+        """
+        if not self.subscribers:
+            return
+        event = event_type(*args)
+        for callback in self.subscribers:
+            callback(event)
+
+
+class Attacked(NamedTuple):
+    attacker: Character
+    target: Character
+
+    def __str__(self):
+        return f'\n{self.attacker} attacked {self.target}'
+
+
+class Damaged(NamedTuple):
+    char: Character
+    amount: int
+    health: int
+
+    def __str__(self):
+        if self.health > 0:
+            return f'{self.char} took {self.amount} damage, ' \
+                   f'{self.health} health left'
+        return f'{self.char} took {self.amount} damage'
+
+
+class Retaliated(NamedTuple):
+    char: Character
+    attacker: Character
+    ability: str
+
+    def __str__(self):
+        return f'{self.char} uses {self.ability} and retaliated 1 ' \
+               f'damage to {self.attacker}'
+
+
+class Killed(NamedTuple):
+    char: Character
+
+    def __str__(self):
+        return f'{self.char} is killed!!!\n'
+
+
+class Healed(NamedTuple):
+    char: Character
+    health: int
+
+    def __str__(self):
+        return f'{self.char} is healed to {self.health}'
+
+
+class Revived(NamedTuple):
+    char: Character
+    mummy: bool = False
+
+    def __str__(self):
+        if self.mummy:
+            return f'{self.char} has been revived as a mummy!'
+        return f'{self.char} has been revived!'
+
+
+class StatusApplied(NamedTuple):
+    char: Character
+    effect: str
+    turns: Union[int, float]
+
+    def __str__(self):
+        text = f'{self.char} {STATUS_TEXT[self.effect]}'
+        if self.turns == float('inf'):
+            return text
+        return f'{text} for {self.turns} turn(s)'
+
+
+class StatusExpired(NamedTuple):
+    char: Character
+    effect: str
+
+    def __str__(self):
+        return f'{self.char} is no longer {self.effect}'
+
+
+class StatusCleansed(NamedTuple):
+    char: Character
+
+    def __str__(self):
+        return f'{self.char} has been cleansed of its status effect(s)'
+
+
+class FaithChanged(NamedTuple):
+    player: Player
+    amount: int
+    faith: int
+
+    def __str__(self):
+        if self.amount > 0:
+            return f'{self.player.name} gained {self.amount} faith ' \
+                   f'({self.faith} faith)'
+        return f'{self.player.name} has {self.faith} faith left'
+
+
+class DiceRolled(NamedTuple):
+    char: Character
+    roll: int
+
+    def __str__(self):
+        return f'{self.char} rolled a {self.roll}'
+
+
+class BoardFull(NamedTuple):
+    player: Player
+    faith: int
+
+    def __str__(self):
+        return f'The board is full, {self.player.name} has automatically ' \
+               f'picked up {self.faith} faith'
+
+
+class RagnarokStarted(NamedTuple):
+    def __str__(self):
+        return '\nRagnarok has started, the board will shrink ' \
+               'after each round!!!\n'
+
+
+class BoardShrunk(NamedTuple):
+    width: int
+    height: int
+
+    def __str__(self):
+        return 'The border has shrunk!!!'
+
+
+class Narration(NamedTuple):
+    """Ability flavour text, text is formatted with args"""
+    text: str
+    args: Tuple = ()
+
+    def __str__(self):
+        return self.text.format(*self.args)
@@ -1,15 +1,19 @@
 from deity_board import Board
-from deity_character import Character
+from deity_character import Character, PASSIVE_TRIGGERS
 from deity_error import *
 from deity_setting import *
 from deity_helper_function import *
+from deity_action import *
+from deity_event import *
+from deity_zobrist import zobrist_key, character_hash, game_hash
+from deity_engine import TURN_PHASES, legal_actions, apply, start_game, \
+    current_player, movement_allowance, reachable_tiles
 
-from typing import List, Tuple, Dict, Union, Callable
-from random import shuffle
+from typing import List, Tuple, Dict, Union
+from random import Random
 
 POSSIBLE_ACTION = {'move', 'spell', 'attack', 'info', 'skip'}
-PASSIVE_ABILITY_TRIGGER = ['start_turn', 'collect_faith', 'after_movement',
-                           'take_damage_attack', 'take_damage_spell', 'end_turn']
+PASSIVE_ABILITY_TRIGGER = PASSIVE_TRIGGERS
 
 
 class Player:
@@ -18,18 +22,135 @@ class Player:
     number: int
     faith: int
     tile_deck = list
+    events: EventBus
 
-    def __init__(self, name, number):
+    def __init__(self, name, number, events: EventBus = None,
+                 watcher: 'Deity' = None):
         self.name = name
         self.character = {}
         self.number = number
-        self.faith = 0
+        self._faith = 0
         self.tile_deck = []
         self.additional_action = {'add': 0, 'sub': 0}
+        self.events = events if events is not None else EventBus()
+        self.watcher = watcher  # Told about changes of faith and deities
+
+        # Deities as bitmasks (bit char.id), kept up to date through the
+        # watcher so live and ready deities are never searched for
+        self._all = 0
+        self._live = 0
+        self._moved = 0
+        self._attacked = 0
+        self._spelled = 0
+        self._passive = {trigger: 0 for trigger in PASSIVE_TRIGGERS}
+        self._lists = {}  # Mask -> deities in that mask, in id order
+
+    @property
+    def faith(self) -> int:
+        return self._faith
+
+    @faith.setter
+    def faith(self, faith: int) -> None:
+        old = self._faith
+        self._faith = faith
+        if self.watcher is not None:
+            self.watcher.on_faith(self, old, faith)
 
     def add_character(self, character: Character) -> None:
         if len(self.character) < MAX_CHARACTER:
             self.character[character.id] = character
+            self._all |= 1 << character.id
+            for trigger in type(character).passive_triggers:
+                self._passive[trigger] |= 1 << character.id
+            self._lists.clear()
+            self.update_character(character)
+            character.watcher = self.watcher
+            if self.watcher is not None:
+                self.watcher.on_character_added(character)
+
+    def clone(self, events: EventBus, watcher: 'Deity') -> 'Player':
+        """
+        Return a copy of the player with copies of its deities, faith, deck
+        and additional actions, reporting to events and watcher
+        """
+        new = Player(self.name, self.number, events, watcher)
+        new._faith = self._faith
+        new.tile_deck = list(self.tile_deck)
+        new.additional_action = dict(self.additional_action)
+        for char_id, char in self.character.items():
+            char = char.clone()
+            char.watcher = watcher
+            new.character[char_id] = char
+        new._all = self._all
+        new._live = self._live
+        new._moved = self._moved
+        new._attacked = self._attacked
+        new._spelled = self._spelled
+        new._passive = dict(self._passive)
+        return new
+
+    def discard_character(self, character: Character) -> None:
+        """
+        Take back add_character
+        """
+        del self.character[character.id]
+        bit = 1 << character.id
+        self._all &= ~bit
+        self._live &= ~bit
+        self._moved &= ~bit
+        self._attacked &= ~bit
+        self._spelled &= ~bit
+        for trigger in self._passive:
+            self._passive[trigger] &= ~bit
+        self._lists.clear()
+
+    def update_character(self, char: Character) -> None:
+        """
+        Bring the live and ready sets up to date with char, called when its
+        health crosses 0 or a has_moved/has_attack/has_spell flag changes
+        """
+        bit = 1 << char.id
+        if char.is_live():
+            self._live |= bit
+        else:
+            self._live &= ~bit
+        if char.has_moved:
+            self._moved |= bit
+        else:
+            self._moved &= ~bit
+        if char.has_attack:
+            self._attacked |= bit
+        else:
+            self._attacked &= ~bit
+        if char.has_spell:
+            self._spelled |= bit
+        else:
+            self._spelled &= ~bit
+
+    def passive_character(self, time: str) -> List[Character]:
+        """
+        Return live deities with a passive ability that triggers at time
+        """
+        return self._characters(self._live & self._passive[time])
+
+    def has_live_character(self, char: Character) -> bool:
+        return self._live >> char.id & 1 == 1
+
+    def _characters(self, mask: int) -> List[Character]:
+        """
+        Return the deities of the player in mask, in the order they were
+        added
+        """
+        chars = self._lists.get(mask)
+        if chars is None:
+            chars = tuple(char for char_id, char in self.character.items()
+                          if mask >> char_id & 1)
+            self._lists[mask] = chars
+        return list(chars)
+
+    def change_faith(self, amount: int) -> None:
+        self.faith += amount
+        self.events.emit(FaithChanged, self, amount, self.faith)
 
     def print(self) -> None:
         result = f'{self.name} (Faith: {self.faith})\n    '
@@ -41,39 +162,19 @@ class Player:
         print(result)
 
     def can_move(self):
-        char_move = []
-        for char in self.live_character():
-            if not char.has_moved:
-                char_move.append(char)
-        return char_move
+        return self._characters(self._live & ~self._moved)
 
     def can_attack(self):
-        char_attack = []
-        for char in self.live_character():
-            if not char.has_attack:
-                char_attack.append(char)
-        return char_attack
+        return self._characters(self._live & ~self._attacked)
 
     def can_spell(self):
-        char_spell = []
-        for char in self.live_character():
-            if not char.has_spell:
-                char_spell.append(char)
-        return char_spell
+        return self._characters(self._live & ~self._spelled)
 
     def live_character(self) -> List[Character]:
-        live = []
-        for i in self.character:
-            if self.character[i].is_live():
-                live.append(self.character[i])
-        return live
+        return self._characters(self._live)
 
     def dead_character(self) -> List[Character]:
-        dead = []
-        for i in self.character:
-            if not self.character[i].is_live():
-                dead.append(self.character[i])
-        return dead
+        return self._characters(self._all & ~self._live)
 
     def reset_character(self):
         for char in self.live_character():
@@ -83,10 +184,9 @@ class Player:
 
     def reduce_status_effect(self) -> None:
         for char in self.live_character():
-            for effect in char.get_status_effects():
-                if char.status_effect == 1:
-                    print(f'{char} is no longer {effect}')
-                char.status_effect[effect] -= 1
+            if char.status_effect.active:
+                for effect in char.status_effect.decay():
+                    self.events.emit(StatusExpired, char, effect)
 
     def get_additional_action(self) -> int:
         action = 0
@@ -100,20 +200,175 @@ class Player:
         return action
 
 class Deity:
-    def __init__(self):
-        self.turn = 0
+    def __init__(self, p1_name: str = None, p2_name: str = None,
+                 interactive: bool = True, seed: int = None):
+        self._turn = 0
         self.ragnarok = False
-        self.ragnarok_timer = None
+        self._ragnarok_timer = None
+        self.interactive = interactive
+
+        # Everything that happens in the game is emitted here, the terminal
+        # only subscribes when the game is interactive
+        self.events = EventBus()
+        if interactive:
+            self.events.subscribe(self._print_event)
+
+        # All randomness of the game (tile draws, dice) comes from here so a
+        # game can be replayed from its seed
+        self.seed = seed
+        self.random = Random(seed)
 
-        self.board = Board(BOARD_WIDTH, BOARD_HEIGHT)
+        # Frames of changes to take back, only recorded while exploring
+        # actions with deity_undo.make
+        self.undo_stack = []
+
+        self.board = Board(BOARD_WIDTH, BOARD_HEIGHT, BOARD_STORAGE)
 
         # Create Players
-        p1_name = input('Enter name of player 1: ')
-        self.player1 = Player(p1_name, 1)
-        self.player1.tile_deck = P1_TILE_DECK
-        p2_name = input('Enter name of player 2: ')
-        self.player2 = Player(p2_name, 2)
-        self.player2.tile_deck = P2_TILE_DECK
+        if p1_name is None:
+            p1_name = input('Enter name of player 1: ')
+        self.player1 = Player(p1_name, 1, self.events, self)
+        self.player1.tile_deck = list(P1_TILE_DECK)
+        if p2_name is None:
+            p2_name = input('Enter name of player 2: ')
+        self.player2 = Player(p2_name, 2, self.events, self)
+        self.player2.tile_deck = list(P2_TILE_DECK)
+
+        # State of the game between decisions (see deity_engine)
+        self.phase = 'choose_character'
+        self.setup_player = 1
+        self.action_left = 0
+        self.moving = None  # Id of character in the middle of moving
+        self.movement_left = 0
+        self.drawn = []  # Tiles drawn that still have to be placed
+        self.winner = None
+
+        # Result of check_win, only worked out again after a deity died or
+        # came back to life or a base tile was destroyed
+        self._win = None
+        self._win_changed = True
+
+        # Decides whether Isis takes damage for an adjacent deity when the
+        # game is not interactive, called with (isis, char)
+        self.mothers_love = None
+
+        # Zobrist hash of everything not on the board, see Deity.zobrist
+        self._zobrist = game_hash(self) ^ self.board.zobrist
+
+    def clone(self) -> 'Deity':
+        """
+        Return an independent copy of the game for rollouts and previews.
+        Only plain state is copied (tile arrays, deity stats, faith, decks,
+        random state), descriptions and other immutable data are shared.
+        The copy has no event subscribers and no undo frames.
+        """
+        new = object.__new__(Deity)
+        new.__dict__.update(self.__dict__)
+        new.events = EventBus()
+        new.random = Random()
+        new.random.setstate(self.random.getstate())
+        new.undo_stack = []
+        new.drawn = list(self.drawn)
+        new._win_changed = True
+
+        new.player1 = self.player1.clone(new.events, new)
+        new.player2 = self.player2.clone(new.events, new)
+        characters = {**new.player1.character, **new.player2.character}
+        for char in characters.values():
+            char.relink(characters)
+        new.board = self.board.clone(characters)
+        if self.winner is not None:
+            new.winner = new.player1 if self.winner is self.player1 \
+                else new.player2
+        return new
+
+    @property
+    def zobrist(self) -> int:
+        """
+        64-bit Zobrist hash of the game state (board, health, status
+        effects, faith, tile decks, turn and ragnarok timer), updated with
+        every change instead of recomputed
+        """
+        return self.board.zobrist ^ self._zobrist
+
+    @property
+    def turn(self) -> int:
+        return self._turn
+
+    @turn.setter
+    def turn(self, turn: int) -> None:
+        self._zobrist ^= zobrist_key('turn', self._turn) ^ \
+            zobrist_key('turn', turn)
+        self._turn = turn
+
+    @property
+    def ragnarok_timer(self) -> Union[int, None]:
+        return self._ragnarok_timer
+
+    @ragnarok_timer.setter
+    def ragnarok_timer(self, timer: Union[int, None]) -> None:
+        self._zobrist ^= zobrist_key('ragnarok', self._ragnarok_timer) ^ \
+            zobrist_key('ragnarok', timer)
+        self._ragnarok_timer = timer
+
+    def on_attribute(self, obj, name: str) -> None:
+        if hasattr(obj, name):
+            self._journal('attr', obj, name, getattr(obj, name))
+        else:
+            self._journal('new_attr', obj, name)
+
+    def on_health(self, char: Character, old: int, health: int) -> None:
+        self._zobrist ^= zobrist_key('health', char.id, old) ^ \
+            zobrist_key('health', char.id, health)
+        if (old > 0) != (health > 0):
+            self._win_changed = True
+            self._owner(char).update_character(char)
+
+    def on_turn_flag(self, char: Character) -> None:
+        self._owner(char).update_character(char)
+
+    def on_status(self, char: Character, effect: str, old, turns) -> None:
+        if old:
+            self._zobrist ^= zobrist_key('status', char.id, effect, old)
+        if turns:
+            self._zobrist ^= zobrist_key('status', char.id, effect, turns)
+        self._journal('status', char, effect, old)
+
+    def on_faith(self, p: Player, old: int, faith: int) -> None:
+        self._zobrist ^= zobrist_key('faith', p.number, old) ^ \
+            zobrist_key('faith', p.number, faith)
+        self._journal('attr', p, 'faith', old)
+
+    def on_character_added(self, char: Character) -> None:
+        self._zobrist ^= character_hash(char)
+        self._win_changed = True
+        owner = self.player1 if char.id in self.player1.character \
+            else self.player2
+        self._journal('add', owner, char)
+
+    def on_deck(self, p: Player, tile: str, old: int, count: int) -> None:
+        if old:
+            self._zobrist ^= zobrist_key('deck', p.number, tile, old)
+        if count:
+            self._zobrist ^= zobrist_key('deck', p.number, tile, count)
+
+    def on_tile(self, board: Board, coord: Tuple[int, int], terrain: int,
+                base: int, dead: int, faith: int) -> None:
+        self._journal('tile', board, coord, terrain, base, dead, faith)
+
+    def on_location(self, board: Board, char: Character,
+                    coord: Union[Tuple[int, int], None]) -> None:
+        self._journal('location', board, char, coord)
+
+    def on_board_shrunk(self, board: Board, snapshot: Tuple) -> None:
+        self._journal('shrink', board, snapshot)
+
+    def _journal(self, *change) -> None:
+        """
+        Record change in the frame of the action being made, if any
+        """
+        if self.undo_stack:
+            self.undo_stack[-1].changes.append(change)
 
     def play(self, test: bool = False):
         # Set up game
@@ -121,102 +376,77 @@ class Deity:
         # Spawn characters on base
         if not test:
             self.set_up()
+        if self.phase not in TURN_PHASES:
+            start_game(self)
+
+        turn = self.turn
+        while self.phase != 'over':
+            if self.turn != turn:
+                turn = self.turn
+                print('Next player turn')
 
-        while True:
             p = self.player_turn()
+            if self.phase == 'action':
+                self.take_action(p)
+            else:
+                self.place_tile(p)
 
-            # Start of turn mechanism
-            p.reset_character()
-            action_left = MOVES_PER_TURN + p.get_additional_action()
-            self.destroy_base(p)
-            self.passive('start_turn')
-            if self.check_win():
-                break
+        # End of game
+        print(f'{self.winner.name.upper()} IS THE WINNER')
 
-            # Player makes their actions
-            while action_left != 0:
-                self.print()
-                print(f'\n{p.name}: {action_left} action remaining')
-                while True:
-                    self.remove_character()  # Removes dead character
-                    action = input('Choose action (move, '
-                                   'attack, spell, info, skip): ')
-                    action = action.lower()
-                    # Check if possible action
-                    if action not in POSSIBLE_ACTION:
-                        print('Not possible action')
-                        continue
+    def take_action(self, p: Player) -> None:
+        self.print()
+        print(f'\n{p.name}: {self.action_left} action remaining')
+        while True:
+            action = input('Choose action (move, '
+                           'attack, spell, info, skip): ')
+            action = action.lower()
+            # Check if possible action
+            if action not in POSSIBLE_ACTION:
+                print('Not possible action')
+                continue
 
-                    # Move Character
-                    if action == 'move':
-                        try:
-                            self.move(p)
-                            action_left -= 1
-                            break
-                        except (NoCharacterToMove, ReturnError):
-                            continue
-
-                    # Attack using character
-                    elif action == 'attack':
-                        try:
-                            self.attack(p)
-                            action_left -= 1
-                            break
-                        except (NoCharacterToAttack, ReturnError):
-                            continue
-
-                    # Use faith ability
-                    elif action == 'spell':
-                        try:
-                            self.spell(p)
-                            action_left -= 1
-                            break
-                        except (NoCharacterToSpell, ReturnError):
-                            continue
-
-                    # Get info on character (Doesn't use an action)
-                    elif action == 'info':
-                        self.info()
-                        print(f'\n{p.name}: {action_left} action remaining')
-
-                    # Skip action (Will have no remaining action)
-                    elif action == 'skip':
-                        action_left = 0
-                        break
-
-                if self.check_win() is not None:
-                    break
+            try:
+                # Move Character
+                if action == 'move':
+                    self.move(p)
+
+                # Attack using character
+                elif action == 'attack':
+                    self.attack(p)
+
+                # Use faith ability
+                elif action == 'spell':
+                    self.spell(p)
+
+                # Get info on character (Doesn't use an action)
+                elif action == 'info':
+                    self.info()
+                    print(f'\n{p.name}: {self.action_left} action remaining')
+                    continue
 
-            if self.check_win() is not None:
+                # Skip action (Will have no remaining action)
+                elif action == 'skip':
+                    apply(self, Skip())
                 break
-
-            # End of turn mechanics
-            self.passive('end_turn')
-            self.place_tile(p)
-            self.add_faith(p)
-            p.reduce_status_effect()
-            self.shrink_board()  # Shrink board if ragnarok
-            self.start_ragnarok()  # Start ragnarok if board is full
-            self.turn += 1
-            print('Next player turn')
-
-        # End of game
-        print(f'{self.check_win().name.upper()} IS THE WINNER')
+            except (NoCharacterToMove, NoCharacterToAttack,
+                    NoCharacterToSpell, ReturnError):
+                continue
 
     def shrink_board(self):
         if self.ragnarok and self.board.height > 2 and self.board.width > 2:
             if self.ragnarok_timer == 0:
                 self.board.border_closing()
+                self._win_changed = True  # Bases on the border are gone
                 self.ragnarok_timer = 1
-                self.print()
-                print('The border has shrunk!!!')
+                self.events.emit(BoardShrunk, self.board.width,
+                                 self.board.height)
             else:
                 self.ragnarok_timer -= 1
 
     def start_ragnarok(self):
-        if self.board.check_full_board() and not self.ragnarok:
-            print('\nRagnarok has started, the board will shrink '
-                  'after each round!!!\n')
+        if self.board.is_full and not self.ragnarok:
+            self.events.emit(RagnarokStarted)
             self.ragnarok = True
             self.ragnarok_timer = 1
 
@@ -241,11 +471,11 @@ class Deity:
         char_spell = p.can_spell()
 
         if len(char_spell) == 0:
-            print('No deities can attack')
+            print('No deities can use their faith ability')
             raise NoCharacterToSpell
         self.print()
         while True:
-            # Ask which character used to attack
+            # Ask which character used to use faith ability
             print('\nDeities that can use their faith ability:')
             char_string = ' '
             for char in char_spell:
@@ -269,36 +499,40 @@ class Deity:
             if curr_char not in char_spell:
                 print('Not a valid deity, pick again')
                 continue
-            if 'stun' in curr_char.get_status_effects():
-                self.print()
-                print(f'\n{curr_char} is stun')
+            if not self._check_can_act(curr_char):
                 continue
-            if 'mummified' in curr_char.get_status_effects():
+
+            options = []
+            for action in legal_actions(self):
+                if isinstance(action, Faith) and action.char_id == curr_char.id:
+                    options.append(action)
+            if len(options) == 0:
                 self.print()
-                print(f'\n{curr_char} is mummified for '
-                      f'{curr_char.status_effect["mummified"]} turns')
+                print(f"\n{curr_char} can't use its faith ability right now "
+                      f"(Faith: {p.faith})")
                 continue
+            break
 
-            coord = self.board.get_char_location(curr_char)
-            tile = self.board.get_tile(coord)
-            opponent = self.opponent(p)
+        # Ask which ability and targets to use
+        while True:
+            print(curr_char.get_info())
+            option_message = 'Faith ability options:\n'
+            for i in range(len(options)):
+                option_message += f'  {i} - {self._faith_label(options[i])}\n'
+            print(option_message)
+
+            option_id = input('Pick an option (type number or cancel): ')
+            option_id = option_id.lower()
+            if option_id == 'cancel':
+                raise ReturnError
             try:
-                before_spell_char = opponent.live_character()
-                if curr_char.attribute == 'aquatic' and tile.terrain == 'water':
-                    curr_char.faith_ability(p, self, 1)  # 1 faith discount
-                    tile.terrain = 'empty'
-                else:
-                    curr_char.faith_ability(p, self)
-                curr_char.has_spell = True
-
-                # Prints deity which has been killed during
-                after_spell_char = opponent.live_character()
-                for live_char in before_spell_char:
-                    if live_char not in after_spell_char:
-                        print(f'{live_char} has been killed')
-                break
-            except (NotEnoughFaith, ReturnError, FaithAbilityError):
+                action = options[int(option_id)]
+            except (IndexError, ValueError):
+                print('Not valid option, please choose again')
                 continue
+            break
+
+        apply(self, action)
 
     def attack(self, p: Player):
         char_attack = p.can_attack()
@@ -324,7 +558,7 @@ class Deity:
             # Check if valid character input
             try:
                 curr_char = p.character[int(char_id)]
-                assert curr_char in p.live_character()
+                assert p.has_live_character(curr_char)
             except (KeyError, ValueError, AssertionError):
                 self.print()
                 print('Not a valid deity, pick again')
@@ -334,38 +568,22 @@ class Deity:
                 print('Not a valid deity, pick again')
                 continue
 
-            if 'disarm' in curr_char.get_status_effects():
+            if curr_char.has_status('disarmed'):
                 self.print()
                 print(f'{curr_char} is disarmed this turn')
                 continue
 
-            if 'stun' in curr_char.get_status_effects():
-                self.print()
-                print(f'\n{curr_char} is stun')
+            if not self._check_can_act(curr_char):
                 continue
 
-            if 'mummified' in curr_char.get_status_effects():
-                self.print()
-                print(f'\n{curr_char} is mummified for '
-                      f'{curr_char.status_effect["mummified"]} turns')
-                continue
-
-            # Get range and coordinates of character
-            p1_coord = self.board.get_char_location(curr_char)
-            range_ = curr_char.range
-            terrain = self.board.get_tile(p1_coord).terrain
-
-            if (terrain == 'fort' or terrain == 'base') and \
-                    curr_char.attribute != 'flight':
-                range_ += 1
-
             # Check if character is in range to attack other character
             opponent = self.opponent(p)
             opponent_in_range = []
-            for char in opponent.live_character():
-                p2_coord = self.board.get_char_location(char)
-                if distance(p1_coord, p2_coord) <= range_:
-                    opponent_in_range.append(char)
+            for action in legal_actions(self):
+                if isinstance(action, Attack) and \
+                        action.char_id == curr_char.id:
+                    opponent_in_range.append(
+                        opponent.character[action.target_id])
 
             if len(opponent_in_range) == 0:
                 self.print()
@@ -391,14 +609,14 @@ class Deity:
             try:
                 attack_id = int(attack_id)
                 opponent_char = opponent.character[attack_id]
-                assert opponent_char in opponent.live_character()
-            except (ValueError, IndexError, AssertionError):
+                assert opponent_char in opponent_in_range
+            except (ValueError, KeyError, AssertionError):
                 print('Not valid id, please type again')
                 continue
             break
 
         # Attack target
-        curr_char.attack(opponent_char, self, p)
+        apply(self, Attack(curr_char.id, opponent_char.id))
 
     def move(self, p: Player) -> None:
         char_move = p.can_move()
@@ -434,116 +652,76 @@ class Deity:
                 print('Not a valid deity, pick again')
                 continue
 
-            if 'stun' in curr_char.get_status_effects():
-                self.print()
-                print(f'\n{curr_char} is stun')
-                continue
-
-            if 'mummified' in curr_char.get_status_effects():
-                self.print()
-                print(f'\n{curr_char} is mummified for '
-                      f'{curr_char.status_effect["mummified"]} turns')
+            if not self._check_can_act(curr_char):
                 continue
             break
 
         self.print()
-        movement_left = curr_char.movement
-
-        char_coord = self.board.get_char_location(curr_char)
-        tile = self.board.get_tile(char_coord)
-        if curr_char.attribute == 'flight' and tile.terrain == 'cloud':
-            movement_left += 1
-
-        if 'vigor' in curr_char.get_status_effects():
+        effects = curr_char.get_status_effects()
+        if 'vigor' in effects:
             print(f'\n{curr_char} has +1 movement')
-            movement_left += 1
-        if 'slowed' in curr_char.get_status_effects():
+        if 'slowed' in effects:
             print(f'\n{curr_char} has -1 movement')
-            movement_left -= 1
-
-        if 'grounded' in curr_char.get_status_effects():
+        if 'grounded' in effects:
             print(f'\n{curr_char} is grounded')
-            movement_left = 1
+
         # Repeatedly ask player to move character based on character movement
-        while movement_left > 0:
-            # Get location of character and adjacent tiles
+        movement_left = movement_allowance(self, curr_char)
+        while True:
+            # Get location of character and tiles it can step on
             char_coord = self.board.get_char_location(curr_char)
             adjacent = self.board.adjacent_tiles(char_coord)
+            steps = []
+            for action in legal_actions(self):
+                if isinstance(action, Step) and action.char_id == curr_char.id:
+                    steps.append(action.coord)
             print(f'\n{curr_char} currently at {char_coord}')
-            while True:
+            reachable = [coord for coord, _ in
+                         reachable_tiles(self, curr_char)]
+
+            # Ask which tile to move to
+            print(f'Tiles to move: {steps}')
+            print(f'Tiles reachable this move: {reachable}')
+            move_to = input(f'{movement_left} moves left, '
+                            f'pick a tile to move to (skip to stop moving): ')
+            if move_to == 'skip':
+                if self.moving is None:
+                    # Deity has not moved, action is not used
+                    raise ReturnError
+                apply(self, StopMove(curr_char.id))
+                return
+            try:
+                move_to = turn_into_coordinate(move_to)
+            except (ValueError, IndexError):
+                print('Not valid move')
+                continue
 
-                # Ask which tile to move to
-                print(f'Tiles to move: {adjacent}')
-                move_to = input(f'{movement_left} moves left, '
-                                f'pick a tile to move to (skip to stop moving): ')
-                if move_to == 'skip':
-                    movement_left = 0
-                    break
-                try:
-                    move_to = turn_into_coordinate(move_to)
-                except ValueError:
-                    print('Not valid move')
+            # Check if chosen coord is a tile the character can move to
+            if move_to not in steps:
+                self._print_invalid_step(curr_char, move_to, adjacent)
+                continue
 
-                # Check if chosen coord is adjacent to character
-                if move_to not in adjacent:
-                    print('\nNot valid move')
+            tile_terrain = self.board.get_terrain(move_to)
+            if tile_terrain == 'forest' and movement_left != 1:
+                while True:
+                    confirm = input(
+                        f"\n{curr_char} is entering forest, it won't be "
+                        f"able to move anymore this turn, confirm movement "
+                        f"(y/n)?")
+                    confirm = confirm.lower()
+                    if confirm not in ['y', 'n']:
+                        print('Type "y" or "n" only')
+                        continue
+                    break
+                if confirm == 'n':
                     continue
 
-                # Check tile terrain and if character can move to it
-                tile_terrain = self.board.get_terrain(move_to)
-                if tile_terrain == 'cloud' and \
-                        curr_char.attribute != 'flight' and \
-                        'mobile' not in curr_char.get_status_effects():
-                    print(
-                        f"\n{curr_char} can't fly, only flying deity "
-                        f"can enter cloud tile")
-                    continue
-                elif tile_terrain == 'water' and \
-                        curr_char.attribute not in ['flight', 'aquatic'] and \
-                        'mobile' not in curr_char.get_status_effects():
-                    print(
-                        f"\n{curr_char} can't fly or swim, only "
-                        f"flying or swimming deity can "
-                        f"enter water tile")
-                    continue
-                elif tile_terrain == 'forest' and movement_left != 1:
-                    while True:
-                        confirm = input(
-                            f"\n{curr_char} is entering forest, it won't be "
-                            f"able to move anymore this turn, confirm movement "
-                            f"(y/n)?")
-                        confirm = confirm.lower()
-                        if confirm not in ['y', 'n']:
-                            print('Type "y" or "n" only')
-                            continue
-                        break
-                    if confirm == 'n':
-                        continue
-                    elif confirm == 'y':
-                        self.board.move_character(curr_char,
-                                                  move_to)
-                        movement_left = 0
-                        break
-                else:
-                    # Move the character to the coordinate
-                    try:
-                        self.board.move_character(curr_char,
-                                                  move_to)
-                        movement_left -= 1
-                        self.print()
-                        break
-                    except CharacterBlocking:
-                        print(
-                            f'\nNot valid move, another '
-                            f'deity already is on {move_to}')
-                        continue
-                    except NotValidMove:
-                        print('\nNot valid move')
-                        continue
-                break
-            curr_char.passive_ability('after_movement', self.player_turn(),
-                                      self)
-            curr_char.has_moved = True
+            # Move the character to the coordinate
+            apply(self, Step(curr_char.id, move_to))
+            if self.moving != curr_char.id:
+                return
+            movement_left = self.movement_left
+            self.print()
 
     def set_up(self) -> None:
         # Both player choose characters
@@ -574,7 +752,9 @@ class Deity:
                 p1_base = input(f'{self.player1.name} (P1) choose '
                                 f'base (separate x, y by comma): ')
                 p1_base = turn_into_coordinate(p1_base)
-                self.board.create_base_p1(p1_base)
+                if PlaceBase(p1_base) not in legal_actions(self):
+                    raise NotPossibleBase
+                apply(self, PlaceBase(p1_base))
                 break
             except IndexError:
                 print('Type two integers separated by comma (e.g 1, 7)')
@@ -593,7 +773,9 @@ class Deity:
                 p2_base = input(f'{self.player2.name} (P2) choose base '
                                 f'(separate x, y by comma): ')
                 p2_base = turn_into_coordinate(p2_base)
-                self.board.create_base_p2(p2_base)
+                if PlaceBase(p2_base) not in legal_actions(self):
+                    raise NotPossibleBase
+                apply(self, PlaceBase(p2_base))
                 break
             except IndexError:
                 print('Type two integers separated by comma (e.g 0, 5)')
@@ -615,16 +797,19 @@ class Deity:
                 road = road.replace(' ', '')
                 road = road.split(',')
                 if len(road) == 2:
-                    coord = (int(road[0]), int(road[1]))
-                    self.board.create_big_road(player.number, coord)
-                    break
+                    action = PlaceRoad((int(road[0]), int(road[1])))
                 elif len(road) == 4:
-                    coord1 = (int(road[0]), int(road[1]))
-                    coord2 = (int(road[2]), int(road[3]))
-                    self.board.create_big_road(player.number, coord1, coord2)
-                    break
+                    # Roads from two tiles are listed in sorted order
+                    coord1, coord2 = sorted([(int(road[0]), int(road[1])),
+                                             (int(road[2]), int(road[3]))])
+                    action = PlaceRoad(coord1, coord2)
                 else:
                     print('Type 2 or 4 int')
+                    continue
+                if action not in legal_actions(self):
+                    raise NotPossibleRoad
+                apply(self, action)
+                break
             except NotPossibleRoad:
                 print('\nInvalid road. Roads must be adjacent to base')
                 continue
@@ -633,39 +818,31 @@ class Deity:
                 continue
 
     def choose_character(self) -> None:
-        subclass_p1 = []
-        subclass_p2 = []
-        for class_ in Character.__subclasses__():
-            subclass_p1 += class_.__subclasses__()
-            subclass_p2 += class_.__subclasses__()
-
-        for i in range(MAX_CHARACTER):
-            p1_character, subclass_p1 = self._list_character_remaining(
-                subclass_p1,
-                self.player1)
-            self.player1.add_character(p1_character(i + 1))
-
-            p2_character, subclass_p2 = self._list_character_remaining(
-                subclass_p2,
-                self.player2)
-            self.player2.add_character(p2_character(i + 1 + MAX_CHARACTER))
+        while self.phase == 'choose_character':
+            p = current_player(self)
+            apply(self, self._list_character_remaining(legal_actions(self),
+                                                       p))
 
     def spawn_character(self, player: Player) -> None:
-        base_tiles_left = self.board.get_base_tile(player.number)
-        for char in player.character:
+        while self.phase == 'spawn' and current_player(self) is player:
+            spawns = legal_actions(self)
+            character = player.character[spawns[0].char_id]
+            base_tiles_left = [action.coord for action in spawns]
             while True:
                 try:
-                    character = player.character[char]
                     print(f'\nAvailable space at {player.name} '
                           f'base: {base_tiles_left}')
                     tile = input(f'{player.name} choose base tile '
                                  f'to spawn {character}: ')
                     tile = turn_into_coordinate(tile)
-                    self.board.spawn_character(character, tile, player.number)
-                    base_tiles_left.remove(tile)
+                    if tile not in self.board.get_base_tile(player.number):
+                        raise NotValidSpawn
+                    if tile not in base_tiles_left:
+                        raise TileAlreadyHaveCharacter
+                    apply(self, Spawn(character.id, tile))
                     self.board.print()
                     break
-                except NotValidSpawn:
+                except (IndexError, ValueError, NotValidSpawn):
                     print('Not valid spawn point, '
                           'Deity must spawn in your base')
                     continue
@@ -675,15 +852,31 @@ class Deity:
                     continue
 
     def check_win(self) -> Union[None, Player]:
-        if len(self.player1.live_character()) == 0 \
+        """
+        Return the player who has won (None if nobody has yet). The answer
+        is kept until a deity dies or comes back to life or a base tile is
+        destroyed, so calling this after every action is cheap.
+        """
+        if self._win_changed:
+            self._win = self._find_winner()
+            self._win_changed = False
+        return self._win
+
+    def _find_winner(self) -> Union[None, Player]:
+        if not self.player1.live_character() \
                 or self.board.check_dead_base(1) >= 3:
             return self.player2
-        elif len(self.player2.live_character()) == 0 \
+        elif not self.player2.live_character() \
                 or self.board.check_dead_base(2) >= 3:
             return self.player1
         else:
             return None
 
+    def _owner(self, char: Character) -> Player:
+        if char.id in self.player1.character:
+            return self.player1
+        return self.player2
+
     def player_turn(self) -> Player:
         if self.turn % 2 == 0:
             return self.player1
@@ -702,20 +895,27 @@ class Deity:
         for char in player.live_character():
             coord = self.board.get_char_location(char)
             if self.board.get_terrain(coord) == 'faith':
-                char.passive_ability('collect_faith', player, self)
+                char.trigger_passive('collect_faith', player, self)
                 faith += 1
                 self.board.change_to_road(coord)  # Remove faith tile
-        player.faith += faith
+        if faith > 0:
+            player.change_faith(faith)
 
     def print(self) -> None:
         self.board.print()
         self.player1.print()
         self.player2.print()
 
-    def place_tile(self, p: Player) -> None:
-        # Get player's tile deck and shuffle the deck
+    def draw_tiles(self, p: Player) -> List[str]:
+        """
+        Shuffle the tile deck of p and draw the tiles to place this turn
+
+        :param p: Player drawing tiles
+        :return: Tiles drawn (fewer when the deck runs out)
+        """
         deck = p.tile_deck
-        shuffle(deck)
+        self._journal('deck', p, list(deck))
+        self.random.shuffle(deck)
         drawn = []
 
         for i in range(NUM_TILE_PLACE):
@@ -723,23 +923,20 @@ class Deity:
                 drawn.append(deck.pop())
             except IndexError:
                 pass
+        for tile in set(drawn):
+            count = deck.count(tile)
+            self.on_deck(p, tile, count + drawn.count(tile), count)
+        return drawn
 
-        while len(drawn) > 0:
-            if self.board.check_full_board():
-                num_faith = drawn.count('faith')
-                print(f'The board is full, you have automatically '
-                      f'picked up {num_faith} faith')
-                p.faith += num_faith
-                break
+    def place_tile(self, p: Player) -> None:
+        while self.phase == 'place_tile' and self.player_turn() is p:
+            drawn = self.drawn
             tile_message = 'Tiles drawn:\n      '
             for i in range(len(drawn)):
                 tile_message += f'{i} - {drawn[i]}     '
             while True:
                 print(tile_message)
                 tile_id = input('Pick tile to place (choose id): ')
-                if tile_id == 'test':  # USED FOR TESTING (DELETE AFTER)
-                    drawn = []
-                    break
                 try:
                     tile_id = int(tile_id)
                 except ValueError:
@@ -749,16 +946,8 @@ class Deity:
                 if tile_id not in range(len(drawn)):
                     print('Not valid tile, please choose again')
                     continue
-                try:
-                    tile_id = int(tile_id)
-                except ValueError:
-                    print('Please type the tile id ')
-                    continue
-                break
-            if tile_id == 'test':  # USED FOR TESTING (DELETE AFTER)
                 break
             tile = drawn[tile_id]
-            drawn.pop(tile_id)
             while True:
                 tile_final = input(f'Play tile as empty or {tile} '
                                    f'(type empty or {tile}): ')
@@ -766,16 +955,14 @@ class Deity:
                     print('Not valid choice, please choose again')
                     continue
                 break
+
+            coords = self.board.legal_tile_placements()
             while True:
                 try:
                     self.print()
                     coord = input(f'Choose coordinate to place {tile_final} '
                                   '(must be adjacent to another tile): ')
                     coord = turn_into_coordinate(coord)
-                    if not self.board.valid_tile_placement(coord):
-                        print('Not valid tile placement, must be adjacent '
-                              'to an existing tile')
-                        continue
                 except IndexError:
                     print('Type two integers separated by comma (e.g 1, 7)')
                     continue
@@ -783,15 +970,45 @@ class Deity:
                     print('Please type integers only (e.g 1, 7)')
                     continue
 
-                try:
-                    self.board.add_terrain(coord, tile_final)
-                    self.print()
-                    break
-                except TilePlacementInvalid:
-                    print(f'Not valid tile placement, there is already '
-                          f'a tile at {coord}')
+                if coord not in coords:
+                    if self.board.possible_tile(coord) and \
+                            self.board.get_terrain(coord) is not None:
+                        print(f'Not valid tile placement, there is already '
+                              f'a tile at {coord}')
+                    else:
+                        print('Not valid tile placement, must be adjacent '
+                              'to an existing tile')
                     continue
 
+                apply(self, PlaceTile(tile_id, tile_final, coord))
+                self.print()
+                break
+
+    def choose_mothers_love(self, isis: Character, char: Character) -> bool:
+        """
+        Return True if isis (adjacent to char) takes the damage in place
+        of char. Asks the player when interactive, otherwise uses the
+        mothers_love policy (always True if there is none)
+        """
+        if not self.interactive:
+            if self.mothers_love is None:
+                return True
+            return self.mothers_love(isis, char)
+
+        print(f'{isis} is adjacent to {char}')
+        while True:
+            confirm = input(f'Do you want to use Isis passive, '
+                            f'Mother’s Love, to take damage damage '
+                            f'in place of {char} (y/n)? ')
+            try:
+                confirm = confirm.lower()
+                assert confirm in ['y', 'n']
+                break
+            except (ValueError, AssertionError):
+                print('Type y or n')
+                continue
+        return confirm == 'y'
+
     def opponent(self, p: Player) -> Player:
         if p.number == 1:
             return self.player2
@@ -804,39 +1021,47 @@ class Deity:
             coord = self.board.get_char_location(char)
             tile = self.board.get_tile(coord)
             if tile.player_base == opponent.number:
-                tile.dead_base = True
+                self.board.set_dead_base(coord)
+                self._win_changed = True
 
     def remove_character(self) -> None:
-        char_board = self.board.get_character_on_board()
-        for char in char_board:
-            if not char.is_live():
+        self.remove_dead(self.board.get_character_on_board())
+
+    def remove_dead(self, chars: List[Character]) -> None:
+        """
+        Remove the deities of chars that are dead and still on the board
+        """
+        for char in chars:
+            if not char.is_live() and \
+                    self.board.get_char_location(char) is not None:
                 self.board.remove_character(char)
+                self.events.emit(Killed, char)
 
     def passive(self, time: str):
         p = self.player_turn()
-        all_char = self.player1.live_character() + self.player2.live_character()
+        all_char = self.player1.passive_character(time) + \
+            self.player2.passive_character(time)
 
         for char in all_char:
-            if 'mummified' in char.get_status_effects():
+            if char.has_status('mummified'):
                 continue
             char.passive_ability(time, p, self)
 
     # HELPER FUNCTIONS
-    def _list_character_remaining(self, subclass: List[Character],
-                                  player: Player) -> \
-            Tuple[Callable, List[Character]]:
+    def _list_character_remaining(self, options: List[ChooseCharacter],
+                                  player: Player) -> ChooseCharacter:
         """
         Helper function for Deity.choose_character. Print remaining
-        subclasses (Deity) and prompt player to choose one of the characters.
-        Return character class chosen and the remaining subclasses
+        deities and prompt player to choose one of the characters.
+        Return the ChooseCharacter action chosen
 
-        :param subclass: Remaining subclass that the Player will choose from
-        :param player: Player choosing the subclass
-        :return: Character class chosen by player and remaining subclasses
+        :param options: ChooseCharacter actions player can take
+        :param player: Player choosing the deity
+        :return: ChooseCharacter action chosen by player
         """
         remaining_class = '\nAvailable Deities\n'
-        for id_ in range(len(subclass)):
-            remaining_class += f'{id_} -- {subclass[id_].__name__.replace("_", " ")}  \n'
+        for id_ in range(len(options)):
+            remaining_class += f'{id_} -- {options[id_].name.replace("_", " ")}  \n'
         print(remaining_class)
 
         current_char = ''
@@ -856,13 +1081,69 @@ class Deity:
             try:
                 char_index = int(input(f'{player.name} choose deity '
                                        f'(Type number): '))
-                character = subclass[char_index]
-                subclass.remove(subclass[char_index])
-                return character, subclass
+                return options[char_index]
             except (IndexError, ValueError):
                 print('Please choose a valid deity')
                 continue
 
+    def _check_can_act(self, char: Character) -> bool:
+        """
+        Helper function for Deity.move, attack and spell. Print why char
+        can't take an action if it is stun or mummified
+        """
+        if char.has_status('stun'):
+            self.print()
+            print(f'\n{char} is stun')
+            return False
+        if char.has_status('mummified'):
+            self.print()
+            print(f'\n{char} is mummified for '
+                  f'{char.status_effect["mummified"]} turns')
+            return False
+        return True
+
+    def _print_invalid_step(self, char: Character, coord: Tuple[int, int],
+                            adjacent: List[Tuple]) -> None:
+        """
+        Helper function for Deity.move. Print why char can't move to coord
+        """
+        if coord not in adjacent:
+            print('\nNot valid move')
+        elif self.board.get_tile(coord).character is not None:
+            print(f'\nNot valid move, another deity already is on {coord}')
+        elif self.board.get_terrain(coord) == 'cloud':
+            print(f"\n{char} can't fly, only flying deity "
+                  f"can enter cloud tile")
+        elif self.board.get_terrain(coord) == 'water':
+            print(f"\n{char} can't fly or swim, only flying or swimming "
+                  f"deity can enter water tile")
+        else:
+            print('\nNot valid move')
+
+    def _print_event(self, event) -> None:
+        """
+        Terminal subscriber of the game events
+        """
+        if isinstance(event, BoardShrunk):
+            self.print()
+        print(event)
+
+    def _faith_label(self, action: Faith) -> str:
+        """
+        Helper function for Deity.spell. Describe faith ability option
+        """
+        label = f'Faith ability {action.ability}'
+        if action.target is not None:
+            all_char = dict(self.player1.character)
+            all_char.update(self.player2.character)
+            target = all_char[action.target]
+            label += f' on {action.target} - {target}'
+        if action.coord is not None:
+            label += f' at {action.coord}'
+        if action.direction is not None:
+            label += f' towards {action.direction}'
+        return label
+
 
 if __name__ == "__main__":
     d = Deity()
@@ -877,11 +1158,11 @@ if __name__ == "__main__":
     d.board = b
     d.choose_character()
     d.print()
-    b.board[7][1].character = d.player1.character[1]
-    b.board[7][2].character = d.player1.character[2]
-    b.board[6][1].character = d.player1.character[3]
-    b.board[1][1].character = d.player2.character[4]
-    b.board[1][0].character = d.player2.character[5]
-    b.board[0][1].character = d.player2.character[6]
+    b.place_character(d.player1.character[1], (1, 7))
+    b.place_character(d.player1.character[2], (2, 7))
+    b.place_character(d.player1.character[3], (1, 6))
+    b.place_character(d.player2.character[4], (1, 1))
+    b.place_character(d.player2.character[5], (0, 1))
+    b.place_character(d.player2.character[6], (1, 0))
 
     d.play(True)
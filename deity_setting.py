@@ -5,6 +5,9 @@ MAX_CHARACTER = 3
 BOARD_HEIGHT = 8
 BOARD_WIDTH = 8
 
+# Storage for board tiles ('list' or 'numpy', numpy needs NumPy installed)
+BOARD_STORAGE = 'list'
+
 # Number of actions (move, attack, spell) each player has per turn
 MOVES_PER_TURN = 2
 
@@ -31,3 +34,8 @@ P2_TILE_DECK = (['fort'] * NUM_FORT_2) + (['water'] * NUM_WATER_2) + \
             (['cloud'] * NUM_CLOUD_2) + (['forest'] * NUM_FOREST_2) + \
             (['faith'] * NUM_FAITH_2)
 
+# Turns after which a simulated game is stopped and counted as a draw
+SIMULATION_MAX_TURN = 300
+
+# Most games a simulator worker plays before reporting back
+SIMULATION_BATCH = 50
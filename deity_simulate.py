@@ -0,0 +1,175 @@
+from __future__ import annotations
+import time
+from collections import Counter
+from multiprocessing import Pool
+from random import Random
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+from deity_action import *
+from deity_engine import Action, new_game, legal_actions, apply, \
+    current_player
+from deity_setting import *
+from deity_helper_function import derive_seed
+
+if TYPE_CHECKING:
+    from deity_game import Deity
+
+# Self-play simulator. Plays complete games between agents without any
+# terminal input, spread over a process pool, e.g.
+#     python deity.py --simulate 1000 --workers 4
+
+
+# === AGENTS ===
+class Agent:
+    """
+    Picks actions for one player. Subclasses override choose and are
+    registered in AGENTS so they can be picked by name.
+    """
+    def __init__(self, seed: Union[int, None] = None):
+        self.random = Random(seed)
+
+    def seed(self, seed: Union[int, None]) -> None:
+        self.random.seed(seed)
+
+    def choose(self, game: Deity, actions: List[Action]) -> Action:
+        raise NotImplementedError
+
+
+class RandomAgent(Agent):
+    """Picks uniformly from the legal actions"""
+    def choose(self, game: Deity, actions: List[Action]) -> Action:
+        return self.random.choice(actions)
+
+
+class AggressiveAgent(Agent):
+    """Attacks and uses faith abilities whenever it can, otherwise moves
+    at random and only skips when there is nothing else to do"""
+    def choose(self, game: Deity, actions: List[Action]) -> Action:
+        attacks = [a for a in actions if isinstance(a, (Attack, Faith))]
+        if attacks:
+            return self.random.choice(attacks)
+        others = [a for a in actions if not isinstance(a, Skip)]
+        if others:
+            return self.random.choice(others)
+        return actions[0]
+
+
+AGENTS = {'random': RandomAgent, 'aggressive': AggressiveAgent}
+
+
+# === GAMES ===
+def play_game(agent1: Agent, agent2: Agent,
+              max_turn: int = SIMULATION_MAX_TURN,
+              seed: Union[int, None] = None) -> Tuple[int, int, int]:
+    """
+    Play a full game between agent1 (player 1) and agent2 (player 2). Games
+    played with the same agents and seed are identical.
+
+    :param agent1: Agent playing as player 1
+    :param agent2: Agent playing as player 2
+    :param max_turn: Turns after which the game is stopped as a draw
+    :param seed: Seed of the game, the agents are reseeded from it
+    :return: (winner number or 0 for a draw, turns played, actions taken)
+    """
+    game = new_game(seed=seed)
+    if seed is not None:
+        agent1.seed(derive_seed(seed, 1))
+        agent2.seed(derive_seed(seed, 2))
+    agents = {1: agent1, 2: agent2}
+    num_action = 0
+    while game.phase != 'over' and game.turn < max_turn:
+        agent = agents[current_player(game).number]
+        apply(game, agent.choose(game, legal_actions(game)))
+        num_action += 1
+
+    winner = game.winner.number if game.winner is not None else 0
+    return winner, game.turn, num_action
+
+
+def game_seed(seed: int, game_number: int) -> int:
+    """
+    Return the seed of game number game_number of a simulation run with
+    seed, pass it to play_game to replay that game
+    """
+    return derive_seed(seed, game_number)
+
+
+def _play_batch(args: Tuple[str, str, int, int, int, int]) -> \
+        Tuple[Counter, int, int]:
+    """
+    Play a batch of games in a worker process, return the outcomes counted
+    by winner number with the total turns and actions
+    """
+    agent1, agent2, first_game, num_game, max_turn, seed = args
+    a1 = AGENTS[agent1]()
+    a2 = AGENTS[agent2]()
+    outcomes = Counter()
+    total_turn = 0
+    total_action = 0
+    for i in range(first_game, first_game + num_game):
+        winner, turns, actions = play_game(a1, a2, max_turn,
+                                           game_seed(seed, i))
+        outcomes[winner] += 1
+        total_turn += turns
+        total_action += actions
+    return outcomes, total_turn, total_action
+
+
+def simulate(num_game: int, workers: int = 1, agent1: str = 'random',
+             agent2: str = 'random', max_turn: int = SIMULATION_MAX_TURN,
+             seed: int = 0) -> Dict:
+    """
+    Play num_game games between agent1 and agent2 over workers processes
+
+    :param num_game: Number of games to play
+    :param workers: Number of worker processes
+    :param agent1: Name (in AGENTS) of the agent playing player 1
+    :param agent2: Name (in AGENTS) of the agent playing player 2
+    :param max_turn: Turns after which a game is stopped as a draw
+    :param seed: Seed the seed of every game is derived from (game_seed)
+    :return: Outcomes and throughput of the simulation
+    """
+    # Split the games into batches so each worker gets several of them
+    batch_size = max(1, min(SIMULATION_BATCH, num_game // (workers * 4)))
+    batches = []
+    for start in range(0, num_game, batch_size):
+        size = min(batch_size, num_game - start)
+        batches.append((agent1, agent2, start, size, max_turn, seed))
+
+    outcomes = Counter()
+    total_turn = 0
+    total_action = 0
+    start_time = time.perf_counter()
+    if workers == 1:
+        results = [_play_batch(batch) for batch in batches]
+    else:
+        with Pool(workers) as pool:
+            results = pool.imap_unordered(_play_batch, batches)
+            results = list(results)
+    elapsed = time.perf_counter() - start_time
+
+    for batch_outcomes, turns, actions in results:
+        outcomes += batch_outcomes
+        total_turn += turns
+        total_action += actions
+
+    return {'games': num_game, 'p1_wins': outcomes[1],
+            'p2_wins': outcomes[2], 'draws': outcomes[0],
+            'turns': total_turn, 'actions': total_action,
+            'max_turn': max_turn, 'seconds': elapsed}
+
+
+def print_report(result: Dict, agent1: str, agent2: str) -> None:
+    games = result['games']
+    seconds = max(result['seconds'], 1e-9)
+    per_game = max(games, 1)  # Averages of no games read as 0
+    print(f'{games} games ({agent1} vs {agent2}) in {seconds:.2f}s')
+    print(f'    {games / seconds:.1f} games/sec, '
+          f'{result["actions"] / seconds:.1f} actions/sec')
+    print(f'    Player 1 wins: {result["p1_wins"]} '
+          f'({100 * result["p1_wins"] / per_game:.1f}%)')
+    print(f'    Player 2 wins: {result["p2_wins"]} '
+          f'({100 * result["p2_wins"] / per_game:.1f}%)')
+    print(f'    Draws (over {result["max_turn"]} turns): {result["draws"]} '
+          f'({100 * result["draws"] / per_game:.1f}%)')
+    print(f'    Average length: {result["turns"] / per_game:.1f} turns, '
+          f'{result["actions"] / per_game:.1f} actions')
@@ -0,0 +1,122 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, Tuple
+from deity_board import TERRAIN_TYPES
+from deity_engine import attack_range, movement_allowance, reachable_tiles
+
+if TYPE_CHECKING:
+    from deity_character import Character
+    from deity_game import Deity, Player
+
+# Threat map: for every tile, which deities of a player could attack it
+# with one move followed by an attack. The reach of a deity (tiles it can
+# end its move on, each widened by its attack range from there) is kept
+# as a bitboard. The reaches are brought up to date once per game state
+# (its zobrist hash plus the range and movement stats it doesn't cover),
+# and then only for deities whose inputs changed: where it stands, its
+# movement, range, attribute or status effects, or the terrain and
+# deities on the tiles it could walk over. Queries between two changes
+# of the game are bit tests.
+
+
+class ThreatMap:
+    """
+    Tiles the live deities of player can attack next turn (move then
+    attack), with the status effects, range and terrain they have now.
+    Whether a deity is allowed to act next turn is not considered.
+
+    === Public Attribute ===
+    game: Game the threats are looked up in
+    player: Player whose deities are the threats
+    """
+    game: Deity
+    player: Player
+
+    def __init__(self, game: Deity, player: Player) -> None:
+        self.game = game
+        self.player = player
+        # Character id -> (key the reach was computed for, reach bits)
+        self._reach = {}
+        # Game state the reaches below are for, and (deity, reach bits) of
+        # every live deity of player in that state
+        self._state = None
+        self._reaches = []
+
+    def reach_bits(self, char: Character) -> int:
+        """
+        Return bitboard of the tiles char can attack after moving
+        """
+        board = self.game.board
+        coord = board.get_char_location(char)
+        if coord is None:
+            return 0
+        key = self._key(char, coord)
+        cached = self._reach.get(char.id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        movement = key[1]
+        reach = board.diamond_bits(coord, attack_range(self.game, char))
+        for end, _ in reachable_tiles(self.game, char, movement):
+            reach |= board.diamond_bits(end,
+                                        attack_range(self.game, char, end))
+        self._reach[char.id] = (key, reach)
+        return reach
+
+    def threats(self, coord: Tuple[int, int]) -> List[Character]:
+        """
+        Return the deities that can attack the tile at coord next turn
+        """
+        bit = self.game.board.coord_bit(coord)
+        return [char for char, reach in self._current() if reach & bit]
+
+    def count(self, coord: Tuple[int, int]) -> int:
+        """
+        Return how many deities can attack the tile at coord next turn
+        """
+        bit = self.game.board.coord_bit(coord)
+        return sum(1 for _, reach in self._current() if reach & bit)
+
+    def counts(self) -> List[List[int]]:
+        """
+        Return the number of deities that can attack each tile, indexed
+        [y][x] like Board.board (e.g. for a danger overlay)
+        """
+        width = self.game.board.width
+        flat = [0] * (width * self.game.board.height)
+        for _, reach in self._current():
+            while reach:
+                low = reach & -reach
+                flat[low.bit_length() - 1] += 1
+                reach ^= low
+        return [flat[y:y + width] for y in range(0, len(flat), width)]
+
+    def _current(self) -> List[Tuple[Character, int]]:
+        """
+        Return (deity, reach bits) of the live deities of player, brought
+        up to date if the game changed since the last query
+        """
+        chars = self.player.live_character()
+        state = (self.game.zobrist, self.game.board.width,
+                 tuple((char.id, char.range, char.movement)
+                       for char in chars))
+        if state != self._state:
+            self._reaches = [(char, self.reach_bits(char))
+                             for char in chars]
+            self._state = state
+        return self._reaches
+
+    def _key(self, char: Character, coord: Tuple[int, int]) -> Tuple:
+        """
+        Return everything the reach of char standing on coord depends on.
+        The walk of a deity never leaves the diamond of its movement, so
+        only the board inside that diamond is part of the key.
+        """
+        game = self.game
+        board = game.board
+        movement = movement_allowance(game, char)
+        area = board.diamond_bits(coord, max(movement, 0))
+        return (coord, movement, char.range, char.attribute,
+                char.status_effect.active, board.width,
+                tuple(board.terrain_bits([terrain]) & area
+                      for terrain in TERRAIN_TYPES),
+                board.occupied_bits & area)
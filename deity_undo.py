@@ -0,0 +1,118 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, NamedTuple, Tuple
+from deity_engine import Action, apply
+
+if TYPE_CHECKING:
+    from deity_game import Deity
+
+# Make/unmake for exploring the game tree in place. make applies an action
+# and records what it changed as small deltas (old terrain of a tile, old
+# position of a deity, old health, status counter, faith, tile deck, the
+# board before it shrank, ...), unmake puts the deltas back in reverse, so
+# a search can try an action and take it back without copying the game, e.g.
+#     for action in legal_actions(game):
+#         make(game, action)
+#         score = evaluate(game)
+#         unmake(game)
+
+
+class Frame(NamedTuple):
+    """Everything needed to take back one action"""
+    state: Tuple  # Game fields saved whole, see _save
+    changes: List[Tuple]  # Deltas in the order they were made
+
+
+def make(game: Deity, action: Action) -> None:
+    """
+    Apply action to game so that unmake(game) can take it back. Frames
+    nest, every make has to be matched by an unmake.
+    """
+    if not game.undo_stack:
+        game.board.watcher = game
+    game.undo_stack.append(Frame(_save(game), []))
+    try:
+        apply(game, action)
+    except Exception:
+        unmake(game)
+        raise
+
+
+def unmake(game: Deity) -> None:
+    """
+    Take back the last action applied with make
+    """
+    frame = game.undo_stack.pop()
+    stack = game.undo_stack
+    game.undo_stack = []  # Nothing done while undoing is recorded
+    try:
+        for change in reversed(frame.changes):
+            _UNDO[change[0]](*change[1:])
+        _restore(game, frame.state)
+    finally:
+        game.undo_stack = stack
+    if not stack:
+        game.board.watcher = None
+
+
+def _save(game: Deity) -> Tuple:
+    """
+    Return the game fields that are cheaper to save whole than to record
+    each change of
+    """
+    return (game.phase, game.setup_player, game.action_left, game.moving,
+            game.movement_left, list(game.drawn), game.winner, game._turn,
+            game.ragnarok, game._ragnarok_timer, game._zobrist,
+            game.random.getstate(),
+            dict(game.player1.additional_action),
+            dict(game.player2.additional_action))
+
+
+def _restore(game: Deity, state: Tuple) -> None:
+    (game.phase, game.setup_player, game.action_left, game.moving,
+     game.movement_left, game.drawn, game.winner, game._turn,
+     game.ragnarok, game._ragnarok_timer, game._zobrist, random_state,
+     add1, add2) = state
+    game.random.setstate(random_state)
+    game._win_changed = True
+    game.player1.additional_action = add1
+    game.player2.additional_action = add2
+
+
+# === UNDOING CHANGES ===
+# One function per kind of change, called with the rest of the change tuple
+def _undo_attribute(obj, name: str, old) -> None:
+    setattr(obj, name, old)
+
+
+def _undo_new_attribute(obj, name: str) -> None:
+    delattr(obj, name)
+
+
+def _undo_status(char, effect: str, old) -> None:
+    char.status_effect[effect] = old
+
+
+def _undo_character_added(p, char) -> None:
+    p.discard_character(char)
+
+
+def _undo_deck(p, deck: List[str]) -> None:
+    p.tile_deck[:] = deck
+
+
+def _undo_tile(board, coord, terrain, base, dead, faith) -> None:
+    board.restore_tile(coord, terrain, base, dead, faith)
+
+
+def _undo_location(board, char, coord) -> None:
+    board.restore_location(char, coord)
+
+
+def _undo_shrink(board, snapshot) -> None:
+    board.restore_snapshot(snapshot)
+
+
+_UNDO = {'attr': _undo_attribute, 'new_attr': _undo_new_attribute,
+         'status': _undo_status, 'add': _undo_character_added,
+         'deck': _undo_deck, 'tile': _undo_tile,
+         'location': _undo_location, 'shrink': _undo_shrink}
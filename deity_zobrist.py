@@ -0,0 +1,102 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Tuple
+from deity_helper_function import derive_seed
+
+if TYPE_CHECKING:
+    from deity_game import Deity
+
+# Zobrist hashing of game states. Every feature of a state (a terrain on a
+# tile, a deity on a tile, a deity's health, a status counter, a player's
+# faith, ...) has a random 64-bit key and the hash of a state is the XOR of
+# the keys of its features, so changing one feature updates the hash with
+# two XORs. Keys are derived from the feature itself, so they are the same
+# in every game, run and process.
+
+ZOBRIST_SEED = 0x5EED
+
+_KEYS: Dict[Tuple, int] = {}
+
+
+def zobrist_key(*feature) -> int:
+    """
+    Return the 64-bit key of feature, e.g. zobrist_key('health', 3, 2) for
+    deity 3 having 2 health
+
+    >>> zobrist_key('health', 3, 2) == zobrist_key('health', 3, 2)
+    True
+    >>> zobrist_key('health', 3, 2) == zobrist_key('health', 3, 1)
+    False
+    """
+    key = _KEYS.get(feature)
+    if key is None:
+        key = derive_seed(ZOBRIST_SEED, *feature)
+        _KEYS[feature] = key
+    return key
+
+
+def board_hash(board) -> int:
+    """
+    Return the hash of board (terrain, bases, dead bases and deity
+    positions) computed from scratch
+    """
+    result = 0
+    for y in range(board.height):
+        for x in range(board.width):
+            result ^= board_tile_hash(board, x, y)
+    return result
+
+
+def board_tile_hash(board, x: int, y: int) -> int:
+    """
+    Return the XOR of the keys of everything on tile (x, y) of board
+    """
+    i = y * board.width + x
+    result = 0
+    if board._terrain[i]:
+        result ^= zobrist_key('terrain', x, y, int(board._terrain[i]))
+    if board._player_base[i]:
+        result ^= zobrist_key('base', x, y, int(board._player_base[i]))
+    if board._dead_base[i]:
+        result ^= zobrist_key('dead', x, y)
+    if board._occupant[i]:
+        result ^= zobrist_key('char', int(board._occupant[i]), x, y)
+    return result
+
+
+def character_hash(char) -> int:
+    """
+    Return the XOR of the keys of char's health and status counters
+    """
+    result = zobrist_key('health', char.id, char.health)
+    for effect, value in char.status_effect.items():
+        if value:
+            result ^= zobrist_key('status', char.id, effect, value)
+    return result
+
+
+def deck_hash(player) -> int:
+    """
+    Return the XOR of the keys of how many of each tile is left in the
+    deck of player
+    """
+    result = 0
+    for tile in set(player.tile_deck):
+        result ^= zobrist_key('deck', player.number, tile,
+                              player.tile_deck.count(tile))
+    return result
+
+
+def game_hash(game: Deity) -> int:
+    """
+    Return the hash of game computed from scratch, Deity.zobrist keeps the
+    same value up to date as the game changes
+    """
+    result = board_hash(game.board)
+    for p in [game.player1, game.player2]:
+        result ^= zobrist_key('faith', p.number, p.faith)
+        result ^= deck_hash(p)
+        for char in p.character.values():
+            result ^= character_hash(char)
+    result ^= zobrist_key('turn', game.turn)
+    result ^= zobrist_key('ragnarok', game.ragnarok_timer)
+    return result